@@ -1,8 +1,24 @@
 from django.contrib import admin
-from .models import Project, UserProfile, SavingsTransaction, Investment
+from .models import Project, UserProfile, SavingsTransaction, SavingsMemberState, Investment, WSC_TARGET_AMOUNT
 from .models import Club, UserProfile, ClubMembership, ClubTransaction, ClubFixedSavings, ClubEvent, IndividualUserFixedSavings, GoatFarmingPackage
 from .models import GoatFarmingInvestment, Goat, GoatHealthRecord, GoatOffspring, GoatFarmingTransaction, ManagementFeeTier, GoatFarmingNotification
-from django.db import models
+from .exports import stream_csv
+from .forms import GoatImportForm
+from .imports import GoatImport
+from .interest import credit_accrued_interest
+from django.db import DatabaseError, models, transaction
+from django.core.cache import cache
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.widgets import AutocompleteSelect
+from django.core.exceptions import PermissionDenied
+from django.contrib import messages
+from django.core.paginator import Paginator
+from django.forms.models import BaseInlineFormSet
+from django.template.response import TemplateResponse
+from django.urls import path
+from django.utils import timezone
+from datetime import datetime, timedelta
+import io
 
 
 @admin.register(UserProfile)
@@ -14,6 +30,22 @@ class UserProfileAdmin(admin.ModelAdmin):
 
 
 
+class CoveredWeekFilter(admin.SimpleListFilter):
+    """Filter on a covered_weeks_mask column with a bitwise test in SQL"""
+    title = 'covered week'
+    parameter_name = 'covered_week'
+
+    def lookups(self, request, model_admin):
+        return [(str(week), f"Week {week}") for week in range(1, 53)]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            if self.value() not in {week for week, label in self.lookup_choices}:
+                raise IncorrectLookupParameters(f"covered_week must be a week from 1 to 52, got {self.value()!r}")
+            return queryset.covering_week(int(self.value()))
+        return queryset
+
+
 class SavingsTransactionInline(admin.TabularInline):
     model = SavingsTransaction
     extra = 0
@@ -46,7 +78,7 @@ class SavingsTransactionAdmin(admin.ModelAdmin):
     list_display = ('user_profile', 'formatted_amount', 'receipt_number', 'formatted_weeks', 
                    'formatted_next_week', 'formatted_balance', 'date_saved')
     
-    list_filter = ('date_saved', 'user_profile__user__is_active')
+    list_filter = ('date_saved', 'user_profile__user__is_active', CoveredWeekFilter)
     
     search_fields = (
     'user_profile__user__username',
@@ -93,47 +125,204 @@ class SavingsTransactionAdmin(admin.ModelAdmin):
     )
 
     def save_model(self, request, obj, form, change):
-        # Always recalculate everything from scratch
-        from .models import SavingsTransaction
-        from .views import evaluate_deposit, get_weekly_targets
-
-        # Recalculate all transactions in ascending order by date_saved
-        previous_transactions = SavingsTransaction.objects.filter(
-            user_profile=obj.user_profile
-        ).exclude(pk=obj.pk).order_by('date_saved')
-
-
-        cumulative_total = 0
-        carry_forward = 0
-        current_week = 1
-
-        # Recalculate all prior transactions first
-        for txn in previous_transactions:
-            result = evaluate_deposit(txn.amount, current_week, carry_forward)
-            cumulative_total += txn.amount
-            txn.fully_covered_weeks = result['fully_covered_weeks']
-            txn.next_week = result['next_week']
-            txn.remaining_balance = result['remaining_balance']
-            txn.cumulative_total = cumulative_total
-            carry_forward = float(txn.remaining_balance)
-            current_week = result['next_week']
-            txn.save()
-
-        # Now calculate for the current (new or edited) transaction
-        result = evaluate_deposit(obj.amount, current_week, carry_forward)
-        cumulative_total += obj.amount
-        obj.fully_covered_weeks = result['fully_covered_weeks']
-        obj.next_week = result['next_week']
-        obj.remaining_balance = result['remaining_balance']
-        obj.cumulative_total = cumulative_total
+        from .views import replay_savings_ledger
+
+        # Only the edited transaction and the ones after it can change, so the
+        # replay starts there, seeded from the stored state of the row before it
+        original = None
+        if change:
+            original = SavingsTransaction.objects.filter(pk=obj.pk).values(
+                'user_profile_id', 'date_saved'
+            ).first()
+
+        start_from = obj.date_saved
+        if original and original['user_profile_id'] == obj.user_profile_id:
+            start_from = min(start_from, original['date_saved'])
+
+        with transaction.atomic():
+            replay_savings_ledger(obj.user_profile_id, start_from, pending=[obj])
+            super().save_model(request, obj, form, change)
+            SavingsMemberState.refresh_for(obj.user_profile_id)
+
+            # A transaction moved to another member leaves a gap in the old ledger
+            if original and original['user_profile_id'] != obj.user_profile_id:
+                replay_savings_ledger(original['user_profile_id'], original['date_saved'], exclude_pks=[obj.pk])
+                SavingsMemberState.refresh_for(original['user_profile_id'])
+
+
+@admin.register(SavingsMemberState)
+class SavingsMemberStateAdmin(admin.ModelAdmin):
+    list_display = ('user_profile', 'cumulative_total', 'next_week', 'remaining_balance',
+                    'transaction_count', 'last_saved_at', 'updated_at')
+    list_filter = (CoveredWeekFilter,)
+    search_fields = (
+        'user_profile__user__username',
+        'user_profile__full_name',
+        'user_profile__account_number',
+    )
+    readonly_fields = ('user_profile', 'cumulative_total', 'next_week', 'remaining_balance',
+                       'transaction_count', 'last_saved_at', 'updated_at')
+
+    change_list_template = 'admin/mcs/savingsmemberstate/change_list.html'
+
+    # Programme-wide figures are cheap enough to recompute every few minutes, not per request
+    LEADERBOARD_CACHE_KEY = 'mcs:52wsc-leaderboard-analytics'
+    LEADERBOARD_CACHE_SECONDS = 300
+    LEADERBOARD_PAGE_SIZE = 50
+
+    # Rows are maintained from the ledger; use rebuild_52wsc_state to repopulate them
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def get_urls(self):
+        return [
+            path(
+                'leaderboard/',
+                self.admin_site.admin_view(self.leaderboard_view),
+                name='mcs_savingsmemberstate_leaderboard',
+            ),
+        ] + super().get_urls()
+
+    def leaderboard_analytics(self):
+        def compute():
+            states = SavingsMemberState.objects.all()
+            return {
+                'bands': states.percentile_bands(),
+                'cohorts': list(states.cohorts()),
+                'totals': states.aggregate(
+                    members=models.Count('pk'),
+                    total_saved=models.Sum('cumulative_total'),
+                    completed=models.Count('pk', filter=models.Q(next_week__gt=52)),
+                ),
+                'computed_at': timezone.now(),
+            }
+        return cache.get_or_set(self.LEADERBOARD_CACHE_KEY, compute, self.LEADERBOARD_CACHE_SECONDS)
+
+    def leaderboard_view(self, request):
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+
+        states = SavingsMemberState.objects.all()
+        cohort = request.GET.get('cohort')
+        if cohort:
+            try:
+                start = timezone.make_aware(datetime.strptime(cohort, '%Y-%m'))
+            except ValueError:
+                cohort = None
+            else:
+                end = (start + timedelta(days=32)).replace(day=1)
+                states = states.filter(user_profile__created_at__gte=start, user_profile__created_at__lt=end)
+        leaderboard = states.leaderboard()
+
+        if request.GET.get('export') == 'csv':
+            return self.leaderboard_csv(leaderboard, cohort)
+
+        page = Paginator(leaderboard, self.LEADERBOARD_PAGE_SIZE).get_page(request.GET.get('page'))
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'title': "52 WSC Leaderboard",
+            'page': page,
+            'cohort': cohort,
+            'target_amount': WSC_TARGET_AMOUNT,
+            **self.leaderboard_analytics(),
+        }
+        return TemplateResponse(request, 'admin/mcs/savingsmemberstate/leaderboard.html', context)
+
+    def leaderboard_csv(self, leaderboard, cohort):
+        rows = leaderboard.values_list(
+            'rank', 'user_profile__account_number', 'user_profile__full_name', 'user_profile__user__username',
+            'cumulative_total', 'next_week', 'transaction_count', 'last_saved_at', 'user_profile__created_at',
+        )
+        header = [
+            'rank', 'account_number', 'name', 'amount_saved', 'progress_percentage',
+            'weeks_covered', 'transactions', 'last_saved', 'joined',
+        ]
+        csv_rows = (
+            [
+                rank, account or '', full_name or username, saved,
+                round(float(saved) / WSC_TARGET_AMOUNT * 100, 2), min(next_week - 1, 52), count,
+                last_saved.date() if last_saved else '', joined.strftime('%Y-%m') if joined else '',
+            ]
+            for rank, account, full_name, username, saved, next_week, count, last_saved, joined in rows.iterator(chunk_size=2000)
+        )
+        filename = f"52wsc-leaderboard-{cohort}.csv" if cohort else "52wsc-leaderboard.csv"
+        return stream_csv(header, csv_rows, filename)
+
+
+class MaturityFilter(admin.SimpleListFilter):
+    """Filter fixed-term accounts on the annotated_maturity_date added by with_interest()"""
+    title = 'maturity'
+    parameter_name = 'maturity'
+
+    def lookups(self, request, model_admin):
+        return [('matured', 'Matured'), ('next_30_days', 'Maturing in 30 days'), ('later', 'Maturing later')]
+
+    def queryset(self, request, queryset):
+        today = timezone.now().date()
+        if self.value() == 'matured':
+            return queryset.filter(annotated_maturity_date__lte=today)
+        if self.value() == 'next_30_days':
+            return queryset.filter(annotated_maturity_date__gt=today, annotated_maturity_date__lte=today + timedelta(days=30))
+        if self.value() == 'later':
+            return queryset.filter(annotated_maturity_date__gt=today + timedelta(days=30))
+        return queryset
+
+
+class AccruedInterestFilter(admin.SimpleListFilter):
+    """Filter fixed-term accounts on the annotated_accrued_interest added by with_interest()"""
+    title = 'interest accrued'
+    parameter_name = 'accrued_interest'
+    BANDS = {
+        'none': (None, 0),
+        'under_100k': (0, 100000),
+        '100k_1m': (100000, 1000000),
+        'over_1m': (1000000, None),
+    }
+
+    def lookups(self, request, model_admin):
+        return [('none', 'None yet'), ('under_100k', 'Under UGX 100,000'),
+                ('100k_1m', 'UGX 100,000 - 1,000,000'), ('over_1m', 'Over UGX 1,000,000')]
+
+    def queryset(self, request, queryset):
+        if self.value() not in self.BANDS:
+            return queryset
+        low, high = self.BANDS[self.value()]
+        if low is None:
+            return queryset.filter(annotated_accrued_interest__lte=high)
+        queryset = queryset.filter(annotated_accrued_interest__gt=low)
+        return queryset.filter(annotated_accrued_interest__lte=high) if high is not None else queryset
+
+
+class FixedTermInterestMixin:
+    """Interest columns computed by the database, so the changelist can sort and filter on them"""
 
-        super().save_model(request, obj, form, change)
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_interest()
+
+    def maturity(self, obj):
+        return obj.annotated_maturity_date
+    maturity.short_description = 'Maturity Date'
+    maturity.admin_order_field = 'annotated_maturity_date'
+
+    def expected_interest_amount(self, obj):
+        return f"UGX {obj.annotated_expected_interest:,.2f}"
+    expected_interest_amount.short_description = 'Expected Interest'
+    expected_interest_amount.admin_order_field = 'annotated_expected_interest'
+
+    def accrued_interest(self, obj):
+        return f"UGX {obj.annotated_accrued_interest:,.2f}"
+    accrued_interest.short_description = 'Interest So Far'
+    accrued_interest.admin_order_field = 'annotated_accrued_interest'
 
 
 @admin.register(Investment)
-class InvestmentAdmin(admin.ModelAdmin):
-    list_display = ('user_profile', 'amount_invested', 'interest_rate', 'maturity_months', 'date_invested', 'maturity_date', 'interest_expected', 'interest_gained_so_far')
-    list_filter = ('date_invested', 'maturity_months')
+class InvestmentAdmin(FixedTermInterestMixin, admin.ModelAdmin):
+    list_display = ('user_profile', 'amount_invested', 'interest_rate', 'maturity_months', 'date_invested', 'maturity', 'expected_interest_amount', 'accrued_interest', 'status')
+    list_filter = ('status', 'date_invested', 'maturity_months', MaturityFilter, AccruedInterestFilter)
     search_fields = (
     'user_profile__user__username',
     'user_profile__user__first_name',
@@ -144,20 +333,105 @@ class InvestmentAdmin(admin.ModelAdmin):
     autocomplete_fields = ('user_profile',)
 
 
+class PaginatedInlineFormSet(BaseInlineFormSet):
+    """Inline formset that only builds forms for one page of the parent's existing rows"""
+    per_page = None
+    page_number = None
+    page_parameter = 'page'
+    query_params = None
+
+    def get_queryset(self):
+        if not hasattr(self, '_queryset'):
+            queryset = super().get_queryset()
+            self.page = Paginator(queryset, self.per_page).get_page(self.page_number)
+            self._queryset = self.page.object_list
+        return self._queryset
+
+    def page_url(self, number):
+        params = self.query_params.copy()
+        params[self.page_parameter] = number
+        return '?' + params.urlencode()
+
+    @property
+    def previous_page_url(self):
+        return self.page_url(self.page.previous_page_number()) if self.page.has_previous() else None
+
+    @property
+    def next_page_url(self):
+        return self.page_url(self.page.next_page_number()) if self.page.has_next() else None
+
+
+class PaginatedInlineMixin:
+    """
+    Page a tabular inline's existing rows, per_page at a time, with ?<model_name>_page=N.
+
+    The change form posts back to its own URL, so a save edits the page that was shown.
+    """
+    formset = PaginatedInlineFormSet
+    template = 'admin/mcs/edit_inline/paginated_tabular.html'
+    per_page = 20
+
+    def get_formset(self, request, obj=None, **kwargs):
+        # inlineformset_factory builds a new class on every call, so it is safe to configure
+        formset = super().get_formset(request, obj, **kwargs)
+        formset.per_page = self.per_page
+        formset.page_parameter = f"{self.opts.model_name}_page"
+        formset.page_number = request.GET.get(formset.page_parameter)
+        formset.query_params = request.GET.copy()
+        return formset
+
+
+class SelectedObjectAutocompleteSelect(AutocompleteSelect):
+    """
+    Autocomplete widget that labels its selected option from selected_object, when given,
+    instead of querying for it. The stock widget runs that query once per inline row.
+    """
+    selected_object = None
+
+    def optgroups(self, name, value, attr=None):
+        selected = self.selected_object
+        if selected is None or {str(v) for v in value} != {str(selected.pk)}:
+            return super().optgroups(name, value, attr)
+        options = [] if self.is_required else [self.create_option(name, '', '', False, 0)]
+        label = self.choices.field.label_from_instance(selected)
+        options.append(self.create_option(name, selected.pk, label, True, len(options)))
+        return [(None, options, 0)]
+
+
+class ClubMembershipFormSet(PaginatedInlineFormSet):
+    def add_fields(self, form, index):
+        super().add_fields(form, index)
+        field = form.fields.get('user_profile')
+        if field is not None and form.instance.user_profile_id:
+            # Admin wraps the widget to add the related-object links
+            getattr(field.widget, 'widget', field.widget).selected_object = form.instance.user_profile
+
+
 # Inline to assign members to a club while adding/editing the club
-class ClubMembershipInline(admin.TabularInline):
+class ClubMembershipInline(PaginatedInlineMixin, admin.TabularInline):
     model = ClubMembership
     extra = 0  # Don't show extra blank forms
     fields = ('user_profile', 'is_active', 'role', 'joined_on')
     autocomplete_fields = ['user_profile']  # Improve performance on large user lists
+    formset = ClubMembershipFormSet
     
     def get_queryset(self, request):
         # Only show memberships that have a user_profile
-        return super().get_queryset(request).filter(user_profile__isnull=False)
+        return super().get_queryset(request).filter(user_profile__isnull=False).select_related(
+            'club', 'user_profile__user'
+        )
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        # The autocomplete widget labels existing rows from the profiles loaded with the page
+        # (see ClubMembershipFormSet); the queryset covers rows it still has to look up
+        if db_field.name == 'user_profile':
+            kwargs['queryset'] = UserProfile.objects.select_related('user')
+            kwargs['widget'] = SelectedObjectAutocompleteSelect(db_field, self.admin_site, using=kwargs.get('using'))
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
 
 @admin.register(ClubFixedSavings)
-class ClubFixedSavingsAdmin(admin.ModelAdmin):
+class ClubFixedSavingsAdmin(FixedTermInterestMixin, admin.ModelAdmin):
     change_form_template = "admin/change_form.html"  # Use default Django admin template
     
     list_display = [
@@ -167,13 +441,14 @@ class ClubFixedSavingsAdmin(admin.ModelAdmin):
         'interest_rate',
         'maturity_months',
         'date_fixed',
-        'maturity_date',
-        'expected_interest',
+        'maturity',
+        'expected_interest_amount',
+        'accrued_interest',
         'status',
         'is_active',
     ]
 
-    list_filter = ['club', 'is_active', 'date_fixed', 'interest_rate']
+    list_filter = ['club', 'status', 'is_active', 'date_fixed', 'interest_rate', MaturityFilter, AccruedInterestFilter]
     search_fields = ['club__name', 'receipt_number']
 
     # ✅ These are properties, so include them here:
@@ -205,21 +480,27 @@ class ClubFixedSavingsAdmin(admin.ModelAdmin):
         super().save_model(request, obj, form, change)
 
 
-class ClubFixedSavingsInline(admin.TabularInline):
+class ClubFixedSavingsInline(PaginatedInlineMixin, admin.TabularInline):
     model = ClubFixedSavings
     extra = 0
     readonly_fields = ['maturity_date', 'expected_interest', 'status']
     fields = ['amount_fixed', 'receipt_number', 'interest_rate', 'maturity_months', 'date_fixed', 'is_active']
     can_delete = True
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('club')
+
 
-class ClubEventInline(admin.TabularInline):
+class ClubEventInline(PaginatedInlineMixin, admin.TabularInline):
     model = ClubEvent
     extra = 0
     fields = ['title', 'event_date', 'location', 'description', 'is_active']
     readonly_fields = ['created_at']
     can_delete = True
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('club')
+
 
 # Club admin config with inline member assignment
 @admin.register(Club)
@@ -238,19 +519,23 @@ class ClubAdmin(admin.ModelAdmin):
     readonly_fields = ['last_updated', 'created_at']
     inlines = [ClubMembershipInline, ClubFixedSavingsInline, ClubEventInline]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_summary()
+
     def get_total_savings(self, obj):
-        total = ClubTransaction.objects.filter(club=obj, transaction_type='deposit').aggregate(
-            total=models.Sum('amount'))['total'] or 0
-        return f"UGX {total:,.0f}"
+        return f"UGX {obj.total_deposits:,.0f}"
     get_total_savings.short_description = 'Total Savings'
+    get_total_savings.admin_order_field = 'total_deposits'
 
     def get_active_members_count(self, obj):
-        return ClubMembership.objects.filter(club=obj, is_active=True).count()
+        return obj.active_members
     get_active_members_count.short_description = 'Active Members'
+    get_active_members_count.admin_order_field = 'active_members'
 
     def get_total_members_count(self, obj):
-        return ClubMembership.objects.filter(club=obj).count()
+        return obj.total_members
     get_total_members_count.short_description = 'Total Members'
+    get_total_members_count.admin_order_field = 'total_members'
 
 
 
@@ -320,7 +605,7 @@ admin.site.register(Project)
 
 
 @admin.register(IndividualUserFixedSavings)
-class IndividualUserFixedSavingsAdmin(admin.ModelAdmin):
+class IndividualUserFixedSavingsAdmin(FixedTermInterestMixin, admin.ModelAdmin):
     list_display = [
         'user_profile',
         'account_number',
@@ -331,6 +616,7 @@ class IndividualUserFixedSavingsAdmin(admin.ModelAdmin):
         'maturity_date',
         'expected_interest',
         'interest_earned_so_far',
+        'accrued_interest',
         'account_status',
         'transaction_type',
         'is_active',
@@ -346,6 +632,7 @@ class IndividualUserFixedSavingsAdmin(admin.ModelAdmin):
         'maturity_option',
         'date_fixed',
         'interest_rate',
+        AccruedInterestFilter,
     ]
     
     search_fields = [
@@ -407,6 +694,7 @@ class IndividualUserFixedSavingsAdmin(admin.ModelAdmin):
     def days_remaining(self, obj):
         return f"{obj.days_remaining} days"
     days_remaining.short_description = 'Days Remaining'
+    days_remaining.admin_order_field = 'maturity_date'
     
     def formatted_principal_amount(self, obj):
         return f"UGX {obj.principal_amount:,.2f}" if obj.principal_amount else "UGX 0.00"
@@ -440,10 +728,8 @@ class IndividualUserFixedSavingsAdmin(admin.ModelAdmin):
     mark_as_closed.short_description = "Mark selected accounts as closed"
     
     def recalculate_interest(self, request, queryset):
-        for obj in queryset:
-            obj.interest_earned_so_far = obj.calculate_interest_earned_so_far()
-            obj.save()
-        self.message_user(request, f'Interest recalculated for {queryset.count()} account(s).')
+        updated = credit_accrued_interest(queryset)
+        self.message_user(request, f'Interest recalculated for {updated} account(s).')
     recalculate_interest.short_description = "Recalculate interest for selected accounts"
 
 
@@ -539,6 +825,60 @@ class GoatAdmin(admin.ModelAdmin):
         }),
     )
 
+    change_list_template = 'admin/mcs/goat/change_list.html'
+
+    IMPORT_REJECTS_SHOWN = 200
+
+    def get_urls(self):
+        return [
+            path('import/', self.admin_site.admin_view(self.import_view), name='mcs_goat_import'),
+        ] + super().get_urls()
+
+    def import_view(self, request):
+        """Register a delivered herd from a CSV upload, with a report of what was skipped"""
+        if not self.has_add_permission(request):
+            raise PermissionDenied
+
+        importer = None
+        form = GoatImportForm(request.POST or None, request.FILES or None)
+        if request.method == 'POST' and form.is_valid():
+            upload = io.TextIOWrapper(form.cleaned_data['csv_file'].file, encoding='utf-8-sig', newline='')
+            importer = GoatImport(dry_run=form.cleaned_data['dry_run'])
+            try:
+                importer.run(upload)
+            except (ValueError, DatabaseError) as exc:
+                message = f"Could not import the file: {exc}"
+                if importer.committed:
+                    message += f" {importer.committed:,} goat(s) from earlier chunks were already registered."
+                messages.error(request, message)
+                importer = None
+            else:
+                action = "Validated" if importer.dry_run else "Registered"
+                messages.success(
+                    request,
+                    f"{action} {importer.imported:,} goat(s) across {len(importer.per_investment):,} "
+                    f"investment(s); rejected {len(importer.rejected):,} row(s).",
+                )
+
+        investments = []
+        if importer:
+            names = GoatFarmingInvestment.objects.select_related('user_profile__user', 'package').in_bulk(
+                list(importer.per_investment)
+            )
+            investments = [(names[pk], count) for pk, count in sorted(importer.per_investment.items())]
+
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'title': "Import goats",
+            'form': form,
+            'importer': importer,
+            'investments': investments,
+            'rejected': importer.rejected[:self.IMPORT_REJECTS_SHOWN] if importer else [],
+            'rejects_hidden': max(len(importer.rejected) - self.IMPORT_REJECTS_SHOWN, 0) if importer else 0,
+        }
+        return TemplateResponse(request, 'admin/mcs/goat/import.html', context)
+
 
 @admin.register(GoatHealthRecord)
 class GoatHealthRecordAdmin(admin.ModelAdmin):
@@ -0,0 +1,32 @@
+"""
+CSV downloads streamed row by row, so memory stays flat however many rows a report has.
+"""
+import csv
+
+from django.http import StreamingHttpResponse
+
+
+class Echo:
+    """File-like object whose write() returns the line, so csv.writer rows can be streamed"""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(header, rows, filename):
+    """
+    StreamingHttpResponse for a CSV download of header then rows.
+
+    rows is any iterable of sequences, typically a generator over queryset.iterator(), and
+    is consumed lazily as the response is sent.
+    """
+    writer = csv.writer(Echo())
+
+    def stream():
+        yield writer.writerow(header)
+        for row in rows:
+            yield writer.writerow(row)
+
+    response = StreamingHttpResponse(stream(), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
@@ -21,3 +21,11 @@ class ProfileForm(forms.ModelForm):
     class Meta:
         model = UserProfile
         fields = ['phone_number', 'national_id', 'address', 'bio', 'date_of_birth', 'profile_picture']
+
+class GoatImportForm(forms.Form):
+    csv_file = forms.FileField(
+        label='CSV file',
+        help_text='Columns: investment (id), gender, breed, weight_kg, date_received (YYYY-MM-DD). '
+                  'weight_kg and date_received may be blank.',
+    )
+    dry_run = forms.BooleanField(required=False, help_text='Validate the file without registering any goats.')
@@ -0,0 +1,175 @@
+"""
+Bulk registration of goats from a CSV, shared by the import_goats command and the Goat
+admin's import page.
+
+Rows are validated and written a chunk at a time: the chunk's IDs are reserved as one
+block, the goats go in with bulk_create, and every investment they belong to has its
+goat counts raised by a single UPDATE.
+"""
+import csv
+from collections import Counter
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .models import Goat, GoatFarmingInvestment, drop_goat_portfolios
+
+GOAT_COLUMNS = ('investment', 'gender', 'breed', 'weight_kg', 'date_received')
+BREED_MAX_LENGTH = Goat._meta.get_field('breed').max_length
+GENDERS = {value for value, _ in Goat.GENDER_CHOICES}
+# Largest BigAutoField id; a larger one overflows the investment lookup
+MAX_INVESTMENT_ID = 2 ** 63 - 1
+
+
+class GoatImport:
+    """
+    Validate and register goats from CSV rows of investment (id), gender, breed, weight_kg
+    and date_received; weight_kg and date_received may be blank.
+
+    After run(), imported is the number of goats written (or that would be, with
+    dry_run), per_investment counts them by investment id, and rejected lists
+    (line, row, reason) for every row that was skipped.
+    """
+
+    def __init__(self, dry_run=False, chunk_size=5000):
+        self.dry_run = dry_run
+        self.chunk_size = chunk_size
+        self.committed = 0
+        self.reset()
+
+    def reset(self):
+        self.imported = 0
+        self.per_investment = Counter()
+        self.rejected = []
+
+    def run(self, handle, progress=None):
+        """
+        Import every row of an open, seekable CSV file. progress(line), if given, is called
+        after each chunk.
+
+        The whole file is validated before anything is written, so a file with a missing
+        column or bytes that do not decode registers no goats; run() raises ValueError
+        (UnicodeDecodeError is one) for those. Rows are then written a chunk per
+        transaction: if writing fails partway, committed is the number of goats earlier
+        chunks already registered.
+        """
+        self.read(handle, write=False, progress=progress if self.dry_run else None)
+        if not self.dry_run:
+            handle.seek(0)
+            self.reset()
+            self.read(handle, write=True, progress=progress)
+        self.rejected.sort(key=lambda rejected: rejected[0])
+        return self
+
+    def read(self, handle, write, progress=None):
+        reader = csv.DictReader(handle)
+        missing = [column for column in GOAT_COLUMNS if column not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"Missing column(s): {', '.join(missing)}")
+
+        # Line 1 is the header, so data rows start at line 2
+        rows = enumerate(reader, start=2)
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                break
+            self.import_chunk(chunk, write)
+            if progress:
+                progress(chunk[-1][0])
+
+    def import_chunk(self, chunk, write=True):
+        parsed = []
+        for line, row in chunk:
+            goat, reason = self.parse_row(row)
+            if reason:
+                self.rejected.append((line, row, reason))
+            else:
+                parsed.append((line, row, goat))
+
+        owners = dict(GoatFarmingInvestment.objects.filter(
+            pk__in={goat.investment_id for _, _, goat in parsed}
+        ).values_list('pk', 'user_profile_id'))
+        goats = []
+        for line, row, goat in parsed:
+            if goat.investment_id not in owners:
+                self.rejected.append((line, row, f"unknown investment {goat.investment_id}"))
+            else:
+                goats.append(goat)
+
+        counts = Counter(goat.investment_id for goat in goats)
+        self.imported += len(goats)
+        self.per_investment.update(counts)
+        if not write or not goats:
+            return
+
+        with transaction.atomic():
+            Goat.assign_ids(goats)
+            Goat.objects.bulk_create(goats, batch_size=1000)
+            received = models.Case(
+                *(models.When(pk=investment, then=models.Value(count)) for investment, count in counts.items()),
+                output_field=models.PositiveIntegerField(),
+            )
+            GoatFarmingInvestment.objects.filter(pk__in=counts).update(
+                initial_goats_received=models.F('initial_goats_received') + received,
+                total_goats_current=models.F('total_goats_current') + received,
+            )
+            # bulk_create and update() send no signals
+            drop_goat_portfolios({owners[investment] for investment in counts})
+        self.committed += len(goats)
+
+    def parse_row(self, row):
+        """Returns (unsaved Goat, None) for a valid row, or (None, reason)"""
+        raw_investment = (row.get('investment') or '').strip()
+        gender = (row.get('gender') or '').strip().lower()
+        breed = (row.get('breed') or '').strip()
+        raw_weight = (row.get('weight_kg') or '').strip()
+        raw_date = (row.get('date_received') or '').strip()
+
+        # isdigit() alone also accepts digits such as '²' that int() cannot parse
+        if not (raw_investment.isascii() and raw_investment.isdigit()) or int(raw_investment) > MAX_INVESTMENT_ID:
+            return None, f"invalid investment {raw_investment!r}"
+        if gender not in GENDERS:
+            return None, f"gender must be female or male, got {gender!r}"
+        if not breed:
+            return None, "missing breed"
+        if len(breed) > BREED_MAX_LENGTH:
+            return None, f"breed longer than {BREED_MAX_LENGTH} characters"
+
+        weight = None
+        if raw_weight:
+            try:
+                weight = Decimal(raw_weight)
+            except InvalidOperation:
+                return None, f"invalid weight {raw_weight!r}"
+            # NaN cannot be compared with a limit, so it is ruled out first
+            if not weight.is_finite() or not 0 < weight < 1000 or weight != weight.quantize(Decimal('0.01')):
+                return None, f"weight must be between 0 and 999.99 kg, got {raw_weight!r}"
+
+        today = timezone.localdate()
+        date_received = today
+        if raw_date:
+            try:
+                date_received = parse_date(raw_date)
+            except ValueError:
+                date_received = None
+            if date_received is None:
+                return None, f"invalid date {raw_date!r}"
+            if date_received > today:
+                return None, f"date received {raw_date} is in the future"
+
+        return Goat(
+            investment_id=int(raw_investment),
+            gender=gender,
+            breed=breed,
+            weight_kg=weight,
+            date_received=date_received,
+        ), None
+
+    def write_rejects(self, handle):
+        writer = csv.writer(handle)
+        writer.writerow(['line', *GOAT_COLUMNS, 'reason'])
+        for line, row, reason in self.rejected:
+            writer.writerow([line, *(row.get(column, '') for column in GOAT_COLUMNS), reason])
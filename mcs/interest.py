@@ -0,0 +1,303 @@
+"""
+Interest for the fixed-term products, computed for many accounts at once.
+
+Investment and ClubFixedSavings earn simple interest, which their models compute per
+instance with Decimal(float) arithmetic. simple_interest evaluates the same formulas
+over NumPy arrays and rounds to the cent, so dashboards and reports covering thousands
+of accounts do not pay for a Python loop of Decimal multiplications. Results are
+identical to the model properties rounded to the cent (ROUND_HALF_EVEN, as DecimalField
+stores them): float64 carries about 16 significant digits, so a row whose value lands
+within rounding error of a half cent is recomputed with the model's Decimal formula
+rather than trusted to the float result.
+
+IndividualUserFixedSavings compounds at its compounding_frequency; compound_interest
+reads cached growth factor tables, and the model methods go through it as well.
+"""
+from decimal import Decimal, ROUND_HALF_EVEN
+from functools import lru_cache
+from operator import attrgetter
+
+import numpy as np
+from django.db import models
+from django.utils import timezone
+
+CENT = Decimal('0.01')
+
+# Field names and formula variants for each product, keyed by model label
+PRODUCTS = {
+    'mcs.Investment': {
+        'fields': ('amount_invested', 'interest_rate', 'maturity_months', 'date_invested'),
+        'clamp_before_start': True,
+        'positive_only': False,
+    },
+    'mcs.ClubFixedSavings': {
+        'fields': ('amount_fixed', 'interest_rate', 'maturity_months', 'date_fixed'),
+        'clamp_before_start': True,
+        'positive_only': False,
+    },
+    # Compounds at its compounding_frequency, and only accrues on positive principals and rates
+    'mcs.IndividualUserFixedSavings': {
+        'fields': ('principal_amount', 'interest_rate', 'maturity_period', 'date_fixed'),
+        'compounding_field': 'compounding_frequency',
+        'clamp_before_start': True,
+        'positive_only': True,
+    },
+}
+
+# Compounding periods per year; terms use 30-day months, so a period is 360 / n days
+COMPOUNDING_PERIODS = {'monthly': 12, 'quarterly': 4, 'annually': 1}
+
+
+def _round_to_cents(cents, exact):
+    """
+    Round float cent amounts half-even, recomputing rows too close to a half cent to call.
+
+    exact(i) must return row i's unrounded Decimal amount in UGX.
+    """
+    rounded = np.rint(cents)
+    distance = np.abs(np.abs(cents - np.floor(cents)) - 0.5)
+    ambiguous = np.flatnonzero(distance < 1e-6 + np.abs(cents) * 1e-12)
+    for i in ambiguous:
+        rounded[i] = int(exact(i).quantize(CENT, rounding=ROUND_HALF_EVEN) * 100)
+    return rounded.astype(np.int64)
+
+
+def simple_interest(principal, annual_rate, months, start, as_of=None,
+                    clamp_before_start=True, positive_only=False):
+    """
+    Expected and accrued simple interest for parallel sequences of accounts.
+
+    principal: amounts in UGX (Decimal or int)
+    annual_rate: rates in percent (e.g. 12.5)
+    months: terms in months; a 30-day month caps accrual at maturity
+    start: dates interest starts from, or None
+    as_of: date accrual is measured at, today by default
+
+    Returns two int64 arrays of cents: interest over the full term, and interest accrued
+    on a daily basis (annual rate / 365) up to as_of.
+    """
+    as_of = as_of or timezone.now().date()
+    principal = list(principal)
+    count = len(principal)
+
+    principal_cents = np.fromiter((float(value or 0) for value in principal), np.float64, count) * 100
+    rates = np.fromiter((rate or 0 for rate in annual_rate), np.float64, count)
+    terms = np.fromiter((term or 0 for term in months), np.int64, count)
+    start = list(start)
+    has_start = np.fromiter((day is not None for day in start), bool, count)
+    start_days = np.fromiter((day.toordinal() if day else 0 for day in start), np.int64, count)
+
+    # Same float operations, in the same order, as the model properties
+    annual_fraction = rates / 100
+    daily_rate = rates / 100 / 365
+    term_years = terms / 12
+
+    elapsed = as_of.toordinal() - start_days
+    days = np.where(terms > 0, np.minimum(elapsed, terms * 30), 0)
+    if clamp_before_start:
+        days = np.maximum(days, 0)
+    days = np.where(has_start, days, 0)
+
+    earning = np.ones(count, dtype=bool)
+    if positive_only:
+        earning = (principal_cents > 0) & (rates > 0)
+
+    expected = _round_to_cents(
+        principal_cents * annual_fraction * term_years,
+        lambda i: Decimal(principal[i] or 0) * Decimal(annual_fraction[i]) * Decimal(term_years[i]),
+    )
+    accrued = _round_to_cents(
+        np.where(earning, principal_cents * daily_rate * days, 0.0),
+        lambda i: Decimal(principal[i] or 0) * Decimal(daily_rate[i]) * int(days[i]),
+    )
+    return expected, accrued
+
+
+@lru_cache(maxsize=512)
+def growth_factors(annual_rate, frequency, months):
+    """
+    Growth of 1 UGX on each day 0..months * 30 of a compounded term, as a read-only array.
+
+    Interest is added to the balance at the end of every whole period (30, 90 or 360 days)
+    and accrues pro rata on the compounded balance within the current period, so a term
+    shorter than one period earns simple interest. Tables depend only on rate, frequency
+    and term, which few accounts differ in, so each one is built once per process.
+    """
+    periods = COMPOUNDING_PERIODS.get(frequency, COMPOUNDING_PERIODS['monthly'])
+    table = _growth(annual_rate / 100 / periods, 360 // periods, np.arange(max(months, 0) * 30 + 1))
+    table.flags.writeable = False
+    return table
+
+
+def _growth(periodic_rate, period_days, days):
+    """Growth of 1 UGX after days, compounded every period_days; broadcasts over arrays"""
+    whole_periods = days // period_days
+    return (1 + periodic_rate) ** whole_periods * (
+        1 + periodic_rate * (days - whole_periods * period_days) / period_days
+    )
+
+
+def compound_interest(principal, annual_rate, months, start, frequency, as_of=None, positive_only=False):
+    """
+    Expected and accrued compound interest for parallel sequences of accounts.
+
+    Takes the same arguments as simple_interest plus each account's compounding frequency,
+    and returns the same two int64 arrays of cents. Accounts sharing a rate, frequency
+    and term are looked up in their growth_factors table together.
+    """
+    as_of = as_of or timezone.now().date()
+    principal = list(principal)
+    count = len(principal)
+
+    principal_cents = np.fromiter((float(value or 0) for value in principal), np.float64, count) * 100
+    rates = [float(rate or 0) for rate in annual_rate]
+    terms = [int(term or 0) for term in months]
+    frequency = list(frequency)
+    elapsed = np.fromiter(
+        ((as_of - day).days if day else 0 for day in start), np.int64, count,
+    )
+    days = np.clip(elapsed, 0, np.array(terms, dtype=np.int64) * 30)
+
+    groups = {}
+    for i, key in enumerate(zip(rates, frequency, terms)):
+        groups.setdefault(key, []).append(i)
+
+    expected_growth = np.zeros(count)
+    accrued_growth = np.zeros(count)
+    for key, rows in groups.items():
+        table = growth_factors(*key)
+        rows = np.array(rows)
+        expected_growth[rows] = table[-1] - 1
+        accrued_growth[rows] = table[days[rows]] - 1
+
+    if positive_only:
+        earning = (principal_cents > 0) & (np.array(rates) > 0)
+        accrued_growth = np.where(earning, accrued_growth, 0.0)
+
+    expected = np.rint(principal_cents * expected_growth).astype(np.int64)
+    accrued = np.rint(principal_cents * accrued_growth).astype(np.int64)
+    return expected, accrued
+
+
+def projection_grid(amounts, terms, rates, frequencies):
+    """
+    Maturity schedules for every combination of amounts x terms x rates x frequencies.
+
+    All scenarios are evaluated together on a (scenario, month) array, with the same
+    compounding as IndividualUserFixedSavings. Returns a list of dicts, one per scenario,
+    holding the expected interest, matured amount and the balance at the end of each
+    30-day month of the term, in UGX rounded to the cent.
+    """
+    amount, term, rate, frequency = (
+        axis.ravel() for axis in np.meshgrid(
+            np.array(amounts, dtype=np.float64),
+            np.array(terms, dtype=np.int64),
+            np.array(rates, dtype=np.float64),
+            np.array(frequencies, dtype=object),
+            indexing='ij',
+        )
+    )
+    periods = np.array([COMPOUNDING_PERIODS[name] for name in frequency], dtype=np.int64)
+
+    # Months past a scenario's term repeat its maturity balance and are sliced off below
+    month_ends = np.arange(1, max(int(term.max()), 0) + 1) * 30
+    days = np.minimum(month_ends[None, :], term[:, None] * 30)
+    periodic_rate = rate / 100 / periods
+    period_days = 360 // periods
+    growth = _growth(periodic_rate[:, None], period_days[:, None], days)
+    balances = np.rint(amount[:, None] * 100 * growth) / 100
+    matured = np.rint(amount * 100 * _growth(periodic_rate, period_days, term * 30)) / 100
+
+    return [
+        {
+            'amount': float(amount[i]),
+            'term_months': int(term[i]),
+            'interest_rate': float(rate[i]),
+            'compounding_frequency': frequency[i],
+            'expected_interest': round(float(matured[i] - amount[i]), 2),
+            'matured_amount': float(matured[i]),
+            'schedule': balances[i, :term[i]].tolist(),
+        }
+        for i in range(len(amount))
+    ]
+
+
+def cents_to_decimal(cents):
+    """Decimal UGX amounts for a sequence or array of integer cents"""
+    if isinstance(cents, np.ndarray):
+        cents = cents.tolist()
+    return [Decimal(value) * CENT for value in cents]
+
+
+def product_fields(product):
+    """Model fields read for a product: principal, rate, term, start and any compounding frequency"""
+    if product.get('compounding_field'):
+        return (*product['fields'], product['compounding_field'])
+    return product['fields']
+
+
+def interest_for(accounts, as_of=None):
+    """
+    Expected and accrued interest for a queryset or list of one fixed-term product.
+
+    Returns {pk: (expected_interest, interest_accrued)} as Decimals to the cent. Querysets
+    are read with values_list, so no model instances are built.
+    """
+    if isinstance(accounts, models.QuerySet):
+        model = accounts.model
+        product = PRODUCTS[model._meta.label]
+        fields = product_fields(product)
+        rows = list(accounts.values_list('pk', *fields))
+    else:
+        accounts = list(accounts)
+        if not accounts:
+            return {}
+        model = type(accounts[0])
+        product = PRODUCTS[model._meta.label]
+        values = attrgetter('pk', *product_fields(product))
+        rows = [values(account) for account in accounts]
+
+    if not rows:
+        return {}
+
+    pks, *columns = zip(*rows)
+    if product.get('compounding_field'):
+        expected, accrued = compound_interest(*columns, as_of=as_of, positive_only=product['positive_only'])
+    else:
+        expected, accrued = simple_interest(
+            *columns, as_of=as_of,
+            clamp_before_start=product['clamp_before_start'],
+            positive_only=product['positive_only'],
+        )
+    return dict(zip(pks, zip(cents_to_decimal(expected), cents_to_decimal(accrued))))
+
+
+def credit_accrued_interest(accounts, as_of=None):
+    """
+    Store interest accrued up to as_of on IndividualUserFixedSavings accounts.
+
+    Sets expected_interest, matured_amount, interest_earned_so_far, current_balance
+    (principal plus that interest) and the last_interest_credit_date watermark with one
+    bulk_update. Values are recomputed from the principal each time, so crediting an
+    account twice for the same date is harmless. Returns the number of accounts written.
+    """
+    from .models import IndividualUserFixedSavings
+
+    as_of = as_of or timezone.now().date()
+    accounts = list(accounts)
+    interest = interest_for(accounts, as_of=as_of)
+    now = timezone.now()
+    for account in accounts:
+        account.expected_interest, account.interest_earned_so_far = interest[account.pk]
+        account.matured_amount = account.principal_amount + account.expected_interest
+        account.current_balance = account.principal_amount + account.interest_earned_so_far
+        account.last_interest_credit_date = as_of
+        account.updated_at = now
+
+    IndividualUserFixedSavings.objects.bulk_update(
+        accounts,
+        ['expected_interest', 'matured_amount', 'interest_earned_so_far', 'current_balance',
+         'last_interest_credit_date', 'updated_at'],
+        batch_size=500,
+    )
+    return len(accounts)
@@ -0,0 +1,85 @@
+import random
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from mcs.views import evaluate_deposit, evaluate_deposit_batch
+
+
+def legacy_evaluate_deposit(deposit, current_week, carry_forward):
+    """The original week-by-week loop, kept here as the benchmark baseline"""
+    weekly_targets = [week * 10000 for week in range(1, 53)]
+    balance = deposit + carry_forward
+    fully_covered = []
+
+    for i in range(current_week - 1, 52):
+        target = weekly_targets[i]
+        if balance >= target:
+            fully_covered.append(i + 1)
+            balance -= target
+            current_week += 1
+        else:
+            break
+
+    return {
+        'fully_covered_weeks': fully_covered,
+        'next_week': current_week,
+        'remaining_balance': balance
+    }
+
+
+class Command(BaseCommand):
+    help = "Benchmark the 52WSC deposit engine against the original week-by-week loop"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--members', type=int, default=1000, help="Number of synthetic members")
+        parser.add_argument('--deposits', type=int, default=52, help="Deposits per member")
+        parser.add_argument('--repeat', type=int, default=3, help="Timing runs (best is reported)")
+        parser.add_argument('--seed', type=int, default=52)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        chains = {
+            member: [rng.choice([10000, 50000, 100000, 250000, 500000, 1000000, 3000000])
+                     for _ in range(options['deposits'])]
+            for member in range(options['members'])
+        }
+        total = options['members'] * options['deposits']
+
+        def run_chains(evaluate):
+            for deposits in chains.values():
+                current_week, carry_forward = 1, 0
+                for deposit in deposits:
+                    result = evaluate(deposit, current_week, carry_forward)
+                    current_week = result['next_week']
+                    carry_forward = result['remaining_balance']
+
+        # Both engines must agree before their timings mean anything
+        for deposits in list(chains.values())[:50]:
+            current_week, carry_forward = 1, 0
+            for deposit in deposits:
+                expected = legacy_evaluate_deposit(deposit, current_week, carry_forward)
+                if evaluate_deposit(deposit, current_week, carry_forward) != expected:
+                    self.stderr.write(self.style.ERROR(
+                        f"Mismatch for deposit {deposit} at week {current_week} (carry {carry_forward})"
+                    ))
+                    return
+                current_week = expected['next_week']
+                carry_forward = expected['remaining_balance']
+
+        timings = {
+            'legacy loop': min(timeit.repeat(lambda: run_chains(legacy_evaluate_deposit),
+                                             number=1, repeat=options['repeat'])),
+            'bisect engine': min(timeit.repeat(lambda: run_chains(evaluate_deposit),
+                                               number=1, repeat=options['repeat'])),
+            'batch API': min(timeit.repeat(lambda: evaluate_deposit_batch(chains),
+                                           number=1, repeat=options['repeat'])),
+        }
+
+        self.stdout.write(f"{options['members']:,} members x {options['deposits']} deposits = {total:,} evaluations")
+        baseline = timings['legacy loop']
+        for name, seconds in timings.items():
+            self.stdout.write(
+                f"  {name:<14} {seconds * 1000:9.1f} ms  "
+                f"{seconds / total * 1e6:7.2f} us/deposit  {baseline / seconds:5.1f}x"
+            )
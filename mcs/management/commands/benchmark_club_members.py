@@ -0,0 +1,109 @@
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, models, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from mcs.models import (
+    Club, ClubFixedSavings, ClubMembership, ClubTransaction, UserProfile, maturity_for,
+)
+from mcs.views import club_member_rows
+
+
+class Rollback(Exception):
+    pass
+
+
+def legacy_member_totals(club):
+    """The original three-queries-per-member loop, kept here as the benchmark baseline"""
+    rows = []
+    for membership in ClubMembership.objects.filter(club=club).select_related('user_profile__user'):
+        total_savings = ClubTransaction.objects.filter(
+            club=club, user_profile=membership.user_profile, transaction_type='deposit'
+        ).aggregate(total=models.Sum('amount'))['total'] or 0
+        fixed_savings = ClubFixedSavings.objects.filter(
+            club=club, created_by=membership.user_profile.user, is_active=True
+        ).aggregate(total=models.Sum('amount_fixed'))['total'] or 0
+        last_contribution = ClubTransaction.objects.filter(
+            club=club, user_profile=membership.user_profile, transaction_type='deposit'
+        ).order_by('-created_at').first()
+        rows.append((total_savings, fixed_savings, last_contribution.created_at if last_contribution else None))
+    return rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the club members table against the original per-member queries on synthetic "
+        "clubs. Everything is created in one transaction and rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='10,100,1000', help="Comma-separated member counts, one club each")
+        parser.add_argument('--deposits', type=int, default=12, help="Deposits per member")
+        parser.add_argument('--repeat', type=int, default=3, help="Timing runs (best is reported)")
+        parser.add_argument('--seed', type=int, default=16)
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options['sizes'].split(',')]
+        rng = random.Random(options['seed'])
+        try:
+            with transaction.atomic():
+                clubs = [self.create_club(size, options['deposits'], rng) for size in sizes]
+                self.stdout.write(f"{'members':>8}  {'legacy':>18}  {'annotated':>18}  speedup")
+                for size, club in zip(sizes, clubs):
+                    legacy = self.measure(lambda: legacy_member_totals(club), options['repeat'])
+                    annotated = self.measure(lambda: club_member_rows(club), options['repeat'])
+                    self.stdout.write(
+                        f"{size:>8,}  {legacy[0] * 1000:9.1f} ms {legacy[1]:>4} q  "
+                        f"{annotated[0] * 1000:9.1f} ms {annotated[1]:>4} q  {legacy[0] / annotated[0]:6.1f}x"
+                    )
+                raise Rollback
+        except Rollback:
+            pass
+
+    def measure(self, run, repeat):
+        """Best wall time over repeat runs, and the queries one run issues"""
+        best = None
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                run()
+                elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, len(queries.captured_queries)
+
+    def create_club(self, size, deposits, rng):
+        tag = f"bench{size}-{rng.randrange(10 ** 9)}"
+        club = Club.objects.create(name=f"Benchmark club {tag}")
+        # bulk_create skips the post_save signal, so profiles are created here
+        users = User.objects.bulk_create([User(username=f"{tag}-{i}") for i in range(size)])
+        profiles = UserProfile.objects.bulk_create([
+            UserProfile(user=user, full_name=f"Member {i}", account_number=f"{tag}-{i}")
+            for i, user in enumerate(users)
+        ])
+        ClubMembership.objects.bulk_create([
+            ClubMembership(club=club, user_profile=profile, is_active=rng.random() < 0.9)
+            for profile in profiles
+        ])
+        ClubTransaction.objects.bulk_create([
+            ClubTransaction(
+                club=club, user_profile=profile, amount=rng.choice([10000, 50000, 100000]),
+                transaction_type='deposit' if rng.random() < 0.85 else 'withdrawal',
+            )
+            for profile in profiles for _ in range(deposits)
+        ], batch_size=2000)
+        today = timezone.now().date()
+        fixed = []
+        for user in rng.sample(users, max(1, size // 10)):
+            date_fixed = today - timedelta(days=rng.randrange(365))
+            maturity_date, status = maturity_for(date_fixed, 12)
+            fixed.append(ClubFixedSavings(
+                club=club, created_by=user, amount_fixed=500000, interest_rate=10,
+                maturity_months=12, date_fixed=date_fixed, maturity_date=maturity_date, status=status,
+            ))
+        ClubFixedSavings.objects.bulk_create(fixed)
+        return club
@@ -0,0 +1,246 @@
+import csv
+import time
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from mcs.models import SavingsMemberState, SavingsTransaction, UserProfile, weeks_before
+from mcs.views import evaluate_deposit_batch, replay_savings_ledger
+
+REQUIRED_COLUMNS = ('account_number', 'amount', 'receipt_number', 'date')
+RECEIPT_MAX_LENGTH = SavingsTransaction._meta.get_field('receipt_number').max_length
+# SavingsTransaction.amount is a PositiveIntegerField, an integer column on PostgreSQL
+MAX_AMOUNT = 2 ** 31 - 1
+
+
+class Command(BaseCommand):
+    help = (
+        "Import 52 WSC deposits from a CSV of account_number, amount, receipt_number, date. "
+        "Rows are processed in chunks; duplicate receipts and invalid rows are reported and skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_file', help="Path to the receipts CSV")
+        parser.add_argument('--chunk-size', type=int, default=5000, help="Rows read and written per transaction")
+        parser.add_argument('--rejects', help="Write rejected rows, with the reason, to this CSV")
+        parser.add_argument('--dry-run', action='store_true', help="Validate the file without writing anything")
+
+    def handle(self, *args, **options):
+        self.dry_run = options['dry_run']
+        self.seen_receipts = set()
+        self.rejected = []
+        imported = 0
+        started = time.perf_counter()
+
+        try:
+            handle = open(options['csv_file'], newline='', encoding='utf-8-sig')
+        except OSError as exc:
+            raise CommandError(f"Cannot open {options['csv_file']}: {exc}")
+
+        with handle:
+            reader = csv.DictReader(handle)
+            missing = [column for column in REQUIRED_COLUMNS if column not in (reader.fieldnames or [])]
+            if missing:
+                raise CommandError(f"Missing column(s): {', '.join(missing)}")
+
+            # Line 1 is the header, so data rows start at line 2
+            rows = enumerate(reader, start=2)
+            while True:
+                chunk = list(islice(rows, options['chunk_size']))
+                if not chunk:
+                    break
+                imported += self.import_chunk(chunk)
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"  line {chunk[-1][0]:,}: {imported:,} imported, {len(self.rejected):,} rejected "
+                    f"({imported / elapsed if elapsed else 0:,.0f} rows/s)"
+                )
+
+        elapsed = time.perf_counter() - started
+        if options['rejects'] and self.rejected:
+            self.write_rejects(options['rejects'])
+        for line, row, reason in self.rejected[:20]:
+            self.stdout.write(self.style.WARNING(f"  line {line}: {reason}"))
+        if len(self.rejected) > 20:
+            self.stdout.write(self.style.WARNING(f"  ... and {len(self.rejected) - 20:,} more"))
+
+        action = "Validated" if self.dry_run else "Imported"
+        self.stdout.write(self.style.SUCCESS(
+            f"{action} {imported:,} deposit(s), rejected {len(self.rejected):,} row(s) in {elapsed:.2f}s "
+            f"({imported / elapsed if elapsed else 0:,.0f} rows/s)."
+        ))
+
+    def import_chunk(self, chunk):
+        parsed = []
+        for line, row in chunk:
+            deposit, reason = self.parse_row(row)
+            if reason:
+                self.rejected.append((line, row, reason))
+            else:
+                parsed.append((line, row, deposit))
+
+        # Receipts already in the ledger or earlier in this file are duplicates
+        receipts = {deposit['receipt_number'] for _, _, deposit in parsed}
+        stored_receipts = set(SavingsTransaction.objects.filter(
+            receipt_number__in=receipts
+        ).values_list('receipt_number', flat=True))
+        accounts = dict(UserProfile.objects.filter(
+            account_number__in={deposit['account_number'] for _, _, deposit in parsed}
+        ).values_list('account_number', 'pk'))
+
+        chains = {}
+        for line, row, deposit in parsed:
+            receipt = deposit['receipt_number']
+            if receipt in stored_receipts or receipt in self.seen_receipts:
+                self.rejected.append((line, row, f"duplicate receipt number {receipt}"))
+                continue
+            if deposit['account_number'] not in accounts:
+                self.rejected.append((line, row, f"unknown account number {deposit['account_number']}"))
+                continue
+            self.seen_receipts.add(receipt)
+            chains.setdefault(accounts[deposit['account_number']], []).append(deposit)
+
+        if self.dry_run or not chains:
+            return sum(len(deposits) for deposits in chains.values())
+
+        for deposits in chains.values():
+            # Stable sort keeps same-day receipts in file order
+            deposits.sort(key=lambda deposit: deposit['date_saved'])
+
+        with transaction.atomic():
+            self.write_chains(chains)
+        return sum(len(deposits) for deposits in chains.values())
+
+    def write_chains(self, chains):
+        states = SavingsMemberState.objects.in_bulk(list(chains))
+        members_with_ledger = set(SavingsTransaction.objects.filter(
+            user_profile_id__in=[member for member in chains if member not in states]
+        ).values_list('user_profile_id', flat=True).distinct())
+
+        # Deposits dated after a member's latest stored one simply extend their chain;
+        # anything earlier means later stored transactions must be replayed too
+        appends, backdated = {}, []
+        for member, deposits in chains.items():
+            state = states.get(member)
+            if state and deposits[0]['date_saved'] >= state.last_saved_at:
+                appends[member] = deposits
+            elif not state and member not in members_with_ledger:
+                appends[member] = deposits
+            else:
+                backdated.append(member)
+
+        results = evaluate_deposit_batch(
+            {member: [deposit['amount'] for deposit in deposits] for member, deposits in appends.items()},
+            initial_states={
+                member: {
+                    'next_week': states[member].next_week,
+                    'remaining_balance': float(states[member].remaining_balance),
+                    'cumulative_total': states[member].cumulative_total,
+                }
+                for member in appends if member in states
+            },
+        )
+
+        new_transactions = []
+        new_states = []
+        for member, deposits in appends.items():
+            for deposit, result in zip(deposits, results[member]):
+                new_transactions.append(self.build_transaction(member, deposit, result))
+            last = results[member][-1]
+            previous_count = states[member].transaction_count if member in states else 0
+            new_states.append(SavingsMemberState(
+                user_profile_id=member,
+                cumulative_total=last['cumulative_total'],
+                next_week=last['next_week'],
+                remaining_balance=last['remaining_balance'],
+                covered_weeks_mask=weeks_before(last['next_week']),
+                transaction_count=previous_count + len(deposits),
+                last_saved_at=deposits[-1]['date_saved'],
+            ))
+
+        for member in backdated:
+            pending = [self.build_transaction(member, deposit) for deposit in chains[member]]
+            replay_savings_ledger(member, pending[0].date_saved, pending=pending)
+            new_transactions.extend(pending)
+
+        SavingsTransaction.objects.bulk_create(new_transactions, batch_size=1000)
+        SavingsMemberState.objects.bulk_create(
+            new_states,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['user_profile'],
+            update_fields=['cumulative_total', 'next_week', 'remaining_balance', 'covered_weeks_mask',
+                           'transaction_count', 'last_saved_at', 'updated_at'],
+        )
+        for member in backdated:
+            SavingsMemberState.refresh_for(member)
+
+    def build_transaction(self, member, deposit, result=None):
+        txn = SavingsTransaction(
+            user_profile_id=member,
+            amount=deposit['amount'],
+            receipt_number=deposit['receipt_number'],
+            date_saved=deposit['date_saved'],
+        )
+        if result:
+            txn.fully_covered_weeks = result['fully_covered_weeks']
+            txn.next_week = result['next_week']
+            txn.remaining_balance = result['remaining_balance']
+            txn.cumulative_total = result['cumulative_total']
+        return txn
+
+    def parse_row(self, row):
+        """Returns (deposit, None) for a valid row, or (None, reason)"""
+        account_number = (row.get('account_number') or '').strip()
+        receipt_number = (row.get('receipt_number') or '').strip()
+        raw_amount = (row.get('amount') or '').strip().replace(',', '')
+        raw_date = (row.get('date') or '').strip()
+
+        if not account_number:
+            return None, "missing account number"
+        if not receipt_number:
+            return None, "missing receipt number"
+        if len(receipt_number) > RECEIPT_MAX_LENGTH:
+            return None, f"receipt number longer than {RECEIPT_MAX_LENGTH} characters"
+
+        try:
+            amount = Decimal(raw_amount)
+        except InvalidOperation:
+            return None, f"invalid amount {raw_amount!r}"
+        # NaN cannot be compared and Infinity cannot be made an int, so both are ruled out first
+        if not amount.is_finite() or amount <= 0 or amount != amount.to_integral_value():
+            return None, f"amount must be a positive whole number of UGX, got {raw_amount!r}"
+        if amount > MAX_AMOUNT:
+            return None, f"amount above {MAX_AMOUNT:,} UGX, got {raw_amount!r}"
+
+        try:
+            date_saved = parse_datetime(raw_date)
+            if date_saved is None:
+                day = parse_date(raw_date)
+                date_saved = datetime.combine(day, datetime.min.time()) if day else None
+        except ValueError:
+            date_saved = None
+        if date_saved is None:
+            return None, f"invalid date {raw_date!r}"
+        if timezone.is_naive(date_saved):
+            date_saved = timezone.make_aware(date_saved)
+
+        return {
+            'account_number': account_number,
+            'receipt_number': receipt_number,
+            'amount': int(amount),
+            'date_saved': date_saved,
+        }, None
+
+    def write_rejects(self, path):
+        with open(path, 'w', newline='', encoding='utf-8') as handle:
+            writer = csv.writer(handle)
+            writer.writerow(['line', *REQUIRED_COLUMNS, 'reason'])
+            for line, row, reason in self.rejected:
+                writer.writerow([line, *(row.get(column, '') for column in REQUIRED_COLUMNS), reason])
+        self.stdout.write(f"Rejected rows written to {path}")
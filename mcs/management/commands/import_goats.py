@@ -0,0 +1,60 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+
+from mcs.imports import GoatImport
+
+
+class Command(BaseCommand):
+    help = (
+        "Register goats from a CSV of investment, gender, breed, weight_kg, date_received. "
+        "IDs are allocated in blocks and rows bulk-created a chunk at a time; invalid rows are reported and skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_file', help="Path to the goats CSV")
+        parser.add_argument('--chunk-size', type=int, default=5000, help="Rows read and written per transaction")
+        parser.add_argument('--rejects', help="Write rejected rows, with the reason, to this CSV")
+        parser.add_argument('--dry-run', action='store_true', help="Validate the file without writing anything")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        importer = GoatImport(dry_run=options['dry_run'], chunk_size=options['chunk_size'])
+
+        def progress(line):
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"  line {line:,}: {importer.imported:,} imported, {len(importer.rejected):,} rejected "
+                f"({importer.imported / elapsed if elapsed else 0:,.0f} rows/s)"
+            )
+
+        try:
+            handle = open(options['csv_file'], newline='', encoding='utf-8-sig')
+        except OSError as exc:
+            raise CommandError(f"Cannot open {options['csv_file']}: {exc}")
+        with handle:
+            try:
+                importer.run(handle, progress=progress)
+            except (ValueError, DatabaseError) as exc:
+                message = str(exc)
+                if importer.committed:
+                    message += f" ({importer.committed:,} goat(s) from earlier chunks were already registered)"
+                raise CommandError(message)
+
+        elapsed = time.perf_counter() - started
+        if options['rejects'] and importer.rejected:
+            with open(options['rejects'], 'w', newline='', encoding='utf-8') as rejects:
+                importer.write_rejects(rejects)
+            self.stdout.write(f"Rejected rows written to {options['rejects']}")
+        for line, row, reason in importer.rejected[:20]:
+            self.stdout.write(self.style.WARNING(f"  line {line}: {reason}"))
+        if len(importer.rejected) > 20:
+            self.stdout.write(self.style.WARNING(f"  ... and {len(importer.rejected) - 20:,} more"))
+
+        action = "Validated" if options['dry_run'] else "Registered"
+        self.stdout.write(self.style.SUCCESS(
+            f"{action} {importer.imported:,} goat(s) across {len(importer.per_investment):,} investment(s), "
+            f"rejected {len(importer.rejected):,} row(s) in {elapsed:.2f}s "
+            f"({importer.imported / elapsed if elapsed else 0:,.0f} rows/s)."
+        ))
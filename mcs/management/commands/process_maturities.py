@@ -0,0 +1,36 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from mcs.models import process_maturities
+
+
+class Command(BaseCommand):
+    help = (
+        "Mark every fixed-term account that has reached its maturity date as matured. "
+        "Meant to run daily, scheduled as described in the Procfile; each product is one "
+        "indexed UPDATE however many accounts are due."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--as-of', help="Mature accounts due on or before this date (YYYY-MM-DD), default today")
+        parser.add_argument('--dry-run', action='store_true', help="Count the accounts due without updating them")
+
+    def handle(self, *args, **options):
+        if options['as_of']:
+            try:
+                as_of = date.fromisoformat(options['as_of'])
+            except ValueError:
+                raise CommandError(f"Invalid --as-of date {options['as_of']!r}; use YYYY-MM-DD")
+        else:
+            as_of = timezone.localdate()
+
+        moved = process_maturities(as_of, dry_run=options['dry_run'])
+
+        action = "due" if options['dry_run'] else "matured"
+        for label, count in moved.items():
+            self.stdout.write(f"  {label}: {count:,} {action}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{sum(moved.values()):,} account(s) {action} as of {as_of}."
+        ))
@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Exists, OuterRef, Subquery
+
+from mcs.models import SavingsMemberState, SavingsTransaction, UserProfile, weeks_before
+
+
+class Command(BaseCommand):
+    help = "Repopulate the 52 WSC member state snapshot from the SavingsTransaction ledger"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows written per bulk upsert")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        latest = SavingsTransaction.objects.filter(
+            user_profile=OuterRef('pk')
+        ).order_by('-date_saved', '-pk')
+
+        # One grouped query: each saver's transaction count plus their latest row's state
+        members = UserProfile.objects.annotate(
+            transaction_count=Count('savings_transactions'),
+        ).filter(transaction_count__gt=0).annotate(
+            latest_cumulative_total=Subquery(latest.values('cumulative_total')[:1]),
+            latest_next_week=Subquery(latest.values('next_week')[:1]),
+            latest_remaining_balance=Subquery(latest.values('remaining_balance')[:1]),
+            latest_date_saved=Subquery(latest.values('date_saved')[:1]),
+        ).values(
+            'pk', 'transaction_count', 'latest_cumulative_total', 'latest_next_week',
+            'latest_remaining_balance', 'latest_date_saved',
+        ).order_by('pk')
+
+        written = 0
+        with transaction.atomic():
+            batch = []
+            for member in members.iterator(chunk_size=batch_size):
+                batch.append(SavingsMemberState(
+                    user_profile_id=member['pk'],
+                    cumulative_total=member['latest_cumulative_total'],
+                    next_week=member['latest_next_week'],
+                    remaining_balance=member['latest_remaining_balance'],
+                    covered_weeks_mask=weeks_before(member['latest_next_week']),
+                    transaction_count=member['transaction_count'],
+                    last_saved_at=member['latest_date_saved'],
+                ))
+                if len(batch) >= batch_size:
+                    written += self._write(batch)
+                    batch = []
+            if batch:
+                written += self._write(batch)
+
+            # Members whose ledger has been emptied no longer have a state
+            removed, _ = SavingsMemberState.objects.filter(
+                ~Exists(SavingsTransaction.objects.filter(user_profile=OuterRef('user_profile')))
+            ).delete()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt 52 WSC state for {written:,} member(s); removed {removed:,} stale row(s)."
+        ))
+
+    def _write(self, batch):
+        SavingsMemberState.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=['user_profile'],
+            update_fields=['cumulative_total', 'next_week', 'remaining_balance', 'covered_weeks_mask',
+                           'transaction_count', 'last_saved_at', 'updated_at'],
+        )
+        return len(batch)
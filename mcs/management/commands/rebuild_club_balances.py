@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from mcs.models import Club, ClubBalance
+
+
+class Command(BaseCommand):
+    help = "Repopulate the club balance snapshot from every club's transactions and fixed savings"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows written per bulk upsert")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        # One query: each club's ledger totals as correlated conditional aggregates
+        clubs = Club.objects.with_ledger_totals().values(
+            'pk', 'total_deposits', 'total_withdrawals', 'total_fixed_amount',
+        ).order_by('pk')
+
+        written = 0
+        with transaction.atomic():
+            batch = []
+            for club in clubs.iterator(chunk_size=batch_size):
+                batch.append(ClubBalance(
+                    club_id=club['pk'],
+                    total_deposits=club['total_deposits'],
+                    total_withdrawals=club['total_withdrawals'],
+                    total_fixed=club['total_fixed_amount'],
+                    available=club['total_deposits'] - club['total_withdrawals'] - club['total_fixed_amount'],
+                ))
+                if len(batch) >= batch_size:
+                    written += self._write(batch)
+                    batch = []
+            if batch:
+                written += self._write(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt the balance of {written:,} club(s)."))
+
+    def _write(self, batch):
+        ClubBalance.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=['club'],
+            update_fields=['total_deposits', 'total_withdrawals', 'total_fixed', 'available', 'updated_at'],
+        )
+        return len(batch)
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from mcs.models import ClubMonthlyRollup, ClubTransaction
+
+
+class Command(BaseCommand):
+    help = "Repopulate the monthly club rollups from the ClubTransaction ledger"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--club', type=int, action='append', help="Only rebuild this club id (repeatable)")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows written per bulk insert")
+
+    def handle(self, *args, **options):
+        transactions = ClubTransaction.objects.all()
+        rollups = ClubMonthlyRollup.objects.all()
+        if options['club']:
+            transactions = transactions.filter(club_id__in=options['club'])
+            rollups = rollups.filter(club_id__in=options['club'])
+
+        # One grouped query: every club's months, bucketed in local time like ClubMonthlyRollup.month_of
+        deposit = Q(transaction_type='deposit')
+        months = transactions.annotate(
+            month=TruncMonth('created_at', tzinfo=timezone.get_current_timezone()),
+        ).order_by().values('club_id', 'month').annotate(
+            deposits=Sum('amount', filter=deposit),
+            withdrawals=Sum('amount', filter=Q(transaction_type='withdrawal')),
+            transaction_count=Count('pk'),
+            contributor_count=Count('user_profile', filter=deposit, distinct=True),
+        )
+
+        with transaction.atomic():
+            removed, _ = rollups.delete()
+            written = ClubMonthlyRollup.objects.bulk_create([
+                ClubMonthlyRollup(
+                    club_id=row['club_id'],
+                    month=timezone.localtime(row['month']).date(),
+                    deposits=row['deposits'] or 0,
+                    withdrawals=row['withdrawals'] or 0,
+                    transaction_count=row['transaction_count'],
+                    contributor_count=row['contributor_count'],
+                )
+                for row in months.iterator(chunk_size=options['batch_size'])
+            ], batch_size=options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {len(written):,} monthly rollup(s); replaced {removed:,} existing row(s)."
+        ))
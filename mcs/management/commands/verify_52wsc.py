@@ -0,0 +1,170 @@
+import os
+import time
+from decimal import Decimal
+from itertools import groupby
+from multiprocessing import Pool
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+
+from mcs.models import SavingsMemberState, SavingsTransaction, encode_weeks, weeks_before
+from mcs.views import evaluate_deposit_chain
+
+LEDGER_FIELDS = ['covered_weeks_mask', 'next_week', 'remaining_balance', 'cumulative_total']
+STATE_FIELDS = ['cumulative_total', 'next_week', 'remaining_balance', 'covered_weeks_mask', 'transaction_count', 'last_saved_at', 'updated_at']
+
+
+def _cents(value):
+    return Decimal(str(value)).quantize(Decimal('0.01'))
+
+
+def _init_worker():
+    # Workers started with "spawn" (macOS, Windows) begin with an unconfigured Django
+    django.setup()
+
+
+def verify_shard(first_member, last_member, repair, batch_size):
+    """Replay every ledger for members first_member..last_member and compare with what is stored"""
+    rows = SavingsTransaction.objects.filter(
+        user_profile_id__gte=first_member, user_profile_id__lte=last_member
+    ).order_by('user_profile_id', 'date_saved', 'pk').values_list(
+        'pk', 'user_profile_id', 'amount', 'date_saved',
+        'covered_weeks_mask', 'next_week', 'remaining_balance', 'cumulative_total',
+    )
+    states = {
+        state.pk: state
+        for state in SavingsMemberState.objects.filter(pk__gte=first_member, pk__lte=last_member)
+    }
+
+    members = transactions = 0
+    drift = []
+    ledger_fixes, state_fixes = [], []
+    for member, ledger in groupby(rows.iterator(chunk_size=batch_size), key=lambda row: row[1]):
+        ledger = list(ledger)
+        members += 1
+        transactions += len(ledger)
+
+        drifted = []
+        results = evaluate_deposit_chain([row[2] for row in ledger])
+        for row, result in zip(ledger, results):
+            if (row[4] != encode_weeks(result['fully_covered_weeks'])
+                    or row[5] != result['next_week']
+                    or _cents(row[6]) != _cents(result['remaining_balance'])
+                    or _cents(row[7]) != _cents(result['cumulative_total'])):
+                drifted.append(row[0])
+                if repair:
+                    ledger_fixes.append(SavingsTransaction(
+                        pk=row[0],
+                        covered_weeks_mask=encode_weeks(result['fully_covered_weeks']),
+                        next_week=result['next_week'],
+                        remaining_balance=result['remaining_balance'],
+                        cumulative_total=result['cumulative_total'],
+                    ))
+
+        last = results[-1]
+        state = states.get(member)
+        state_drift = (
+            state is None
+            or state.next_week != last['next_week']
+            or _cents(state.remaining_balance) != _cents(last['remaining_balance'])
+            or _cents(state.cumulative_total) != _cents(last['cumulative_total'])
+            or state.covered_weeks_mask != weeks_before(last['next_week'])
+            or state.transaction_count != len(ledger)
+        )
+        if state_drift and repair:
+            state_fixes.append(SavingsMemberState(
+                user_profile_id=member,
+                cumulative_total=last['cumulative_total'],
+                next_week=last['next_week'],
+                remaining_balance=last['remaining_balance'],
+                covered_weeks_mask=weeks_before(last['next_week']),
+                transaction_count=len(ledger),
+                last_saved_at=ledger[-1][3],
+            ))
+        if drifted or state_drift:
+            drift.append((member, len(drifted), drifted[0] if drifted else None, state_drift))
+
+        if len(ledger_fixes) >= batch_size:
+            _write_fixes(ledger_fixes, [], batch_size)
+            ledger_fixes = []
+
+    if repair:
+        _write_fixes(ledger_fixes, state_fixes, batch_size)
+
+    return {'members': members, 'transactions': transactions, 'drift': drift}
+
+
+def _write_fixes(ledger_fixes, state_fixes, batch_size):
+    with transaction.atomic():
+        SavingsTransaction.objects.bulk_update(ledger_fixes, LEDGER_FIELDS, batch_size=batch_size)
+        SavingsMemberState.objects.bulk_create(
+            state_fixes,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['user_profile'],
+            update_fields=STATE_FIELDS,
+        )
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay every member's 52 WSC ledger and report transactions and member states whose "
+        "stored values differ from evaluate_deposit. Use --repair to write the replayed values."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Processes to shard members across")
+        parser.add_argument('--shards-per-worker', type=int, default=4, help="Smaller shards balance uneven ledgers")
+        parser.add_argument('--batch-size', type=int, default=2000, help="Rows fetched and written per batch")
+        parser.add_argument('--repair', action='store_true', help="Write replayed values for drifted rows")
+        parser.add_argument('--show', type=int, default=50, help="Drifted members listed in the report")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        member_ids = list(
+            SavingsTransaction.objects.order_by('user_profile_id').values_list('user_profile_id', flat=True).distinct()
+        )
+        if not member_ids:
+            self.stdout.write("No 52 WSC transactions to verify.")
+            return
+
+        # Contiguous id ranges let each shard stream its ledgers with one ordered query
+        shard_count = max(1, min(len(member_ids), options['workers'] * options['shards_per_worker']))
+        shard_size = -(-len(member_ids) // shard_count)
+        shards = [
+            (member_ids[i], member_ids[min(i + shard_size, len(member_ids)) - 1], options['repair'], options['batch_size'])
+            for i in range(0, len(member_ids), shard_size)
+        ]
+
+        if options['workers'] > 1:
+            # Forked workers must not share the parent's database connection
+            connections.close_all()
+            with Pool(options['workers'], initializer=_init_worker) as pool:
+                reports = pool.starmap(verify_shard, shards)
+        else:
+            reports = [verify_shard(*shard) for shard in shards]
+
+        members = sum(report['members'] for report in reports)
+        transactions = sum(report['transactions'] for report in reports)
+        drift = sorted(entry for report in reports for entry in report['drift'])
+        elapsed = time.perf_counter() - started
+
+        for member, rows, first_pk, state_drift in drift[:options['show']]:
+            details = []
+            if rows:
+                details.append(f"{rows} transaction(s) drifted, first #{first_pk}")
+            if state_drift:
+                details.append("member state out of date")
+            self.stdout.write(self.style.WARNING(f"  member {member}: {'; '.join(details)}"))
+        if len(drift) > options['show']:
+            self.stdout.write(self.style.WARNING(f"  ... and {len(drift) - options['show']:,} more member(s)"))
+
+        summary = (
+            f"Verified {transactions:,} transaction(s) for {members:,} member(s) across "
+            f"{len(shards)} shard(s) in {elapsed:.2f}s: {len(drift):,} member(s) with drift"
+        )
+        if drift and options['repair']:
+            summary += ", repaired"
+        style = self.style.SUCCESS if not drift or options['repair'] else self.style.ERROR
+        self.stdout.write(style(summary + "."))
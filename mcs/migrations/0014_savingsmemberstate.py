@@ -0,0 +1,30 @@
+# Generated by Django 5.1.7 on 2026-10-16 22:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mcs', '0013_goatfarminginvestment_receipt_number_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavingsMemberState',
+            fields=[
+                ('user_profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='savings_state', serialize=False, to='mcs.userprofile')),
+                ('cumulative_total', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('next_week', models.PositiveIntegerField(default=1)),
+                ('remaining_balance', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('transaction_count', models.PositiveIntegerField(default=0)),
+                ('last_saved_at', models.DateTimeField(blank=True, help_text="Date of the member's latest deposit", null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '52 WSC Member State',
+                'verbose_name_plural': '52 WSC Member States',
+            },
+        ),
+    ]
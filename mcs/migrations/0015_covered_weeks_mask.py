@@ -0,0 +1,67 @@
+# Generated by Django 5.1.7 on 2026-10-16 22:42
+
+from django.db import migrations, models
+
+
+def encode_covered_weeks(apps, schema_editor):
+    SavingsTransaction = apps.get_model('mcs', 'SavingsTransaction')
+    SavingsMemberState = apps.get_model('mcs', 'SavingsMemberState')
+
+    batch = []
+    for txn in SavingsTransaction.objects.only('pk', 'fully_covered_weeks').iterator(chunk_size=2000):
+        mask = 0
+        for week in txn.fully_covered_weeks or []:
+            mask |= 1 << (int(week) - 1)
+        if mask:
+            txn.covered_weeks_mask = mask
+            batch.append(txn)
+        if len(batch) >= 2000:
+            SavingsTransaction.objects.bulk_update(batch, ['covered_weeks_mask'])
+            batch = []
+    SavingsTransaction.objects.bulk_update(batch, ['covered_weeks_mask'])
+
+    # Weeks are covered in order, so a member has covered every week before next_week
+    states = list(SavingsMemberState.objects.only('pk', 'next_week'))
+    for state in states:
+        state.covered_weeks_mask = (1 << (min(max(state.next_week, 1), 53) - 1)) - 1
+    SavingsMemberState.objects.bulk_update(states, ['covered_weeks_mask'], batch_size=2000)
+
+
+def decode_covered_weeks(apps, schema_editor):
+    SavingsTransaction = apps.get_model('mcs', 'SavingsTransaction')
+
+    batch = []
+    for txn in SavingsTransaction.objects.only('pk', 'covered_weeks_mask').iterator(chunk_size=2000):
+        txn.fully_covered_weeks = [
+            week for week in range(1, 53) if txn.covered_weeks_mask >> (week - 1) & 1
+        ]
+        batch.append(txn)
+        if len(batch) >= 2000:
+            SavingsTransaction.objects.bulk_update(batch, ['fully_covered_weeks'])
+            batch = []
+    SavingsTransaction.objects.bulk_update(batch, ['fully_covered_weeks'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mcs', '0014_savingsmemberstate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='savingsmemberstate',
+            name='covered_weeks_mask',
+            field=models.BigIntegerField(default=0, help_text='Every week covered so far; week N is bit N-1'),
+        ),
+        migrations.AddField(
+            model_name='savingstransaction',
+            name='covered_weeks_mask',
+            field=models.BigIntegerField(default=0, help_text='Weeks fully covered by this deposit; week N is bit N-1'),
+        ),
+        migrations.RunPython(encode_covered_weeks, decode_covered_weeks),
+        migrations.RemoveField(
+            model_name='savingstransaction',
+            name='fully_covered_weeks',
+        ),
+    ]
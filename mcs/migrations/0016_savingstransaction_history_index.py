@@ -0,0 +1,17 @@
+# Generated by Django 5.1.7 on 2026-10-16 22:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mcs', '0015_covered_weeks_mask'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='savingstransaction',
+            index=models.Index(fields=['user_profile', '-date_saved', '-id'], name='mcs_savings_history_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.7 on 2026-10-16 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mcs', '0016_savingstransaction_history_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='savingsmemberstate',
+            index=models.Index(fields=['-cumulative_total'], name='mcs_savings_state_total_idx'),
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:05
+
+import datetime
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def store_maturity(apps, schema_editor):
+    today = timezone.localdate()
+    for model_name, start_field in (('Investment', 'date_invested'), ('ClubFixedSavings', 'date_fixed')):
+        model = apps.get_model('mcs', model_name)
+        batch = []
+        for account in model.objects.only('pk', start_field, 'maturity_months').iterator(chunk_size=2000):
+            account.maturity_date = getattr(account, start_field) + datetime.timedelta(days=30 * account.maturity_months)
+            account.status = 'matured' if today >= account.maturity_date else 'active'
+            batch.append(account)
+            if len(batch) >= 2000:
+                model.objects.bulk_update(batch, ['maturity_date', 'status'])
+                batch = []
+        model.objects.bulk_update(batch, ['maturity_date', 'status'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mcs', '0017_savingsmemberstate_total_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='clubfixedsavings',
+            name='maturity_date',
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='clubfixedsavings',
+            name='status',
+            field=models.CharField(choices=[('active', 'Active'), ('matured', 'Matured')], default='active', editable=False, help_text='Moved to matured on save or by the process_maturities command', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='investment',
+            name='maturity_date',
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='investment',
+            name='status',
+            field=models.CharField(choices=[('active', 'Active'), ('matured', 'Matured')], default='active', editable=False, help_text='Moved to matured on save or by the process_maturities command', max_length=20),
+        ),
+        migrations.RunPython(store_maturity, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='clubfixedsavings',
+            name='maturity_date',
+            field=models.DateField(editable=False),
+        ),
+        migrations.AlterField(
+            model_name='investment',
+            name='maturity_date',
+            field=models.DateField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='clubfixedsavings',
+            index=models.Index(fields=['status', 'maturity_date'], name='mcs_clubfixed_maturity_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='individualuserfixedsavings',
+            index=models.Index(fields=['account_status', 'maturity_date'], name='mcs_iufs_maturity_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='investment',
+            index=models.Index(fields=['status', 'maturity_date'], name='mcs_investment_maturity_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:40
+
+from decimal import Decimal, ROUND_HALF_EVEN
+
+from django.db import migrations
+
+PERIODS = {'monthly': 12, 'quarterly': 4, 'annually': 1}
+
+
+def compound_expected_interest(apps, schema_editor):
+    # Same formula as mcs.interest.growth_factors at maturity, frozen here
+    IndividualUserFixedSavings = apps.get_model('mcs', 'IndividualUserFixedSavings')
+    accounts = IndividualUserFixedSavings.objects.filter(
+        principal_amount__gt=0, interest_rate__gt=0, maturity_period__gt=0,
+    ).only('pk', 'principal_amount', 'interest_rate', 'maturity_period', 'compounding_frequency')
+    batch = []
+    for account in accounts.iterator(chunk_size=2000):
+        periods = PERIODS.get(account.compounding_frequency, 12)
+        period_days = 360 // periods
+        periodic_rate = account.interest_rate / 100 / periods
+        days = account.maturity_period * 30
+        whole_periods = days // period_days
+        growth = (1 + periodic_rate) ** whole_periods * (
+            1 + periodic_rate * (days - whole_periods * period_days) / period_days
+        )
+        account.expected_interest = (account.principal_amount * Decimal(growth - 1)).quantize(
+            Decimal('0.01'), rounding=ROUND_HALF_EVEN,
+        )
+        account.matured_amount = account.principal_amount + account.expected_interest
+        batch.append(account)
+        if len(batch) >= 2000:
+            IndividualUserFixedSavings.objects.bulk_update(batch, ['expected_interest', 'matured_amount'])
+            batch = []
+    IndividualUserFixedSavings.objects.bulk_update(batch, ['expected_interest', 'matured_amount'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mcs', '0018_maturity_state'),
+    ]
+
+    operations = [
+        migrations.RunPython(compound_expected_interest, migrations.RunPython.noop),
+    ]
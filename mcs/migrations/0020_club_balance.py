@@ -0,0 +1,29 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mcs', '0019_compound_expected_interest'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClubBalance',
+            fields=[
+                ('club', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='balance', serialize=False, to='mcs.club')),
+                ('total_deposits', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('total_withdrawals', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('total_fixed', models.DecimalField(decimal_places=2, default=0, help_text='Active fixed savings', max_digits=14)),
+                ('available', models.DecimalField(decimal_places=2, default=0, help_text='Deposits less withdrawals and fixed savings', max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Club Balance',
+                'verbose_name_plural': 'Club Balances',
+            },
+        ),
+    ]
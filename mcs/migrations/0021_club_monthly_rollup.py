@@ -0,0 +1,65 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_rollups(apps, schema_editor):
+    ClubTransaction = apps.get_model('mcs', 'ClubTransaction')
+    ClubMonthlyRollup = apps.get_model('mcs', 'ClubMonthlyRollup')
+    months = {}
+    rows = ClubTransaction.objects.order_by().values_list(
+        'club_id', 'user_profile_id', 'transaction_type', 'amount', 'created_at',
+    )
+    for club_id, user_profile_id, transaction_type, amount, created_at in rows.iterator(chunk_size=2000):
+        month = timezone.localtime(created_at).date().replace(day=1)
+        rollup = months.setdefault((club_id, month), {'deposits': 0, 'withdrawals': 0, 'count': 0, 'contributors': set()})
+        rollup['count'] += 1
+        if transaction_type == 'deposit':
+            rollup['deposits'] += amount
+            if user_profile_id:
+                rollup['contributors'].add(user_profile_id)
+        else:
+            rollup['withdrawals'] += amount
+
+    ClubMonthlyRollup.objects.bulk_create([
+        ClubMonthlyRollup(
+            club_id=club_id,
+            month=month,
+            deposits=rollup['deposits'],
+            withdrawals=rollup['withdrawals'],
+            transaction_count=rollup['count'],
+            contributor_count=len(rollup['contributors']),
+        )
+        for (club_id, month), rollup in months.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mcs', '0020_club_balance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClubMonthlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='First day of the month, in local time')),
+                ('deposits', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('withdrawals', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('transaction_count', models.PositiveIntegerField(default=0)),
+                ('contributor_count', models.PositiveIntegerField(default=0, help_text='Members who made a deposit')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('club', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_rollups', to='mcs.club')),
+            ],
+            options={
+                'verbose_name': 'Club Monthly Rollup',
+                'verbose_name_plural': 'Club Monthly Rollups',
+                'constraints': [models.UniqueConstraint(fields=('club', 'month'), name='mcs_club_month_rollup_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mcs', '0021_club_monthly_rollup'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='clubtransaction',
+            index=models.Index(fields=['club', '-created_at', '-id'], name='mcs_club_ledger_idx'),
+        ),
+    ]
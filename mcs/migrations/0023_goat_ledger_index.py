@@ -0,0 +1,17 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mcs', '0022_club_ledger_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='goatfarmingtransaction',
+            index=models.Index(fields=['investment', '-created_at', '-id'], name='mcs_goat_ledger_idx'),
+        ),
+    ]
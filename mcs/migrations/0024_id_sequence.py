@@ -0,0 +1,25 @@
+# Generated by Django 5.1.7 on 2026-10-16 23:20
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mcs', '0023_goat_ledger_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdSequence',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('last_value', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AlterModelOptions(
+            name='goat',
+            options={'ordering': [django.db.models.functions.text.Length('goat_id'), 'goat_id'], 'verbose_name': 'Goat', 'verbose_name_plural': 'Goats'},
+        ),
+    ]
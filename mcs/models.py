@@ -1,12 +1,13 @@
 from django.db import models
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.db.models.functions import Cast, Coalesce, Floor, Greatest, Least, Length, Power, Rank, Round, TruncMonth
 from django.dispatch import receiver
 from phonenumber_field.modelfields import PhoneNumberField  # Optional, see notes
 from django.db import transaction  # Add this import
 from django.utils import timezone
 from decimal import Decimal
-from datetime import timedelta
+from datetime import datetime, timedelta
 from datetime import date
 import json
 
@@ -57,6 +58,87 @@ class UserProfile(models.Model):
 
 
 #52Weeks Savings Model Structure
+def encode_weeks(weeks):
+    """Pack week numbers (1-52) into a bitmask where week N is bit N-1"""
+    mask = 0
+    for week in weeks:
+        mask |= 1 << (week - 1)
+    return mask
+
+
+def decode_weeks(mask):
+    """Unpack a week bitmask into the sorted list of week numbers it covers"""
+    return [week for week in range(1, 53) if mask >> (week - 1) & 1]
+
+
+def weeks_before(next_week):
+    """Bitmask of every week before next_week, i.e. all weeks a member has covered so far"""
+    return (1 << (min(max(next_week, 1), 53) - 1)) - 1
+
+
+# Total of all 52 weekly targets (10,000 + 20,000 + ... + 520,000 UGX)
+WSC_TARGET_AMOUNT = 13780000
+
+
+class WeekCoverageQuerySet(models.QuerySet):
+    """Week coverage filters evaluated in SQL on a covered_weeks_mask column"""
+
+    def covering_week(self, week):
+        return self.alias(
+            week_bit=models.F('covered_weeks_mask').bitand(1 << (week - 1))
+        ).filter(week_bit__gt=0)
+
+    def week_coverage(self):
+        """Number of rows covering each week, as {week: count}, from a single aggregate query"""
+        totals = self.aggregate(**{
+            f'week_{week}': models.Sum(models.F('covered_weeks_mask').bitrightshift(week - 1).bitand(1))
+            for week in range(1, 53)
+        })
+        return {week: totals[f'week_{week}'] or 0 for week in range(1, 53)}
+
+
+class SavingsMemberStateQuerySet(WeekCoverageQuerySet):
+    """Programme-wide 52 WSC rankings computed in SQL from the member state snapshot"""
+
+    def leaderboard(self):
+        """
+        Members ranked by amount saved; ties share a rank and the next rank is skipped.
+
+        Members are prefetched rather than joined so the window only sorts this table.
+        """
+        return self.prefetch_related('user_profile__user').annotate(
+            rank=models.Window(Rank(), order_by=models.F('cumulative_total').desc()),
+        ).order_by('rank', 'pk')
+
+    def cohorts(self):
+        """Members, savings and completions grouped by the month members joined, oldest first"""
+        return self.annotate(
+            cohort=TruncMonth('user_profile__created_at'),
+        ).values('cohort').annotate(
+            members=models.Count('pk'),
+            total_saved=models.Sum('cumulative_total'),
+            average_saved=models.Avg('cumulative_total'),
+            average_week=models.Avg('next_week'),
+            completed=models.Count('pk', filter=models.Q(next_week__gt=52)),
+        ).order_by('cohort')
+
+    def percentile_bands(self, percentiles=(10, 25, 50, 75, 90)):
+        """
+        Amount saved at each percentile, as {percentile: amount}, using the nearest-rank value.
+
+        Each band is a single ordered row fetched by offset from the cumulative_total index,
+        which works on every backend, unlike PERCENTILE_CONT.
+        """
+        ordered = self.order_by('cumulative_total').values_list('cumulative_total', flat=True)
+        count = self.count()
+        if not count:
+            return {}
+        return {
+            percentile: ordered[(percentile * (count - 1)) // 100]
+            for percentile in percentiles
+        }
+
+
 class SavingsTransaction(models.Model):
     user_profile = models.ForeignKey(UserProfile, on_delete=models.CASCADE, related_name='savings_transactions')
     amount = models.PositiveIntegerField(default=0)
@@ -64,29 +146,232 @@ class SavingsTransaction(models.Model):
     date_saved = models.DateTimeField(default=timezone.now)
     
     cumulative_total = models.DecimalField(max_digits=10, decimal_places=2, default=0)
-    fully_covered_weeks = models.JSONField(default=list) 
+    covered_weeks_mask = models.BigIntegerField(default=0, help_text="Weeks fully covered by this deposit; week N is bit N-1")
     next_week = models.PositiveIntegerField(default=1)
     remaining_balance = models.DecimalField(max_digits=10, decimal_places=2, default=0)
 
+    objects = WeekCoverageQuerySet.as_manager()
+
     class Meta:
         db_table = "tgfs_savingstransaction"
         ordering = ['-date_saved']
+        indexes = [
+            # Serves the member's history newest-first and its keyset pagination
+            models.Index(fields=['user_profile', '-date_saved', '-id'], name='mcs_savings_history_idx'),
+        ]
         verbose_name = "52 WSC Savings Transaction"
         verbose_name_plural = "52 WSC Savings Transactions"
 
+    @property
+    def fully_covered_weeks(self):
+        return decode_weeks(self.covered_weeks_mask)
+
+    @fully_covered_weeks.setter
+    def fully_covered_weeks(self, weeks):
+        self.covered_weeks_mask = encode_weeks(weeks)
+
     def __str__(self):
         return f"{self.user_profile.user.username} - {self.amount} on {self.date_saved.date()}"
 
+
+class SavingsMemberState(models.Model):
+    """Current 52 WSC position of a member, kept in step with their SavingsTransaction ledger"""
+    user_profile = models.OneToOneField(UserProfile, on_delete=models.CASCADE, primary_key=True, related_name='savings_state')
+    cumulative_total = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    next_week = models.PositiveIntegerField(default=1)
+    remaining_balance = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    covered_weeks_mask = models.BigIntegerField(default=0, help_text="Every week covered so far; week N is bit N-1")
+    transaction_count = models.PositiveIntegerField(default=0)
+    last_saved_at = models.DateTimeField(null=True, blank=True, help_text="Date of the member's latest deposit")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = SavingsMemberStateQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "52 WSC Member State"
+        verbose_name_plural = "52 WSC Member States"
+        indexes = [
+            models.Index(fields=['-cumulative_total'], name='mcs_savings_state_total_idx'),
+        ]
+
+    @classmethod
+    def refresh_for(cls, user_profile_id):
+        """Recalculate a member's state from the last transaction in their ledger"""
+        ledger = SavingsTransaction.objects.filter(user_profile_id=user_profile_id)
+        latest = ledger.order_by('-date_saved', '-pk').first()
+        if latest is None:
+            cls.objects.filter(pk=user_profile_id).delete()
+            return None
+
+        state, _ = cls.objects.update_or_create(
+            user_profile_id=user_profile_id,
+            defaults={
+                'cumulative_total': latest.cumulative_total,
+                'next_week': latest.next_week,
+                'remaining_balance': latest.remaining_balance,
+                'covered_weeks_mask': weeks_before(latest.next_week),
+                'transaction_count': ledger.count(),
+                'last_saved_at': latest.date_saved,
+            }
+        )
+        return state
+
+    @classmethod
+    def for_profile(cls, user_profile):
+        """Current state for a member; ledgers not yet materialized are built on first read"""
+        state = cls.objects.filter(pk=user_profile.pk).first()
+        if state is None:
+            state = cls.refresh_for(user_profile.pk)
+        return state
+
+    @property
+    def fully_covered_weeks(self):
+        return decode_weeks(self.covered_weeks_mask)
+
+    @property
+    def progress_percentage(self):
+        return round(float(self.cumulative_total) / WSC_TARGET_AMOUNT * 100, 2)
+
+    def __str__(self):
+        return f"{self.user_profile.user.username} - week {self.next_week}, UGX {self.cumulative_total:,.0f} saved"
+
+class DaysBetween(models.Func):
+    """Whole days from start to end, for two DateField expressions"""
+    arity = 2
+    output_field = models.IntegerField()
+
+    def as_sql(self, compiler, connection, **extra_context):
+        # PostgreSQL subtracts dates to an integer number of days
+        return super().as_sql(compiler, connection, template='(%(expressions)s)', arg_joiner=' - ', **extra_context)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler, connection,
+            template='CAST(julianday(%(expressions)s) AS INTEGER)', arg_joiner=') - julianday(',
+            **extra_context,
+        )
+
+
+class AddDays(models.Func):
+    """A DateField expression moved forward by an integer expression of days"""
+    arity = 2
+    output_field = models.DateField()
+
+    def as_sql(self, compiler, connection, **extra_context):
+        return super().as_sql(compiler, connection, template='(%(expressions)s)', arg_joiner=' + ', **extra_context)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return super().as_sql(
+            compiler, connection,
+            template="date(%(expressions)s || ' days')", arg_joiner=", '+' || ",
+            **extra_context,
+        )
+
+
+class CompoundGrowth:
+    """
+    SQL counterpart of mcs.interest.growth_factors: growth of 1 UGX after a number of days,
+    for a rate field and a compounding frequency field of the same row
+    """
+
+    def __init__(self, rate, frequency_field):
+        from .interest import COMPOUNDING_PERIODS
+
+        periods = models.Case(
+            *(models.When(**{frequency_field: frequency}, then=models.Value(float(count)))
+              for frequency, count in COMPOUNDING_PERIODS.items() if frequency != 'monthly'),
+            default=models.Value(float(COMPOUNDING_PERIODS['monthly'])),
+            output_field=models.FloatField(),
+        )
+        self.period_days = 360.0 / periods
+        self.periodic_rate = rate / 100.0 / periods
+
+    def at(self, days):
+        whole_periods = Floor(days / self.period_days)
+        return Power(1 + self.periodic_rate, whole_periods) * (
+            1 + self.periodic_rate * (days - whole_periods * self.period_days) / self.period_days
+        )
+
+
+class FixedTermQuerySet(models.QuerySet):
+    """Interest and maturity of fixed-term products as database expressions, so they can be sorted and filtered"""
+
+    def with_interest(self, as_of=None):
+        """
+        Annotate annotated_maturity_date, annotated_expected_interest and annotated_accrued_interest.
+
+        The formulas are those of mcs.interest for this product, compounded for products with a
+        compounding frequency. The database rounds half away from zero, so a value on a half cent can be one cent above
+        what mcs.interest (half-even) returns.
+        """
+        from .interest import PRODUCTS
+
+        product = PRODUCTS[self.model._meta.label]
+        principal_field, rate_field, term_field, start_field = product['fields']
+        principal = Cast(principal_field, models.FloatField())
+        rate = models.F(rate_field)
+        term = models.F(term_field)
+
+        elapsed = DaysBetween(models.Value(as_of or timezone.now().date()), start_field)
+        days = Least(elapsed, term * 30)
+        if product['clamp_before_start']:
+            days = Greatest(days, models.Value(0))
+        # LEAST/GREATEST skip NULLs on PostgreSQL, so a missing start date is ruled out here
+        days = models.Case(
+            models.When(**{f'{term_field}__gt': 0, f'{start_field}__isnull': False}, then=days),
+            default=models.Value(0),
+        )
+
+        if product.get('compounding_field'):
+            growth = CompoundGrowth(rate, product['compounding_field'])
+            expected = principal * (growth.at(term * 30) - 1)
+            accrued = principal * (growth.at(days) - 1)
+        else:
+            # Grouped like the properties: principal * (rate / 100 / 365) * days
+            expected = principal * (rate / 100) * (term / 12.0)
+            accrued = principal * (rate / 100 / 365) * days
+        if product['positive_only']:
+            accrued = models.Case(
+                models.When(**{f'{principal_field}__gt': 0, f'{rate_field}__gt': 0}, then=accrued),
+                default=models.Value(0.0),
+            )
+
+        money = models.DecimalField(max_digits=14, decimal_places=2)
+        return self.annotate(
+            annotated_maturity_date=AddDays(start_field, term * 30),
+            annotated_expected_interest=Cast(Round(expected, 2), money),
+            annotated_accrued_interest=Cast(Round(accrued, 2), money),
+        )
+
+
+MATURITY_STATUS_CHOICES = [('active', 'Active'), ('matured', 'Matured')]
+
+
+def maturity_for(start, months):
+    """Maturity date (30-day months) and active/matured status of a fixed term starting on start"""
+    if isinstance(start, datetime):
+        start = start.date()
+    maturity_date = start + timedelta(days=30 * months)
+    return maturity_date, 'matured' if timezone.localdate() >= maturity_date else 'active'
+
+
 class Investment(models.Model):
     user_profile = models.ForeignKey(UserProfile, on_delete=models.CASCADE, related_name='investments')
     amount_invested = models.DecimalField(max_digits=12, decimal_places=2)
     interest_rate = models.FloatField(help_text="Annual interest rate (e.g., 12.5 for 12.5%)")
     maturity_months = models.PositiveIntegerField(default=8)
     date_invested = models.DateField(default=timezone.now)
+    maturity_date = models.DateField(editable=False)
+    status = models.CharField(
+        max_length=20, choices=MATURITY_STATUS_CHOICES, default='active', editable=False,
+        help_text="Moved to matured on save or by the process_maturities command",
+    )
 
-    @property
-    def maturity_date(self):
-        return self.date_invested + timedelta(days=30 * self.maturity_months)
+    objects = FixedTermQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        self.maturity_date, self.status = maturity_for(self.date_invested, self.maturity_months)
+        super().save(*args, **kwargs)
 
     @property
     def interest_expected(self):
@@ -113,8 +398,82 @@ class Investment(models.Model):
     class Meta:
         verbose_name = "52 WSC Investment"
         verbose_name_plural = "52 WSC Investments"
+        indexes = [
+            models.Index(fields=['status', 'maturity_date'], name='mcs_investment_maturity_idx'),
+        ]
 
 #Club Model Structure
+def month_bounds(year=None, month=None):
+    """Start of the given month (this month by default) and of the next, in the current timezone"""
+    now = timezone.localtime()
+    start = now.replace(year=year or now.year, month=month or now.month, day=1, hour=0, minute=0, second=0, microsecond=0)
+    next_start = (start + timedelta(days=32)).replace(day=1)
+    # Re-localise so a month spanning a DST change keeps the right offset
+    return timezone.make_aware(start.replace(tzinfo=None)), timezone.make_aware(next_start.replace(tzinfo=None))
+
+
+def _correlated_aggregate(rows, aggregate, default=0):
+    """
+    Subquery computing aggregate over rows, which must be filtered on OuterRef to a single
+    club; default (0) when there are none, or None to keep NULL
+    """
+    subquery = models.Subquery(rows.order_by().values('club').annotate(value=aggregate).values('value'))
+    if default is None:
+        return subquery
+    return Coalesce(subquery, models.Value(default), output_field=aggregate.output_field)
+
+
+def _club_total(model, aggregate):
+    """Correlated subquery computing aggregate over model's rows for the outer club, 0 when none"""
+    return _correlated_aggregate(model.objects.filter(club=models.OuterRef('pk')), aggregate)
+
+
+MONEY = models.DecimalField(max_digits=14, decimal_places=2)
+
+
+def _club_transactions_total(condition):
+    return _club_total(ClubTransaction, models.Sum('amount', filter=condition, output_field=MONEY))
+
+
+class ClubQuerySet(models.QuerySet):
+    def with_ledger_totals(self):
+        """Annotate all-time total_deposits, total_withdrawals and total_fixed_amount (active fixed savings)"""
+        return self.annotate(
+            total_deposits=_club_transactions_total(models.Q(transaction_type='deposit')),
+            total_withdrawals=_club_transactions_total(models.Q(transaction_type='withdrawal')),
+            total_fixed_amount=_club_total(ClubFixedSavings, models.Sum(
+                'amount_fixed', filter=models.Q(is_active=True), output_field=MONEY,
+            )),
+        )
+
+    def with_summary(self, year=None, month=None):
+        """
+        Annotate the totals shown on club dashboards and the admin, in the same query.
+
+        with_ledger_totals, plus monthly_deposits, monthly_withdrawals and
+        monthly_contributors (for the given month, this month by default, read from
+        ClubMonthlyRollup), recent_transaction_count (last 30 days), active_members and
+        total_members. Each related table is read with conditional Sum/Count filters, so a
+        page of clubs still costs one query.
+        """
+        month_start, _ = month_bounds(year, month)
+        rollup = ClubMonthlyRollup.objects.filter(club=models.OuterRef('pk'), month=month_start.date())
+
+        def monthly(field, output_field):
+            return Coalesce(models.Subquery(rollup.values(field)[:1]), models.Value(0), output_field=output_field)
+
+        return self.with_ledger_totals().annotate(
+            monthly_deposits=monthly('deposits', MONEY),
+            monthly_withdrawals=monthly('withdrawals', MONEY),
+            monthly_contributors=monthly('contributor_count', models.IntegerField()),
+            recent_transaction_count=_club_total(ClubTransaction, models.Count(
+                'pk', filter=models.Q(created_at__gte=timezone.now() - timedelta(days=30)),
+            )),
+            active_members=_club_total(ClubMembership, models.Count('pk', filter=models.Q(is_active=True))),
+            total_members=_club_total(ClubMembership, models.Count('pk')),
+        )
+
+
 class Club(models.Model):
     name = models.CharField(max_length=100, unique=True)
     description = models.TextField(blank=True, null=True)
@@ -122,20 +481,24 @@ class Club(models.Model):
     last_updated = models.DateTimeField(auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ClubQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
+    @property
+    def summary(self):
+        """This club's with_summary annotations, read from self when it was loaded with them"""
+        if hasattr(self, 'total_deposits'):
+            return self
+        if not hasattr(self, '_summary'):
+            self._summary = Club.objects.with_summary().get(pk=self.pk)
+        return self._summary
+
     def get_monthly_collection(self, year=None, month=None):
-        from django.utils import timezone
         if year is None or month is None:
-            now = timezone.now()
-            year = now.year
-            month = now.month
-        return self.transactions.filter(
-            transaction_type='deposit',
-            created_at__year=year,
-            created_at__month=month
-        ).aggregate(total=models.Sum('amount'))['total'] or 0
+            return self.summary.monthly_deposits
+        return Club.objects.with_summary(year, month).get(pk=self.pk).monthly_deposits
 
     def get_monthly_progress(self, year=None, month=None):
         if self.monthly_target <= 0:
@@ -143,12 +506,204 @@ class Club(models.Model):
         collection = self.get_monthly_collection(year, month)
         return min((collection / self.monthly_target) * 100, 100)
 
+    @property
+    def total_savings(self):
+        return self.summary.total_deposits - self.summary.total_withdrawals
+
     @property
     def available_savings(self):
-        deposits = self.transactions.filter(transaction_type='deposit').aggregate(total=models.Sum('amount'))['total'] or 0
-        withdrawals = self.transactions.filter(transaction_type='withdrawal').aggregate(total=models.Sum('amount'))['total'] or 0
-        fixed = self.fixed_savings.filter(is_active=True).aggregate(total=models.Sum('amount_fixed'))['total'] or 0
-        return deposits - withdrawals - fixed
+        if hasattr(self, 'total_fixed_amount'):
+            return self.total_savings - self.total_fixed_amount
+        return ClubBalance.for_club(self).available
+
+
+class ClubBalance(models.Model):
+    """Running totals of a club's ledger, kept in step with its transactions and fixed savings"""
+    club = models.OneToOneField(Club, on_delete=models.CASCADE, primary_key=True, related_name='balance')
+    total_deposits = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    total_withdrawals = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    total_fixed = models.DecimalField(max_digits=14, decimal_places=2, default=0, help_text="Active fixed savings")
+    available = models.DecimalField(max_digits=14, decimal_places=2, default=0, help_text="Deposits less withdrawals and fixed savings")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Club Balance"
+        verbose_name_plural = "Club Balances"
+
+    @classmethod
+    def refresh_for(cls, club_id):
+        """Recalculate a club's balance from its whole ledger"""
+        totals = Club.objects.filter(pk=club_id).with_ledger_totals().values(
+            'total_deposits', 'total_withdrawals', 'total_fixed_amount',
+        ).first()
+        if totals is None:
+            return None
+
+        balance, _ = cls.objects.update_or_create(
+            club_id=club_id,
+            defaults={
+                'total_deposits': totals['total_deposits'],
+                'total_withdrawals': totals['total_withdrawals'],
+                'total_fixed': totals['total_fixed_amount'],
+                'available': totals['total_deposits'] - totals['total_withdrawals'] - totals['total_fixed_amount'],
+            }
+        )
+        return balance
+
+    @classmethod
+    def for_club(cls, club, lock=False):
+        """Current balance of a club, locked for update if asked; built from the ledger on first read"""
+        balances = cls.objects.select_for_update() if lock else cls.objects
+        balance = balances.filter(pk=club.pk).first()
+        if balance is None:
+            balance = cls.refresh_for(club.pk)
+        return balance
+
+    @classmethod
+    def apply(cls, club_id, deposits=0, withdrawals=0, fixed=0):
+        """Add amounts to a club's running totals in one UPDATE, building the row if it is missing"""
+        updated = cls.objects.filter(pk=club_id).update(
+            total_deposits=models.F('total_deposits') + deposits,
+            total_withdrawals=models.F('total_withdrawals') + withdrawals,
+            total_fixed=models.F('total_fixed') + fixed,
+            available=models.F('available') + deposits - withdrawals - fixed,
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            # The ledger already holds the row being applied
+            cls.refresh_for(club_id)
+
+    def __str__(self):
+        return f"{self.club.name} - UGX {self.available:,.0f} available"
+
+
+class ClubMonthlyRollup(models.Model):
+    """A club's deposits, withdrawals and contributors in one calendar month, kept in step with its transactions"""
+    club = models.ForeignKey(Club, on_delete=models.CASCADE, related_name='monthly_rollups')
+    month = models.DateField(help_text="First day of the month, in local time")
+    deposits = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    withdrawals = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    transaction_count = models.PositiveIntegerField(default=0)
+    contributor_count = models.PositiveIntegerField(default=0, help_text="Members who made a deposit")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Club Monthly Rollup"
+        verbose_name_plural = "Club Monthly Rollups"
+        constraints = [
+            models.UniqueConstraint(fields=['club', 'month'], name='mcs_club_month_rollup_unique'),
+        ]
+
+    @staticmethod
+    def month_of(moment):
+        """First day of the local calendar month moment falls in"""
+        return timezone.localtime(moment).date().replace(day=1)
+
+    @classmethod
+    def refresh_for(cls, club_id, month):
+        """Recalculate one month of a club from its transactions"""
+        month_start, next_month = month_bounds(month.year, month.month)
+        deposit = models.Q(transaction_type='deposit')
+        totals = ClubTransaction.objects.filter(
+            club_id=club_id, created_at__gte=month_start, created_at__lt=next_month,
+        ).aggregate(
+            deposits=models.Sum('amount', filter=deposit),
+            withdrawals=models.Sum('amount', filter=models.Q(transaction_type='withdrawal')),
+            transaction_count=models.Count('pk'),
+            contributor_count=models.Count('user_profile', filter=deposit, distinct=True),
+        )
+        if not totals['transaction_count']:
+            cls.objects.filter(club_id=club_id, month=month).delete()
+            return None
+
+        rollup, _ = cls.objects.update_or_create(
+            club_id=club_id,
+            month=month,
+            defaults={
+                'deposits': totals['deposits'] or 0,
+                'withdrawals': totals['withdrawals'] or 0,
+                'transaction_count': totals['transaction_count'],
+                'contributor_count': totals['contributor_count'],
+            }
+        )
+        return rollup
+
+    @classmethod
+    def record(cls, club_transaction):
+        """Add a newly created transaction to its month in one UPDATE, building the row if it is missing"""
+        month = cls.month_of(club_transaction.created_at)
+        is_deposit = club_transaction.transaction_type == 'deposit'
+        new_contributor = False
+        if is_deposit and club_transaction.user_profile_id:
+            month_start, next_month = month_bounds(month.year, month.month)
+            new_contributor = not ClubTransaction.objects.filter(
+                club_id=club_transaction.club_id,
+                user_profile_id=club_transaction.user_profile_id,
+                transaction_type='deposit',
+                created_at__gte=month_start,
+                created_at__lt=next_month,
+            ).exclude(pk=club_transaction.pk).exists()
+
+        updated = cls.objects.filter(club_id=club_transaction.club_id, month=month).update(
+            deposits=models.F('deposits') + (club_transaction.amount if is_deposit else 0),
+            withdrawals=models.F('withdrawals') + (0 if is_deposit else club_transaction.amount),
+            transaction_count=models.F('transaction_count') + 1,
+            contributor_count=models.F('contributor_count') + int(new_contributor),
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            # The ledger already holds the transaction being recorded
+            cls.refresh_for(club_transaction.club_id, month)
+
+    @classmethod
+    def history(cls, club, months=24):
+        """The last months calendar months of a club, oldest first, with empty months as zeros"""
+        this_month = cls.month_of(timezone.now())
+        first = this_month.year * 12 + this_month.month - months
+        calendar = [date(index // 12, index % 12 + 1, 1) for index in range(first, first + months)]
+        rollups = {
+            rollup.month: rollup
+            for rollup in cls.objects.filter(club=club, month__gte=calendar[0], month__lte=this_month)
+        }
+        history = []
+        for month in calendar:
+            rollup = rollups.get(month)
+            history.append({
+                'month': month.strftime('%b %Y'),
+                'deposits': float(rollup.deposits) if rollup else 0,
+                'withdrawals': float(rollup.withdrawals) if rollup else 0,
+                'contributors': rollup.contributor_count if rollup else 0,
+            })
+        return history
+
+    def __str__(self):
+        return f"{self.club.name} - {self.month:%B %Y}"
+
+
+class ClubMembershipQuerySet(models.QuerySet):
+    def with_contributions(self):
+        """
+        Annotate each membership with the member's total_deposits and last_contribution_at
+        in its club, and fixed_savings_total (active fixed savings they created), so a
+        member list costs one query however long it is.
+        """
+        deposits = ClubTransaction.objects.filter(
+            club=models.OuterRef('club'),
+            user_profile=models.OuterRef('user_profile'),
+            transaction_type='deposit',
+        )
+        fixed_savings = ClubFixedSavings.objects.filter(
+            club=models.OuterRef('club'),
+            created_by=models.OuterRef('user_profile__user'),
+            is_active=True,
+        )
+        return self.annotate(
+            total_deposits=_correlated_aggregate(deposits, models.Sum('amount', output_field=MONEY)),
+            last_contribution_at=_correlated_aggregate(deposits, models.Max('created_at'), default=None),
+            fixed_savings_total=_correlated_aggregate(
+                fixed_savings, models.Sum('amount_fixed', output_field=MONEY),
+            ),
+        )
 
 
 class ClubMembership(models.Model):
@@ -158,6 +713,7 @@ class ClubMembership(models.Model):
     role = models.CharField(max_length=50, choices=[('member', 'Member'), ('admin', 'Club Admin')], default='member')
     joined_on = models.DateField(default=timezone.now)
 
+    objects = ClubMembershipQuerySet.as_manager()
 
     class Meta:
         unique_together = ('user_profile', 'club')
@@ -178,6 +734,12 @@ class ClubTransaction(models.Model):
     notes = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # The club ledger pages newest first by (created_at, id) within a club
+            models.Index(fields=['club', '-created_at', '-id'], name='mcs_club_ledger_idx'),
+        ]
+
     def __str__(self):
         user = self.user_profile.user.username if self.user_profile else 'N/A'
         return f"{self.transaction_type.title()} of {self.amount} by {user}"
@@ -195,10 +757,22 @@ class ClubFixedSavings(models.Model):
     created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='created_fixed_savings')
     created_at = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)
+    maturity_date = models.DateField(editable=False)
+    status = models.CharField(
+        max_length=20, choices=MATURITY_STATUS_CHOICES, default='active', editable=False,
+        help_text="Moved to matured on save or by the process_maturities command",
+    )
+
+    objects = FixedTermQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'maturity_date'], name='mcs_clubfixed_maturity_idx'),
+        ]
 
     def clean(self):
         if self.club and self.amount_fixed and self.amount_fixed > 0:
-            available = self.club.available_savings
+            available = ClubBalance.for_club(self.club).available
             
             # If this is an existing record being updated, add back its current amount
             if self.pk:
@@ -212,12 +786,13 @@ class ClubFixedSavings(models.Model):
                 raise ValidationError(f"Cannot fix UGX {self.amount_fixed:,.0f}. Only UGX {available:,.0f} is available.")
 
     def save(self, *args, **kwargs):
-        self.clean()
-        super().save(*args, **kwargs)
-
-    @property
-    def maturity_date(self):
-        return self.date_fixed + timedelta(days=30 * self.maturity_months)
+        # Lock the club's balance so concurrent fixings cannot both pass the check
+        with transaction.atomic():
+            if self.club_id:
+                ClubBalance.for_club(self.club, lock=True)
+            self.clean()
+            self.maturity_date, self.status = maturity_for(self.date_fixed, self.maturity_months)
+            super().save(*args, **kwargs)
 
     @property
     def expected_interest(self):
@@ -234,16 +809,9 @@ class ClubFixedSavings(models.Model):
         daily_rate = self.interest_rate / 100 / 365
         return self.amount_fixed * Decimal(daily_rate) * days_elapsed
 
-    @property
-    def status(self):
-        return 'matured' if timezone.now().date() >= self.maturity_date else 'active'
-    
     @property
     def available_to_fix(self):
-        deposits = self.club.transactions.filter(transaction_type='deposit').aggregate(total=models.Sum('amount'))['total'] or 0
-        withdrawals = self.club.transactions.filter(transaction_type='withdrawal').aggregate(total=models.Sum('amount'))['total'] or 0
-        fixed = self.club.fixed_savings.filter(is_active=True).aggregate(total=models.Sum('amount_fixed'))['total'] or 0
-        return deposits - withdrawals - fixed
+        return ClubBalance.for_club(self.club).available
 
     def __str__(self):
         amount = self.amount_fixed or 0
@@ -338,10 +906,15 @@ class IndividualUserFixedSavings(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = FixedTermQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Individual User Fixed Savings"
         verbose_name_plural = "Individual User Fixed Savings"
         ordering = ['-date_fixed']
+        indexes = [
+            models.Index(fields=['account_status', 'maturity_date'], name='mcs_iufs_maturity_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         # Set account number from user profile if not provided
@@ -352,10 +925,10 @@ class IndividualUserFixedSavings(models.Model):
         if not self.maturity_date and self.date_fixed and self.maturity_period:
             self.maturity_date = self.date_fixed + timedelta(days=30 * self.maturity_period)
         
-        # Calculate expected interest
+        # Calculate expected interest, compounded at compounding_frequency
         if self.principal_amount and self.interest_rate and self.maturity_period:
-            # Simple interest calculation
-            self.expected_interest = self.principal_amount * Decimal(self.interest_rate / 100) * Decimal(self.maturity_period / 12)
+            from .interest import interest_for
+            self.expected_interest = interest_for([self])[self.pk][0]
             self.matured_amount = self.principal_amount + self.expected_interest
         
         super().save(*args, **kwargs)
@@ -400,15 +973,124 @@ class IndividualUserFixedSavings(models.Model):
     def calculate_interest_earned_so_far(self):
         """Calculate interest earned up to current date"""
         if self.principal_amount and self.interest_rate and self.principal_amount > 0 and self.interest_rate > 0:
-            days_elapsed = min(self.days_elapsed, self.maturity_period * 30) if self.maturity_period else 0
-            daily_rate = self.interest_rate / 100 / 365
-            return self.principal_amount * Decimal(daily_rate) * days_elapsed
+            from .interest import interest_for
+            return interest_for([self])[self.pk][1]
         return Decimal('0.00')
 
     def __str__(self):
         return f"{self.user_profile.user.username} - {self.principal_amount} at {self.interest_rate}% ({self.maturity_period} months)"
 
 
+def process_maturities(as_of=None, dry_run=False):
+    """
+    Move every fixed-term account due on or before as_of (default today) to matured, with one
+    indexed UPDATE per product in one transaction. Returns {product label: accounts moved},
+    or accounts due with dry_run.
+    """
+    as_of = as_of or timezone.localdate()
+    # (label, rows due, values to set); each filter is served by a (status, maturity_date) index
+    due = [
+        ('individual fixed savings',
+         IndividualUserFixedSavings.objects.filter(account_status='active', maturity_date__lte=as_of),
+         {'account_status': 'matured', 'updated_at': timezone.now()}),
+        ('club fixed savings',
+         ClubFixedSavings.objects.filter(status='active', maturity_date__lte=as_of),
+         {'status': 'matured'}),
+        ('52 WSC investments',
+         Investment.objects.filter(status='active', maturity_date__lte=as_of),
+         {'status': 'matured'}),
+    ]
+
+    moved = {}
+    with transaction.atomic():
+        for label, accounts, values in due:
+            moved[label] = accounts.count() if dry_run else accounts.update(**values)
+    return moved
+
+
+@receiver(post_delete, sender=SavingsTransaction)
+def refresh_savings_state_on_delete(sender, instance, origin=None, **kwargs):
+    # Skip cascades from a deleted member; their state row goes with them
+    origin_model = origin.model if isinstance(origin, models.QuerySet) else type(origin)
+    if origin_model is SavingsTransaction:
+        SavingsMemberState.refresh_for(instance.user_profile_id)
+
+
+@receiver(pre_save, sender=ClubTransaction)
+@receiver(pre_save, sender=ClubFixedSavings)
+def remember_balance_club(sender, instance, raw=False, **kwargs):
+    # An edited row may have moved clubs; both balances then need refreshing
+    if instance.pk and not raw:
+        instance._previous_club_id = sender.objects.filter(pk=instance.pk).values_list('club_id', flat=True).first()
+
+
+@receiver(post_save, sender=ClubTransaction)
+@receiver(post_save, sender=ClubFixedSavings)
+def update_club_balance(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        if sender is ClubTransaction:
+            amount = {'deposits' if instance.transaction_type == 'deposit' else 'withdrawals': instance.amount}
+        else:
+            amount = {'fixed': instance.amount_fixed if instance.is_active else 0}
+        ClubBalance.apply(instance.club_id, **amount)
+        return
+
+    ClubBalance.refresh_for(instance.club_id)
+    previous_club_id = getattr(instance, '_previous_club_id', None)
+    if previous_club_id and previous_club_id != instance.club_id:
+        ClubBalance.refresh_for(previous_club_id)
+
+
+@receiver(post_save, sender=ClubTransaction)
+def update_club_monthly_rollup(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        ClubMonthlyRollup.record(instance)
+        return
+
+    month = ClubMonthlyRollup.month_of(instance.created_at)
+    ClubMonthlyRollup.refresh_for(instance.club_id, month)
+    previous_club_id = getattr(instance, '_previous_club_id', None)
+    if previous_club_id and previous_club_id != instance.club_id:
+        ClubMonthlyRollup.refresh_for(previous_club_id, month)
+
+
+@receiver(post_delete, sender=ClubTransaction)
+def refresh_club_monthly_rollup_on_delete(sender, instance, origin=None, **kwargs):
+    # Skip cascades from a deleted club; its rollups go with it
+    origin_model = origin.model if isinstance(origin, models.QuerySet) else type(origin)
+    if origin_model is not Club:
+        ClubMonthlyRollup.refresh_for(instance.club_id, ClubMonthlyRollup.month_of(instance.created_at))
+
+
+@receiver(post_delete, sender=ClubTransaction)
+@receiver(post_delete, sender=ClubFixedSavings)
+def refresh_club_balance_on_delete(sender, instance, origin=None, **kwargs):
+    # Skip cascades from a deleted club; its balance row goes with it
+    origin_model = origin.model if isinstance(origin, models.QuerySet) else type(origin)
+    if origin_model is not Club:
+        ClubBalance.refresh_for(instance.club_id)
+
+
+# Cached by views.home_club_list; any club or membership write drops it from the cache
+# every worker shares (settings.CACHES)
+CLUB_LIST_CACHE_KEY = 'mcs:home-club-list'
+
+
+@receiver(post_save, sender=Club)
+@receiver(post_delete, sender=Club)
+@receiver(post_save, sender=ClubMembership)
+@receiver(post_delete, sender=ClubMembership)
+def invalidate_club_list(sender, **kwargs):
+    from django.core.cache import cache
+
+    # After commit, so a concurrent request cannot re-cache the list from before the write
+    transaction.on_commit(lambda: cache.delete(CLUB_LIST_CACHE_KEY))
+
+
 @receiver(post_save, sender=User)
 def manage_user_profile(sender, instance, created, **kwargs):
     if created:
@@ -603,6 +1285,65 @@ class GoatFarmingInvestment(models.Model):
         return f"{self.user_profile.user.username} - {self.package.name}"
 
 
+class IdSequence(models.Model):
+    """
+    Counters behind the numbered goat and offspring IDs.
+
+    reserve() advances a counter with a single UPDATE, which holds the row lock until the
+    surrounding transaction ends, so concurrent saves never hand out the same number and
+    a block of IDs for bulk_create costs the same as one.
+    """
+    name = models.CharField(max_length=50, primary_key=True)
+    last_value = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.name}: {self.last_value}"
+
+    @classmethod
+    def reserve(cls, name, count=1, initial=None):
+        """
+        Reserve count consecutive numbers from the named sequence and return them as a range.
+
+        A sequence that does not exist yet starts after initial(), or 0.
+        """
+        from django.db import IntegrityError
+
+        with transaction.atomic():
+            if not cls.objects.filter(name=name).update(last_value=models.F('last_value') + count):
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(name=name, last_value=(initial() if initial else 0) + count)
+                except IntegrityError:
+                    # Another transaction created it first; take the next block from its value
+                    cls.objects.filter(name=name).update(last_value=models.F('last_value') + count)
+            last = cls.objects.filter(name=name).values_list('last_value', flat=True).get()
+        return range(last - count + 1, last + 1)
+
+    @classmethod
+    def advance_to(cls, name, value):
+        """Move a sequence past a number that was assigned by hand, so reserve() never repeats it"""
+        cls.objects.filter(name=name, last_value__lt=value).update(last_value=value)
+
+
+def numbered_id(prefix, number):
+    """GF001 ... GF999, GF1000 ...: at least three digits, never truncated"""
+    return f"{prefix}{number:03d}"
+
+
+def id_number(prefix, value):
+    """The number in an ID made by numbered_id, or None for any other value"""
+    if value and value.startswith(prefix) and value[len(prefix):].isdigit():
+        return int(value[len(prefix):])
+    return None
+
+
+def highest_id_number(queryset, field, prefix):
+    """Largest number among the numbered IDs already stored in field, or 0"""
+    values = queryset.filter(**{f'{field}__startswith': prefix}).values_list(field, flat=True)
+    return max((number for number in (id_number(prefix, value) for value in values.iterator())
+                if number is not None), default=0)
+
+
 class Goat(models.Model):
     """Individual goat records"""
     GENDER_CHOICES = [
@@ -631,20 +1372,34 @@ class Goat(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    ID_PREFIX = 'GF'
+    ID_SEQUENCE = 'goat_id'
+
     class Meta:
         verbose_name = "Goat"
         verbose_name_plural = "Goats"
-        ordering = ['goat_id']
+        # Shorter IDs first, so GF999 sorts before GF1000
+        ordering = [Length('goat_id'), 'goat_id']
+
+    @classmethod
+    def assign_ids(cls, goats):
+        """Give every goat without a goat_id the next ID, reserving them as one block (for bulk_create)"""
+        missing = [goat for goat in goats if not goat.goat_id]
+        if missing:
+            numbers = IdSequence.reserve(
+                cls.ID_SEQUENCE, len(missing),
+                initial=lambda: highest_id_number(cls.objects.all(), 'goat_id', cls.ID_PREFIX),
+            )
+            for goat, number in zip(missing, numbers):
+                goat.goat_id = numbered_id(cls.ID_PREFIX, number)
+        return goats
 
     def save(self, *args, **kwargs):
         # Auto-generate goat ID if not provided
         if not self.goat_id:
-            last_goat = Goat.objects.order_by('-id').first()
-            if last_goat:
-                last_number = int(last_goat.goat_id[2:]) if last_goat.goat_id.startswith('GF') else 0
-                self.goat_id = f"GF{(last_number + 1):03d}"
-            else:
-                self.goat_id = "GF001"
+            Goat.assign_ids([self])
+        elif self._state.adding and id_number(self.ID_PREFIX, self.goat_id):
+            IdSequence.advance_to(self.ID_SEQUENCE, id_number(self.ID_PREFIX, self.goat_id))
         super().save(*args, **kwargs)
 
     @property
@@ -698,15 +1453,28 @@ class GoatOffspring(models.Model):
         verbose_name_plural = "Goat Offspring"
         ordering = ['-birth_date']
 
+    ID_PREFIX = 'OFF'
+    ID_SEQUENCE = 'offspring_id'
+
+    @classmethod
+    def assign_ids(cls, offspring):
+        """Give every record without an offspring_id the next ID, reserving them as one block"""
+        missing = [kid for kid in offspring if not kid.offspring_id]
+        if missing:
+            numbers = IdSequence.reserve(
+                cls.ID_SEQUENCE, len(missing),
+                initial=lambda: highest_id_number(cls.objects.all(), 'offspring_id', cls.ID_PREFIX),
+            )
+            for kid, number in zip(missing, numbers):
+                kid.offspring_id = numbered_id(cls.ID_PREFIX, number)
+        return offspring
+
     def save(self, *args, **kwargs):
         # Auto-generate offspring ID if not provided
         if not self.offspring_id:
-            last_offspring = GoatOffspring.objects.order_by('-id').first()
-            if last_offspring:
-                last_number = int(last_offspring.offspring_id[3:]) if last_offspring.offspring_id.startswith('OFF') else 0
-                self.offspring_id = f"OFF{(last_number + 1):03d}"
-            else:
-                self.offspring_id = "OFF001"
+            GoatOffspring.assign_ids([self])
+        elif self._state.adding and id_number(self.ID_PREFIX, self.offspring_id):
+            IdSequence.advance_to(self.ID_SEQUENCE, id_number(self.ID_PREFIX, self.offspring_id))
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -748,6 +1516,10 @@ class GoatFarmingTransaction(models.Model):
         verbose_name = "Goat Farming Transaction"
         verbose_name_plural = "Goat Farming Transactions"
         ordering = ['-created_at']
+        indexes = [
+            # The member's goat farming ledger pages newest first by (created_at, id) per investment
+            models.Index(fields=['investment', '-created_at', '-id'], name='mcs_goat_ledger_idx'),
+        ]
 
     def __str__(self):
         return f"{self.investment.user_profile.user.username} - {self.transaction_type} - UGX {self.amount:,.0f}"
@@ -808,3 +1580,42 @@ class GoatFarmingNotification(models.Model):
 
 
 
+
+
+# Cached by views.goat_portfolio_summary, one entry per member. settings.CACHES must be
+# shared by every worker for the drop below to reach all of them
+def goat_portfolio_cache_key(user_profile_id):
+    return f"mcs:goat-portfolio:{user_profile_id}"
+
+
+@receiver(post_save, sender=GoatFarmingPackage)
+@receiver(post_save, sender=GoatFarmingInvestment)
+@receiver(post_delete, sender=GoatFarmingInvestment)
+@receiver(post_save, sender=Goat)
+@receiver(post_delete, sender=Goat)
+@receiver(post_save, sender=GoatOffspring)
+@receiver(post_delete, sender=GoatOffspring)
+@receiver(post_save, sender=GoatFarmingTransaction)
+@receiver(post_delete, sender=GoatFarmingTransaction)
+def invalidate_goat_portfolio(sender, instance, **kwargs):
+    if sender is GoatFarmingInvestment:
+        members = [instance.user_profile_id]
+    else:
+        if sender is GoatFarmingPackage:
+            investments = GoatFarmingInvestment.objects.filter(package=instance)
+        elif sender is GoatOffspring:
+            investments = GoatFarmingInvestment.objects.filter(goats__pk=instance.mother_id)
+        else:
+            investments = GoatFarmingInvestment.objects.filter(pk=instance.investment_id)
+        members = set(investments.values_list('user_profile_id', flat=True))
+    drop_goat_portfolios(members)
+
+
+def drop_goat_portfolios(user_profile_ids):
+    """Drop cached goat portfolio summaries once the current transaction commits"""
+    from django.core.cache import cache
+
+    keys = [goat_portfolio_cache_key(member) for member in user_profile_ids]
+    if keys:
+        # After commit, so a concurrent request cannot re-cache figures from before the write
+        transaction.on_commit(lambda: cache.delete_many(keys))
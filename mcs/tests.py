@@ -0,0 +1,315 @@
+import io
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .imports import GoatImport
+
+from .models import Club, ClubEvent, ClubFixedSavings, ClubMembership, ClubTransaction, Investment, Project
+from .models import Goat, GoatFarmingInvestment, GoatFarmingPackage, GoatFarmingTransaction, GoatOffspring
+
+
+def count_queries(client, url, **params):
+    """The response to a GET of url and its query count, after one GET to fill per-process caches"""
+    client.get(url, params)
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url, params)
+    return response, len(queries)
+
+
+def uncached(queries):
+    """Captured queries other than those of the database cache backend"""
+    return [query for query in queries if 'mcs_cache' not in query['sql'] and 'SAVEPOINT' not in query['sql']]
+
+
+class ClubAdminQueryTests(TestCase):
+    """The club admin pages cost the same number of queries however much data a club has"""
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(self.admin)
+        self.member_count = 0
+
+    def add_club(self, name, rows=1):
+        club = Club.objects.create(name=name, monthly_target=Decimal('100000'))
+        for number in range(rows):
+            self.member_count += 1
+            user = User.objects.create_user(f'member{self.member_count}', first_name='Member', last_name=str(number))
+            ClubMembership.objects.create(club=club, user_profile=user.profile)
+            ClubTransaction.objects.create(
+                club=club, user_profile=user.profile, amount=Decimal('50000'), transaction_type='deposit',
+            )
+            ClubFixedSavings.objects.create(
+                club=club, amount_fixed=Decimal('10000'), interest_rate=10.0, created_by=self.admin,
+            )
+            ClubEvent.objects.create(
+                club=club, title=f'Meeting {number}', event_date='2026-01-01',
+                description='Monthly meeting', location='Kampala', created_by=self.admin,
+            )
+        return club
+
+    def test_changelist_queries_do_not_grow_with_clubs(self):
+        url = reverse('admin:mcs_club_changelist')
+        self.add_club('First')
+        response, expected = count_queries(self.client, url)
+        self.assertEqual(response.status_code, 200)
+
+        for number in range(5):
+            self.add_club(f'Club {number}', rows=3)
+        with self.assertNumQueries(expected):
+            response = self.client.get(url)
+        self.assertContains(response, 'UGX 150,000')
+
+    def test_change_page_queries_do_not_grow_with_inline_rows(self):
+        small = self.add_club('Small')
+        response, expected = count_queries(self.client, reverse('admin:mcs_club_change', args=[small.pk]))
+        self.assertEqual(response.status_code, 200)
+
+        # More rows than one page of each paginated inline
+        large = self.add_club('Large', rows=30)
+        with self.assertNumQueries(expected):
+            response = self.client.get(reverse('admin:mcs_club_change', args=[large.pk]))
+        self.assertEqual(len(response.context['inline_admin_formsets'][0].formset.forms), 20)
+
+    def test_change_page_second_page_of_members(self):
+        club = self.add_club('Paged', rows=25)
+        url = reverse('admin:mcs_club_change', args=[club.pk])
+        _, expected = count_queries(self.client, url)
+
+        with self.assertNumQueries(expected):
+            response = self.client.get(url, {'clubmembership_page': 2})
+        self.assertEqual(len(response.context['inline_admin_formsets'][0].formset.forms), 5)
+
+
+
+class ClubDashboardQueryTests(TestCase):
+    """The club dashboard costs the same number of queries however much the club has saved"""
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.user = User.objects.create_user('treasurer', first_name='Club', last_name='Treasurer')
+        self.user.profile.projects.add(Project.objects.create(name='Clubs Savings'))
+        self.client.force_login(self.user)
+        self.club = Club.objects.create(name='Savers', monthly_target=Decimal('100000'))
+        ClubMembership.objects.create(club=self.club, user_profile=self.user.profile, role='admin')
+        self.member_count = 0
+
+    def add_activity(self, rows):
+        for number in range(rows):
+            self.member_count += 1
+            user = User.objects.create_user(f'member{self.member_count}', first_name='Member', last_name=str(number))
+            ClubMembership.objects.create(club=self.club, user_profile=user.profile)
+            for transaction_type, amount in (('deposit', '50000'), ('withdrawal', '5000')):
+                ClubTransaction.objects.create(
+                    club=self.club, user_profile=user.profile, amount=Decimal(amount),
+                    transaction_type=transaction_type,
+                )
+            ClubFixedSavings.objects.create(
+                club=self.club, amount_fixed=Decimal('10000'), interest_rate=10.0, created_by=self.admin,
+            )
+
+    def test_dashboard_queries_do_not_grow_with_activity(self):
+        url = reverse('clubs_dashboard', args=[self.club.id])
+        self.add_activity(rows=1)
+        response, expected = count_queries(self.client, url)
+        self.assertEqual(response.status_code, 200)
+
+        self.add_activity(rows=10)
+        with self.assertNumQueries(expected):
+            response = self.client.get(url)
+        self.assertEqual(response.context['active_members'], 12)
+
+
+
+class ClubLedgerTests(TestCase):
+    def test_last_representable_day_is_an_invalid_date(self):
+        from .views import club_ledger
+
+        club = Club.objects.create(name='Savers')
+        with self.assertRaisesMessage(ValueError, "invalid date '9999-12-31'"):
+            club_ledger(club, {'date_to': '9999-12-31'})
+        self.assertFalse(club_ledger(club, {'date_from': '9999-12-31'}).exists())
+
+
+class GoatFarmViewQueryTests(TestCase):
+    """The goat farm pages share one cached portfolio summary with a fixed query count"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('farmer', first_name='Goat', last_name='Farmer')
+        self.user.profile.projects.add(Project.objects.create(name='Goat Farming'))
+        self.client.force_login(self.user)
+        self.package = GoatFarmingPackage.objects.create(
+            name='Basic Package', description='Two goats', total_package_amount=Decimal('1200000'),
+            number_of_female_goats=1, number_of_male_goats=1, expected_offspring_in_one_year=2,
+            management_fee=Decimal('100000'),
+        )
+
+    def add_investment(self):
+        investment = GoatFarmingInvestment.objects.create(
+            user_profile=self.user.profile, package=self.package, investment_amount=Decimal('600000'),
+            start_date=date(2026, 1, 1),
+        )
+        mother = Goat.objects.create(investment=investment, gender='female', breed='Boer', is_pregnant=True)
+        father = Goat.objects.create(investment=investment, gender='male', breed='Boer')
+        GoatOffspring.objects.create(mother=mother, father=father, gender='female', birth_date=date(2026, 6, 1))
+        for status in ('completed', 'pending'):
+            GoatFarmingTransaction.objects.create(
+                investment=investment, transaction_type='payment', amount=Decimal('300000'),
+                description='Instalment', status=status,
+            )
+        return investment
+
+    def test_views_queries_do_not_grow_with_investments(self):
+        self.add_investment()
+        counts = {}
+        for name in ('goat_farm_dashboard', 'goat_farm_investment', 'goat_farm_transactions'):
+            cache.clear()
+            response, counts[name] = count_queries(self.client, reverse(name))
+            self.assertEqual(response.status_code, 200)
+
+        for _ in range(4):
+            self.add_investment()
+        for name, expected in counts.items():
+            cache.clear()
+            self.client.get(reverse(name))
+            with self.assertNumQueries(expected):
+                self.client.get(reverse(name))
+
+    def test_summary_is_built_once_for_dashboard_and_transactions(self):
+        self.add_investment()
+        with CaptureQueriesContext(connection) as cold:
+            self.client.get(reverse('goat_farm_dashboard'))
+        with CaptureQueriesContext(connection) as warm:
+            response = self.client.get(reverse('goat_farm_dashboard'))
+        # The investments and their prefetched transactions, three aggregates, and the
+        # pregnant goat and offspring lists; reads and writes of the cache table aside
+        self.assertEqual(len(uncached(cold)) - len(uncached(warm)), 7)
+        self.assertContains(response, 'UGX 1200000')
+
+        with CaptureQueriesContext(connection) as transactions:
+            self.client.get(reverse('goat_farm_transactions'))
+        self.assertFalse([query for query in transactions if 'mcs_goat"' in query['sql']])
+
+    def test_summary_is_dropped_when_a_transaction_is_saved(self):
+        investment = self.add_investment()
+        self.client.get(reverse('goat_farm_dashboard'))
+        with self.captureOnCommitCallbacks(execute=True):
+            GoatFarmingTransaction.objects.create(
+                investment=investment, transaction_type='payment', amount=Decimal('100000'),
+                description='Instalment', status='completed',
+            )
+        self.assertContains(self.client.get(reverse('goat_farm_dashboard')), 'UGX 1300000')
+
+    def test_ledger_end_date_of_the_last_representable_day_is_invalid(self):
+        from .views import goat_ledger_page
+
+        self.add_investment()
+        with self.assertRaisesMessage(ValueError, "invalid date '9999-12-31'"):
+            goat_ledger_page(self.user.profile, {'end_date': '9999-12-31'})
+        response = self.client.get(reverse('goat_farm_transactions'), {'end_date': '9999-12-31'})
+        self.assertContains(response, 'Could not filter transactions')
+
+    def test_offspring_parents_are_loaded_with_the_summary(self):
+        from .views import goat_portfolio_summary
+
+        self.add_investment()
+        offspring = goat_portfolio_summary(self.user.profile)['offspring']
+        with self.assertNumQueries(0):
+            self.assertEqual([(child.mother.gender, child.father.gender) for child in offspring], [('female', 'male')])
+
+
+
+class GoatImportTests(TestCase):
+    """Bad rows in a goat CSV are rejected and reported, never raised"""
+
+    def setUp(self):
+        user = User.objects.create_user('importer', first_name='Goat', last_name='Importer')
+        package = GoatFarmingPackage.objects.create(
+            name='Basic Package', description='Two goats', total_package_amount=Decimal('1200000'),
+            number_of_female_goats=1, number_of_male_goats=1, management_fee=Decimal('100000'),
+        )
+        self.investment = GoatFarmingInvestment.objects.create(
+            user_profile=user.profile, package=package, investment_amount=Decimal('600000'),
+        )
+
+    def run_import(self, *rows):
+        lines = ['investment,gender,breed,weight_kg,date_received', *rows]
+        return GoatImport(chunk_size=2).run(io.StringIO('\n'.join(lines) + '\n'))
+
+    def test_invalid_rows_are_rejected(self):
+        investment = self.investment.pk
+        importer = self.run_import(
+            f'{investment},female,Boer,NaN,',
+            f'{investment},female,Boer,sNaN,',
+            f'{investment},male,Boer,Infinity,',
+            '²,female,Boer,,',
+            f'{2 ** 64},female,Boer,,',
+            f'{investment},female,Boer,25.5,',
+        )
+        self.assertEqual([line for line, _, _ in importer.rejected], [2, 3, 4, 5, 6])
+        self.assertEqual((importer.imported, importer.committed), (1, 1))
+        self.assertEqual(Goat.objects.get().weight_kg, Decimal('25.5'))
+
+    def test_undecodable_file_registers_nothing(self):
+        investment = self.investment.pk
+        data = f'investment,gender,breed,weight_kg,date_received\n{investment},female,Boer,,\n'.encode() + b'\xff\n'
+        with self.assertRaises(UnicodeDecodeError):
+            GoatImport(chunk_size=1).run(io.TextIOWrapper(io.BytesIO(data), encoding='utf-8'))
+        self.assertFalse(Goat.objects.exists())
+
+
+
+class DepositImportTests(TestCase):
+    def test_non_finite_and_oversized_amounts_are_rejected(self):
+        from .management.commands.import_52wsc_deposits import Command
+
+        row = {'account_number': 'MCSTGF-AB0001', 'receipt_number': 'R1', 'date': '2026-01-01'}
+        for amount in ('NaN', 'sNaN', 'Infinity', '2147483648'):
+            deposit, reason = Command().parse_row({**row, 'amount': amount})
+            self.assertIsNone(deposit, amount)
+            self.assertIn(repr(amount), reason)
+        deposit, _ = Command().parse_row({**row, 'amount': '2147483647'})
+        self.assertEqual(deposit['amount'], 2147483647)
+
+
+class MaturityTests(TestCase):
+    """process_maturities moves stored statuses of due accounts to matured"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('saver', first_name='Fixed', last_name='Saver')
+
+    def add_investment(self, months_ago):
+        investment = Investment.objects.create(
+            user_profile=self.user.profile, amount_invested=Decimal('500000'), interest_rate=12.0,
+            maturity_months=8, date_invested=timezone.localdate() - timedelta(days=30 * months_ago),
+        )
+        # As if it were saved before it matured
+        Investment.objects.filter(pk=investment.pk).update(status='active')
+        return investment
+
+    def test_command_matures_due_accounts(self):
+        due = self.add_investment(months_ago=8)
+        running = self.add_investment(months_ago=2)
+
+        call_command('process_maturities', stdout=io.StringIO())
+        due.refresh_from_db()
+        running.refresh_from_db()
+        self.assertEqual((due.status, running.status), ('matured', 'active'))
+
+    def test_dry_run_changes_nothing(self):
+        due = self.add_investment(months_ago=8)
+
+        output = io.StringIO()
+        call_command('process_maturities', '--dry-run', stdout=output)
+        due.refresh_from_db()
+        self.assertEqual(due.status, 'active')
+        self.assertIn('52 WSC investments: 1 due', output.getvalue())
@@ -32,10 +32,12 @@ urlpatterns = [
 
     # 52 Weeks Savings Challenge URLs
     path('52wsc/member-dashboard/', views.wsc_member_dashboard, name='wsc_member_dashboard'),
+    path('52wsc/transactions/', views.wsc_transaction_history, name='wsc_transaction_history'),
    
     # Fixed Savings URLs
     path('fsa/', views.individual_fixed_savings_account, name='fsa_dashboard'),
     path('fsa/terms/', views.fixed_savings_terms, name='fsa_terms'),
+    path('fsa/projection/', views.fixed_savings_projection, name='fsa_projection'),
     # Commercial Goat Farming URLs
     path('goat-farm/', views.goat_farm_dashboard, name='goat_farm_dashboard'),
     path('goat-farm/investment/', views.goat_farm_investment, name='goat_farm_investment'),
@@ -47,6 +49,7 @@ urlpatterns = [
     path('clubs/dashboard/<int:club_id>/', views.clubs_dashboard, name='clubs_dashboard'),
     path('clubs/members/<int:club_id>/', views.club_members, name='club_members'),
     path('clubs/transactions/<int:club_id>/', views.club_transactions, name='club_transactions'),
+    path('clubs/transactions/<int:club_id>/export/', views.club_transactions_export, name='club_transactions_export'),
     # RSS URLs
     path('rss/', views.rss_dashboard, name='rss_dashboard'),
     path('rss/portfolio/', views.rss_portfolio, name='rss_portfolio'),
@@ -3,18 +3,36 @@ from django.contrib.auth.forms import UserCreationForm
 from django.contrib import messages
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
-from .models import UserProfile, SavingsTransaction, Investment, Club, ClubMembership, ClubTransaction, ClubFixedSavings, ClubEvent, IndividualUserFixedSavings
+from .models import UserProfile, SavingsTransaction, SavingsMemberState, Investment, Club, ClubMembership, ClubTransaction, ClubFixedSavings, ClubEvent, IndividualUserFixedSavings
 from .forms import UserForm, ProfileForm, CustomUserCreationForm
 from .decorators import project_required, club_membership_required
+from .interest import interest_for
 from django.utils import timezone
 from django.utils.safestring import mark_safe
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.text import slugify
+from django.http import HttpResponseBadRequest, JsonResponse
+from django.urls import reverse
 import json
+import math
+from urllib.parse import urlencode
 from django.db import models
 from datetime import datetime, timedelta
+from decimal import Decimal
+
+from bisect import bisect_right
+
+# Week N of the challenge has a target of N x 10,000 UGX
+WEEKLY_TARGETS = tuple(week * 10000 for week in range(1, 53))
+
+# CUMULATIVE_TARGETS[n] is the total needed to cover weeks 1..n (index 0 is 0)
+CUMULATIVE_TARGETS = (0,) + tuple(
+    sum(WEEKLY_TARGETS[:week]) for week in range(1, 53)
+)
 
 def get_weekly_targets():
     """Generate list of weekly targets"""
-    return [week * 10000 for week in range(1, 53)]
+    return list(WEEKLY_TARGETS)
 
 def evaluate_deposit(deposit, current_week, carry_forward):
     """
@@ -22,36 +40,77 @@ def evaluate_deposit(deposit, current_week, carry_forward):
     deposit: new amount being deposited
     current_week: the next week to be covered
     carry_forward: any balance from previous deposit
+
+    Weeks are covered in order, so the last week covered is the largest n with
+    CUMULATIVE_TARGETS[n] - CUMULATIVE_TARGETS[current_week - 1] <= balance,
+    which a bisect over the precomputed table finds without walking the weeks.
     """
-    weekly_targets = get_weekly_targets()
     balance = deposit + carry_forward  # Add new deposit to any carried forward balance
-    fully_covered = []
-
-    # Start checking from current_week
-    for i in range(current_week - 1, 52):
-        target = weekly_targets[i]  # Get target for this week (week × 10,000)
-        if balance >= target:
-            fully_covered.append(i + 1)  # Week is fully covered
-            balance -= target  # Subtract the week's target from balance
-            current_week += 1  # Move to next week
-        else:
-            break  # Not enough balance to cover next week
+    start = min(max(current_week, 1), 53) - 1  # Weeks already covered before this deposit
+    already_covered = CUMULATIVE_TARGETS[start]
+
+    last_week = bisect_right(CUMULATIVE_TARGETS, balance + already_covered) - 1
+    last_week = max(start, min(last_week, 52))
 
     return {
-        'fully_covered_weeks': fully_covered,
-        'next_week': current_week,
-        'remaining_balance': balance
+        'fully_covered_weeks': list(range(start + 1, last_week + 1)),
+        'next_week': current_week + (last_week - start),
+        'remaining_balance': balance - (CUMULATIVE_TARGETS[last_week] - already_covered)
     }
 
+def evaluate_deposit_chain(deposits, current_week=1, carry_forward=0, cumulative_total=0):
+    """
+    Evaluate a member's deposits in order, each one carrying its balance into the next.
+    Returns one result per deposit, including the running cumulative_total.
+    """
+    results = []
+    for deposit in deposits:
+        # Same arithmetic as evaluate_deposit, inlined for the hot replay path
+        balance = deposit + carry_forward
+        start = min(max(current_week, 1), 53) - 1
+        already_covered = CUMULATIVE_TARGETS[start]
+        last_week = max(start, min(bisect_right(CUMULATIVE_TARGETS, balance + already_covered) - 1, 52))
+        current_week += last_week - start
+        carry_forward = balance - (CUMULATIVE_TARGETS[last_week] - already_covered)
+        cumulative_total += deposit
+        results.append({
+            'fully_covered_weeks': list(range(start + 1, last_week + 1)),
+            'next_week': current_week,
+            'remaining_balance': carry_forward,
+            'cumulative_total': cumulative_total,
+        })
+    return results
+
+def evaluate_deposit_batch(chains, initial_states=None):
+    """
+    Evaluate deposit chains for many members in one call.
+    chains: mapping of member key -> deposits in date order
+    initial_states: optional mapping of member key -> dict with 'next_week',
+        'remaining_balance' and 'cumulative_total' to resume from
+    Returns a mapping of member key -> list of results (see evaluate_deposit_chain).
+    """
+    initial_states = initial_states or {}
+    batch = {}
+    for key, deposits in chains.items():
+        state = initial_states.get(key)
+        if state:
+            batch[key] = evaluate_deposit_chain(
+                deposits,
+                current_week=state['next_week'],
+                carry_forward=state['remaining_balance'],
+                cumulative_total=state['cumulative_total'],
+            )
+        else:
+            batch[key] = evaluate_deposit_chain(deposits)
+    return batch
+
 def process_user_deposit(user_profile, deposit_amount):
-    latest_txn = SavingsTransaction.objects.filter(
-        user_profile=user_profile
-    ).order_by('-date_saved').first()
-
-    if latest_txn:
-        current_week = latest_txn.next_week
-        carry_forward = float(latest_txn.remaining_balance)
-        cumulative_total = float(latest_txn.cumulative_total) + deposit_amount
+    state = SavingsMemberState.for_profile(user_profile)
+
+    if state:
+        current_week = state.next_week
+        carry_forward = float(state.remaining_balance)
+        cumulative_total = float(state.cumulative_total) + deposit_amount
     else:
         current_week = 1
         carry_forward = 0
@@ -66,6 +125,119 @@ def process_user_deposit(user_profile, deposit_amount):
     return result
 
 
+def _to_cents(value):
+    return Decimal(str(value)).quantize(Decimal('0.01'))
+
+def replay_savings_ledger(user_profile_id, start_from, pending=(), exclude_pks=()):
+    """
+    Recompute a member's ledger from start_from onwards, seeded from the stored
+    state of the transaction just before it.
+    pending: new or edited transactions of this member to place in the chain;
+        they get their computed values but are left for the caller to save
+    exclude_pks: stored transactions to leave out of the chain
+    Stored transactions whose values change are written with one bulk_update.
+    """
+    pending = list(pending)
+    skipped = set(exclude_pks) | {txn.pk for txn in pending if txn.pk}
+    ledger = SavingsTransaction.objects.filter(user_profile_id=user_profile_id).exclude(pk__in=skipped)
+
+    previous = ledger.filter(date_saved__lt=start_from).order_by('-date_saved', '-pk').first()
+    following = list(ledger.filter(date_saved__gte=start_from).order_by('date_saved', 'pk'))
+
+    # Unsaved transactions have no pk yet, so they go after others saved at the same moment
+    chain = sorted(following + pending, key=lambda txn: (txn.date_saved, txn.pk or float('inf')))
+
+    if previous:
+        results = evaluate_deposit_chain(
+            [txn.amount for txn in chain],
+            current_week=previous.next_week,
+            carry_forward=float(previous.remaining_balance),
+            cumulative_total=previous.cumulative_total,
+        )
+    else:
+        results = evaluate_deposit_chain([txn.amount for txn in chain])
+
+    pending_ids = {id(txn) for txn in pending}
+    changed = []
+    for txn, result in zip(chain, results):
+        is_pending = id(txn) in pending_ids
+        if (not is_pending
+                and txn.fully_covered_weeks == result['fully_covered_weeks']
+                and txn.next_week == result['next_week']
+                and _to_cents(txn.remaining_balance) == _to_cents(result['remaining_balance'])
+                and _to_cents(txn.cumulative_total) == _to_cents(result['cumulative_total'])):
+            continue
+        txn.fully_covered_weeks = result['fully_covered_weeks']
+        txn.next_week = result['next_week']
+        txn.remaining_balance = result['remaining_balance']
+        txn.cumulative_total = result['cumulative_total']
+        if not is_pending:
+            changed.append(txn)
+
+    SavingsTransaction.objects.bulk_update(
+        changed,
+        ['covered_weeks_mask', 'next_week', 'remaining_balance', 'cumulative_total'],
+        batch_size=500,
+    )
+    return changed
+
+
+SAVINGS_HISTORY_PAGE_SIZE = 20
+
+def serialize_savings_transaction(t):
+    """Row of the member's 52 WSC history table"""
+    if t.fully_covered_weeks:
+        weeks_text = "Weeks: " + ", ".join(map(str, t.fully_covered_weeks))
+    else:
+        weeks_text = "No weeks fully covered"
+
+    return {
+        'date_saved': t.date_saved.strftime('%b %d, %Y'),
+        'amount': float(t.amount),
+        'receipt_number': t.receipt_number,
+        'cumulative_total': float(t.cumulative_total),
+        'weeks_covered': weeks_text,
+        'remaining_balance': float(t.remaining_balance)
+    }
+
+def savings_history_page(user_profile, cursor=None, page_size=SAVINGS_HISTORY_PAGE_SIZE):
+    """
+    One page of a member's transactions, newest first, and the cursor for the next page.
+
+    The cursor is the (date_saved, id) of the last row returned, so each page is an
+    index range scan that starts where the previous one stopped instead of an OFFSET
+    that gets slower the further back a member pages. Raises ValueError for a
+    malformed cursor.
+    """
+    transactions = SavingsTransaction.objects.filter(user_profile=user_profile)
+    rows, next_cursor = keyset_page(transactions, 'date_saved', cursor, page_size)
+    return [serialize_savings_transaction(t) for t in rows], next_cursor
+
+def keyset_page(queryset, field, cursor, page_size):
+    """
+    One page of queryset ordered newest first by (field, id), and the cursor for the next page.
+
+    field must be a datetime. The cursor is "<iso datetime>_<id>" of the last row returned.
+    Raises ValueError for a malformed cursor.
+    """
+    queryset = queryset.order_by(f'-{field}', '-id')
+    if cursor:
+        moment_part, _, id_part = cursor.rpartition('_')
+        moment = parse_datetime(moment_part)
+        if moment is None:
+            raise ValueError(f"invalid cursor {cursor!r}")
+        last_id = int(id_part)
+        queryset = queryset.filter(
+            models.Q(**{f'{field}__lt': moment}) | models.Q(**{field: moment, 'id__lt': last_id})
+        )
+
+    # One extra row tells us whether another page exists without a COUNT
+    rows = list(queryset[:page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = f"{getattr(rows[-1], field).isoformat()}_{rows[-1].id}"
+    return rows, next_cursor
 
 def signup(request):
     if request.method == 'POST':
@@ -97,15 +269,27 @@ def login_view(request):
     
     return render(request, 'mcs/login.html')
 
+HOME_CLUB_LIST_CACHE_SECONDS = 60 * 60
+
+def home_club_list():
+    """
+    Clubs for the home page's selection modal with their active member counts, from one
+    annotated query. Cached until a club or membership changes (see models.CLUB_LIST_CACHE_KEY).
+    """
+    from django.core.cache import cache
+    from .models import CLUB_LIST_CACHE_KEY
+
+    def build():
+        return list(Club.objects.annotate(
+            member_count=models.Count('clubmembership', filter=models.Q(clubmembership__is_active=True)),
+        ).values('id', 'name', 'member_count'))
+
+    return cache.get_or_set(CLUB_LIST_CACHE_KEY, build, HOME_CLUB_LIST_CACHE_SECONDS)
+
 @login_required
 def home(request):
-    # Get all available clubs for the club selection modal
-    available_clubs = Club.objects.all()
-    
-    # Add member count to each club
-    for club in available_clubs:
-        member_count = ClubMembership.objects.filter(club=club, is_active=True).count()
-        club.member_count = member_count
+    # Get all available clubs, with member counts, for the club selection modal
+    available_clubs = home_club_list()
     
     context = {
         'available_clubs': available_clubs,
@@ -126,18 +310,13 @@ def wsc_member_dashboard(request):
     
     user_profile = request.user.profile
     
-    # Get all transactions ordered by date
-    transactions = SavingsTransaction.objects.filter(
-        user_profile=user_profile
-    ).order_by('-date_saved')
-    
-    # Get latest transaction for current state
-    latest_txn = transactions.order_by('-next_week', '-date_saved').first()
+    # Current state comes from the member's materialized snapshot
+    state = SavingsMemberState.for_profile(user_profile)
 
-    if latest_txn:
-        total_saved = float(latest_txn.cumulative_total)
-        current_week = latest_txn.next_week
-        carry_forward = float(latest_txn.remaining_balance)
+    if state:
+        total_saved = float(state.cumulative_total)
+        current_week = state.next_week
+        carry_forward = float(state.remaining_balance)
     else:
         total_saved = 0
         current_week = 1
@@ -148,25 +327,13 @@ def wsc_member_dashboard(request):
     weekly_targets = get_weekly_targets()
     current_week_target = weekly_targets[current_week - 1] if current_week <= 52 else 0
 
-    updated_transactions = []
-    for t in transactions:
-        if t.fully_covered_weeks:
-            weeks_text = "Weeks: " + ", ".join(map(str, t.fully_covered_weeks))
-        else:
-            weeks_text = "No weeks fully covered"
-        
-        updated_transactions.append({
-            'date_saved': t.date_saved.strftime('%b %d, %Y'),
-            'amount': float(t.amount),
-            'receipt_number': t.receipt_number,
-            'cumulative_total': float(t.cumulative_total),
-            'weeks_covered': weeks_text,
-            'remaining_balance': float(t.remaining_balance)
-        })
+    # Only the newest page is rendered; older history is fetched from wsc_transaction_history
+    updated_transactions, next_cursor = savings_history_page(user_profile)
 
     # Get investments
     try:
-        investments = Investment.objects.filter(user_profile=user_profile)
+        investments = list(Investment.objects.filter(user_profile=user_profile))
+        interest = interest_for(investments)
         investment_data = []
         total_invested = 0
         total_interest_expected = 0
@@ -174,15 +341,7 @@ def wsc_member_dashboard(request):
 
         for inv in investments:
             invested = float(inv.amount_invested)
-            expected = float(inv.interest_expected)
-            gained = float(inv.interest_gained_so_far)
-
-            # Calculate status based on maturity date
-            today = timezone.now().date()
-            if today >= inv.maturity_date:
-                status = 'matured'
-            else:
-                status = 'active'
+            expected, gained = map(float, interest[inv.pk])
 
             investment_data.append({
                 'date': inv.date_invested.strftime('%b %d, %Y'),
@@ -191,7 +350,7 @@ def wsc_member_dashboard(request):
                 'interest_so_far': gained,
                 'expected_interest': expected,
                 'maturity_date': inv.maturity_date.strftime('%b %d, %Y'),
-                'status': status
+                'status': inv.status
             })
 
             total_invested += invested
@@ -224,6 +383,7 @@ def wsc_member_dashboard(request):
             'current_week_target': current_week_target
         },
         'transactions': updated_transactions,
+        'transactions_next_cursor': next_cursor,
         'investments': investment_data,
         'investment_summary': {
             'total_invested': total_invested,
@@ -240,6 +400,8 @@ def wsc_member_dashboard(request):
             'targetAmount': 13780000,
             'progressPercentage': progress_percentage,
             'transactions': updated_transactions,
+            'transactionsNextCursor': next_cursor,
+            'transactionsUrl': reverse('wsc_transaction_history'),
             'investments': investment_data,
             'investmentSummary': {
                 'totalInvested': total_invested,
@@ -257,12 +419,94 @@ def wsc_member_dashboard(request):
     
     return render(request, 'mcs/52wsc/52wsc-member-dashboard.html', context)
 
+@login_required
+@project_required('52 Weeks Saving Challenge')
+def wsc_transaction_history(request):
+    """Older pages of the member's 52 WSC history for the dashboard's "Load more" button"""
+    try:
+        transactions, next_cursor = savings_history_page(
+            request.user.profile, cursor=request.GET.get('cursor')
+        )
+    except ValueError:
+        return JsonResponse({'error': 'Invalid cursor'}, status=400)
+
+    return JsonResponse({'transactions': transactions, 'next_cursor': next_cursor})
+
 #Fixed Savings Account Views
 @login_required
 @project_required('Fixed Savings')
 def fixed_savings_terms(request):
     return render(request, 'mcs/fsa/fsa-terms.html')
 
+# Defaults and limits for the what-if projection; terms match the FSA products on offer
+PROJECTION_DEFAULTS = {'term': [6, 12, 24], 'rate': [12.75], 'frequency': ['monthly']}
+PROJECTION_MAX_SCENARIOS = 1000
+PROJECTION_MAX_TERM = 120
+PROJECTION_CACHE_SECONDS = 60 * 60 * 24
+
+def parse_projection_inputs(params):
+    """
+    Amounts, terms, rates and frequencies for projection_grid from query parameters.
+
+    Each parameter may be repeated or comma-separated. Raises ValueError with a message
+    for the member on anything missing, malformed or out of range.
+    """
+    from .interest import COMPOUNDING_PERIODS
+
+    def values(name):
+        raw = [part.strip() for value in params.getlist(name) for part in value.split(',') if part.strip()]
+        return raw or [str(value) for value in PROJECTION_DEFAULTS.get(name, [])]
+
+    try:
+        amounts = [Decimal(value.replace('_', '')) for value in values('amount')]
+        terms = sorted({int(value) for value in values('term')})
+        rates = [float(value) for value in values('rate')]
+        # NaN and Infinity parse, but NaN cannot be hashed, ordered or compared to a limit
+        if not all(amount.is_finite() for amount in amounts) or not all(map(math.isfinite, rates)):
+            raise ValueError
+        amounts, rates = sorted(set(amounts)), sorted(set(rates))
+    except (ArithmeticError, ValueError):
+        raise ValueError("amount, term and rate must be numbers")
+    frequencies = sorted(set(values('frequency')))
+
+    if not amounts:
+        raise ValueError("Give at least one amount")
+    if not all(0 < amount < Decimal('1e10') for amount in amounts):
+        raise ValueError("Amounts must be above 0 and below 10,000,000,000 UGX")
+    if not all(1 <= term <= PROJECTION_MAX_TERM for term in terms):
+        raise ValueError(f"Terms must be between 1 and {PROJECTION_MAX_TERM} months")
+    if not all(0 <= rate <= 100 for rate in rates):
+        raise ValueError("Rates must be between 0 and 100 percent")
+    unknown = [frequency for frequency in frequencies if frequency not in COMPOUNDING_PERIODS]
+    if unknown:
+        raise ValueError(f"Unknown compounding frequency {unknown[0]!r}; use {', '.join(COMPOUNDING_PERIODS)}")
+    if len(amounts) * len(terms) * len(rates) * len(frequencies) > PROJECTION_MAX_SCENARIOS:
+        raise ValueError(f"At most {PROJECTION_MAX_SCENARIOS} scenarios per request")
+
+    return [float(amount) for amount in amounts], terms, rates, frequencies
+
+@login_required
+@project_required('Fixed Savings')
+def fixed_savings_projection(request):
+    """
+    What-if maturity schedules for fixing each amount for each term, rate and frequency.
+
+    GET /fsa/projection/?amount=1000000,5000000&term=6,12,24&rate=12.75&frequency=monthly
+    Results depend only on the inputs, so they are cached by a hash of the normalised inputs.
+    """
+    from django.core.cache import cache
+    from .interest import projection_grid
+    import hashlib
+
+    try:
+        inputs = parse_projection_inputs(request.GET)
+    except ValueError as exc:
+        return JsonResponse({'error': str(exc)}, status=400)
+
+    key = 'mcs:fsa-projection:' + hashlib.sha256(json.dumps(inputs).encode()).hexdigest()
+    scenarios = cache.get_or_set(key, lambda: projection_grid(*inputs), PROJECTION_CACHE_SECONDS)
+    return JsonResponse({'count': len(scenarios), 'scenarios': scenarios})
+
 @login_required
 @project_required('Fixed Savings')
 def individual_fixed_savings_account(request):
@@ -419,122 +663,246 @@ def individual_fixed_savings_account(request):
     return render(request, 'mcs/fsa/fsa.html', context)
 
 #Commercial Goat Farming Views
-@login_required
-@project_required('Goat Farming')
-def goat_farm_dashboard(request):
-    from .models import GoatFarmingInvestment, Goat, GoatFarmingTransaction, GoatFarmingPackage, GoatOffspring
-    
-    # Get user's investments
-    user_investments = GoatFarmingInvestment.objects.filter(
-        user_profile__user=request.user,
-        status='active'
-    ).select_related('package')
-    
-    # Calculate total investment amount from both investments and transactions
-    total_investment_from_investments = sum(investment.investment_amount for investment in user_investments)
-    
-    # Get all completed and pending transactions for this user
-    user_transactions = GoatFarmingTransaction.objects.filter(
-        investment__user_profile__user=request.user,
-        status__in=['completed', 'pending']
-    ).select_related('investment')
-    
-    # Calculate total from transactions (payments, management fees, etc.)
-    total_from_transactions = sum(transaction.amount for transaction in user_transactions)
-    
-    # Total investment = initial investment + all transactions (completed and pending)
-    total_investment = total_investment_from_investments + total_from_transactions
-    
-    # Calculate total package amounts (what user should pay)
-    total_package_amounts = sum(
-        investment.package.total_package_amount 
-        for investment in user_investments 
-        if investment.package
+GOAT_PORTFOLIO_CACHE_SECONDS = 60 * 10
+
+def goat_portfolio_summary(user_profile):
+    """
+    Every goat farming figure shown to one member, shared by the dashboard and the
+    transactions page.
+
+    Totals come from one aggregate each over the member's active investments, all their
+    transactions and all their goats; the active investments are loaded once with their
+    transactions prefetched and completed payments annotated. Cached until any of the
+    member's goat farming records change (see models.goat_portfolio_cache_key).
+    """
+    from django.core.cache import cache
+    from django.db.models.functions import Coalesce
+    from .models import GoatFarmingInvestment, Goat, GoatFarmingTransaction, GoatOffspring, goat_portfolio_cache_key
+
+    def build():
+        zero = models.Value(Decimal('0.00'))
+        active = GoatFarmingInvestment.objects.filter(user_profile=user_profile, status='active')
+        # Meta.ordering is not applied to grouped queries, so it is repeated here
+        investments = list(active.select_related('package').annotate(
+            completed_payments=Coalesce(
+                models.Sum('transactions__amount', filter=models.Q(transactions__status='completed')), zero,
+            ),
+        ).order_by('-start_date').prefetch_related(
+            models.Prefetch('transactions', queryset=GoatFarmingTransaction.objects.order_by('created_at')),
+        ))
+        summary = active.aggregate(
+            investment_count=models.Count('pk'),
+            invested=Coalesce(models.Sum('investment_amount'), zero),
+            total_package_amounts=Coalesce(models.Sum('package__total_package_amount'), zero),
+            total_initial_female_goats=Coalesce(models.Sum('package__number_of_female_goats'), 0),
+            total_initial_male_goats=Coalesce(models.Sum('package__number_of_male_goats'), 0),
+            total_expected_offspring=Coalesce(models.Sum('package__expected_offspring_in_one_year'), 0),
+            total_offspring_received=Coalesce(models.Sum('offspring_received'), 0),
+            earliest_completion=models.Min('expected_completion_date'),
+        )
+
+        # Completed and pending transactions count toward what the member has paid
+        recorded = models.Q(status__in=['completed', 'pending'])
+        deposits = recorded & models.Q(transaction_type__in=['payment', 'management_fee'])
+        summary.update(GoatFarmingTransaction.objects.filter(investment__user_profile=user_profile).aggregate(
+            recorded=Coalesce(models.Sum('amount', filter=recorded), zero),
+            total_deposits=Coalesce(models.Sum('amount', filter=deposits), zero),
+            deposit_count=models.Count('pk', filter=deposits),
+            total_returns=Coalesce(models.Sum('amount', filter=recorded & models.Q(transaction_type='returns')), zero),
+            returns_count=models.Count('pk', filter=models.Q(status='completed', transaction_type='returns')),
+            total_pending_payments=Coalesce(models.Sum('amount', filter=models.Q(status='pending')), zero),
+            earliest_pending_due=models.Min('due_date', filter=models.Q(status='pending')),
+        ))
+
+        goats = Goat.objects.filter(investment__user_profile=user_profile)
+        summary.update(goats.aggregate(
+            female_goats=models.Count('pk', filter=models.Q(gender='female')),
+            male_goats=models.Count('pk', filter=models.Q(gender='male')),
+            healthy_goats=models.Count('pk', filter=models.Q(health_status='healthy')),
+            under_observation_goats=models.Count('pk', filter=models.Q(health_status='under_observation')),
+            sick_goats=models.Count('pk', filter=models.Q(health_status='sick')),
+        ))
+
+        # Total investment = initial investments + all transactions (completed and pending)
+        summary['total_investment'] = summary.pop('invested') + summary.pop('recorded')
+        summary['total_pending_amount'] = summary['total_package_amounts'] - summary['total_investment']
+        summary['total_initial_goats'] = summary['total_initial_female_goats'] + summary['total_initial_male_goats']
+        summary['total_goats'] = summary['total_initial_goats'] + summary['total_offspring_received']
+        summary['investments'] = investments
+        summary['pregnant_goats'] = list(goats.filter(is_pregnant=True))
+        summary['offspring'] = list(GoatOffspring.objects.filter(
+            mother__investment__user_profile=user_profile
+        ).select_related('mother', 'father'))
+        return summary
+
+    return cache.get_or_set(goat_portfolio_cache_key(user_profile.pk), build, GOAT_PORTFOLIO_CACHE_SECONDS)
+
+GOAT_LEDGER_PAGE_SIZE = 25
+GOAT_LEDGER_FILTERS = ('type', 'status', 'start_date', 'end_date')
+
+# The filter form's type choices; initial investments count as investments
+GOAT_LEDGER_TYPES = {'investment': 'investment', 'fee': 'management_fee', 'return': 'returns'}
+
+# Ledger sources, in the order rows sharing a timestamp are listed
+GOAT_LEDGER_TRANSACTION = 1
+GOAT_LEDGER_INITIAL_INVESTMENT = 0
+
+def goat_ledger_page(user_profile, params, cursor=None, page_size=GOAT_LEDGER_PAGE_SIZE):
+    """
+    One page of a member's goat farming ledger, newest first, and the cursor for the next page.
+
+    The ledger is a UNION ALL of the member's completed and pending transactions and the
+    initial payment of each active investment, dated midnight of its start date. Filters
+    (type, status and an inclusive start_date/end_date range in local dates) are applied
+    to both halves, and the combined rows are ordered and cut to a page in SQL by
+    (occurred_at, source, id). The cursor is "<iso datetime>_<source>_<id>" of the last
+    row returned. Raises ValueError for a filter value or cursor that cannot be applied.
+    """
+    from django.db.models.functions import Cast, Concat
+    from .models import GoatFarmingInvestment, GoatFarmingTransaction
+
+    transactions = GoatFarmingTransaction.objects.filter(
+        investment__user_profile=user_profile, status__in=['completed', 'pending'],
     )
-    
-    # Calculate pending payments (total package amount - what user has paid)
-    total_pending_amount = total_package_amounts - total_investment
-    
-    # Get pending payment transactions for display
-    pending_payments = GoatFarmingTransaction.objects.filter(
-        investment__user_profile__user=request.user,
-        status='pending'
-    ).select_related('investment')
-    
-    # Calculate initial goats from packages using package data
-    total_initial_female_goats = sum(
-        investment.package.number_of_female_goats 
-        for investment in user_investments 
-        if investment.package
+    investments = GoatFarmingInvestment.objects.filter(
+        user_profile=user_profile, status='active', investment_amount__gt=0,
     )
-    total_initial_male_goats = sum(
-        investment.package.number_of_male_goats 
-        for investment in user_investments 
-        if investment.package
+
+    transaction_type = params.get('type')
+    if transaction_type:
+        if transaction_type not in GOAT_LEDGER_TYPES:
+            raise ValueError(f"unknown transaction type {transaction_type!r}")
+        transactions = transactions.filter(transaction_type=GOAT_LEDGER_TYPES[transaction_type])
+        if transaction_type != 'investment':
+            investments = investments.none()
+
+    status = params.get('status')
+    if status:
+        transactions = transactions.filter(status=status)
+        if status != 'completed':
+            investments = investments.none()
+
+    for name, lookup, offset in (('start_date', 'gte', 0), ('end_date', 'lt', 1)):
+        raw = params.get(name)
+        if raw:
+            day = parse_date(raw)
+            if day is None:
+                raise ValueError(f"invalid date {raw!r}")
+            try:
+                day += timedelta(days=offset)
+                start_of_day = timezone.make_aware(datetime.combine(day, datetime.min.time()))
+            except OverflowError:
+                # The day after 9999-12-31, which would end the range, does not exist
+                raise ValueError(f"invalid date {raw!r}")
+            transactions = transactions.filter(**{f'created_at__{lookup}': start_of_day})
+            investments = investments.filter(**{f'start_date__{lookup}': day})
+
+    transactions = transactions.annotate(
+        occurred_at=models.F('created_at'),
+        source=models.Value(GOAT_LEDGER_TRANSACTION),
+        row_id=models.F('id'),
+        row_type=models.F('transaction_type'),
+        row_status=models.F('status'),
+        row_amount=models.F('amount'),
+        reference=models.F('reference_number'),
+        summary=models.F('description'),
     )
-    total_initial_goats = total_initial_female_goats + total_initial_male_goats
-    
-    # Calculate offspring received
-    total_offspring_received = sum(
-        investment.offspring_received 
-        for investment in user_investments
+    investments = investments.annotate(
+        occurred_at=Cast('start_date', models.DateTimeField()),
+        source=models.Value(GOAT_LEDGER_INITIAL_INVESTMENT),
+        row_id=models.F('id'),
+        row_type=models.Value('initial_investment'),
+        row_status=models.Value('completed'),
+        row_amount=models.F('investment_amount'),
+        reference=models.F('receipt_number'),
+        summary=Concat(models.Value('Initial investment for '), 'package__name', output_field=models.TextField()),
     )
-    
-    # Total goats = initial goats from packages + offspring
-    total_goats = total_initial_goats + total_offspring_received
-    
-    # Get all goats for this user (both initial and offspring)
-    user_goats = Goat.objects.filter(
-        investment__user_profile__user=request.user
-    ).select_related('investment')
-    
-    # Get offspring records
-    user_offspring = GoatOffspring.objects.filter(
-        mother__investment__user_profile__user=request.user
-    ).select_related('mother', 'father')
-    
-    # Calculate goat statistics (from actual goat records)
-    female_goats = user_goats.filter(gender='female').count()
-    male_goats = user_goats.filter(gender='male').count()
-    
-    # Health status counts
-    healthy_goats = user_goats.filter(health_status='healthy').count()
-    under_observation_goats = user_goats.filter(health_status='under_observation').count()
-    sick_goats = user_goats.filter(health_status='sick').count()
-    
-    # Pregnant goats
-    pregnant_goats = user_goats.filter(is_pregnant=True)
-    
-    # Calculate expected returns from packages
-    total_expected_offspring = sum(
-        investment.package.expected_offspring_in_one_year 
-        for investment in user_investments 
-        if investment.package
-    )
-    
-    # Get the earliest expected completion date
-    earliest_completion = None
-    if user_investments:
-        earliest_completion = min(
-            investment.expected_completion_date 
-            for investment in user_investments 
-            if investment.expected_completion_date
-        )
+
+    if cursor:
+        try:
+            moment_part, source_part, id_part = cursor.rsplit('_', 2)
+            moment = parse_datetime(moment_part)
+            last_source, last_id = int(source_part), int(id_part)
+        except ValueError:
+            moment = None
+        if moment is None:
+            raise ValueError(f"invalid cursor {cursor!r}")
+
+        def after_cursor(source):
+            if source == last_source:
+                return models.Q(occurred_at__lt=moment) | models.Q(occurred_at=moment, row_id__lt=last_id)
+            if source > last_source:
+                # Listed before the cursor row at its timestamp, so already shown
+                return models.Q(occurred_at__lt=moment)
+            return models.Q(occurred_at__lte=moment)
+
+        transactions = transactions.filter(after_cursor(GOAT_LEDGER_TRANSACTION))
+        investments = investments.filter(after_cursor(GOAT_LEDGER_INITIAL_INVESTMENT))
+
+    columns = ('occurred_at', 'source', 'row_id', 'row_type', 'row_status', 'row_amount', 'reference', 'summary')
+    # Meta.ordering is cleared on both halves: compound statements only order the result
+    ledger = transactions.order_by().values(*columns).union(investments.order_by().values(*columns), all=True)
+
+    # One extra row tells us whether another page exists without a COUNT
+    rows = list(ledger.order_by('-occurred_at', '-source', '-row_id')[:page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = f"{last['occurred_at'].isoformat()}_{last['source']}_{last['row_id']}"
+    return rows, next_cursor
+
+def goat_ledger_row(row):
+    """Template row for one goat_ledger_page entry, with the type and status badges"""
+    from .models import GoatFarmingTransaction
+
+    if row['source'] == GOAT_LEDGER_INITIAL_INVESTMENT:
+        row_id = f"investment_{row['row_id']}"
+        type_display = 'Initial Investment'
+        type_badge_class = 'bg-primary'
+    else:
+        row_id = row['row_id']
+        type_display = dict(GoatFarmingTransaction.TRANSACTION_TYPES).get(row['row_type'], row['row_type'])
+        type_badge_class = {
+            'investment': 'bg-primary',
+            'payment': 'bg-info',
+            'management_fee': 'bg-info',
+            'veterinary_cost': 'bg-warning',
+            'feed_cost': 'bg-warning',
+            'other_expense': 'bg-secondary',
+            'returns': 'bg-success'
+        }.get(row['row_type'], 'bg-secondary')
+
+    return {
+        'id': row_id,
+        'date': row['occurred_at'].strftime('%Y-%m-%d'),
+        'receipt_no': row['reference'] or '-',
+        'type': type_display,
+        'type_badge_class': type_badge_class,
+        'description': row['summary'],
+        'amount': row['row_amount'],
+        'status': dict(GoatFarmingTransaction.STATUS_CHOICES).get(row['row_status'], row['row_status']),
+        'status_badge_class': {
+            'completed': 'bg-success',
+            'pending': 'bg-warning',
+            'cancelled': 'bg-danger',
+            'failed': 'bg-danger'
+        }.get(row['row_status'], 'bg-secondary'),
+    }
+
+@login_required
+@project_required('Goat Farming')
+def goat_farm_dashboard(request):
+    portfolio = goat_portfolio_summary(request.user.profile)
+    user_investments = portfolio['investments']
     
     # Get all transactions for each investment to display individually
     investment_transactions = []
     for investment in user_investments:
-        # Get all transactions for this investment (both completed and pending)
-        transactions = GoatFarmingTransaction.objects.filter(
-            investment=investment
-        ).select_related('investment', 'investment__package').order_by('created_at')
-        
         # Calculate totals for this investment
         if investment.package and investment.package.total_package_amount:
             package_total = investment.package.total_package_amount
-            total_paid_for_investment = investment.investment_amount + sum(
-                transaction.amount for transaction in transactions.filter(status='completed')
-            )
+            total_paid_for_investment = investment.investment_amount + investment.completed_payments
             investment.pending_balance = package_total - total_paid_for_investment
             investment.payment_progress = (total_paid_for_investment / package_total) * 100
             investment.total_paid = total_paid_for_investment
@@ -556,8 +924,8 @@ def goat_farm_dashboard(request):
                 'is_initial': True
             })
         
-        # Add all other transactions
-        for transaction in transactions:
+        # Add all other transactions, prefetched oldest first
+        for transaction in investment.transactions.all():
             investment_transactions.append({
                 'investment': investment,
                 'transaction_type': transaction.get_transaction_type_display(),
@@ -572,24 +940,23 @@ def goat_farm_dashboard(request):
     context = {
         'user_investments': user_investments,
         'investment_transactions': investment_transactions,
-        'total_investment': total_investment,
-        'total_package_amounts': total_package_amounts,
-        'total_goats': total_goats,
-        'total_initial_goats': total_initial_goats,
-        'total_initial_female_goats': total_initial_female_goats,
-        'total_initial_male_goats': total_initial_male_goats,
-        'total_offspring_received': total_offspring_received,
-        'female_goats': female_goats,
-        'male_goats': male_goats,
-        'healthy_goats': healthy_goats,
-        'under_observation_goats': under_observation_goats,
-        'sick_goats': sick_goats,
-        'pregnant_goats': pregnant_goats,
-        'user_offspring': user_offspring,
-        'total_expected_offspring': total_expected_offspring,
-        'total_pending_amount': total_pending_amount,
-        'earliest_completion': earliest_completion,
-        'pending_payments': pending_payments,
+        'total_investment': portfolio['total_investment'],
+        'total_package_amounts': portfolio['total_package_amounts'],
+        'total_goats': portfolio['total_goats'],
+        'total_initial_goats': portfolio['total_initial_goats'],
+        'total_initial_female_goats': portfolio['total_initial_female_goats'],
+        'total_initial_male_goats': portfolio['total_initial_male_goats'],
+        'total_offspring_received': portfolio['total_offspring_received'],
+        'female_goats': portfolio['female_goats'],
+        'male_goats': portfolio['male_goats'],
+        'healthy_goats': portfolio['healthy_goats'],
+        'under_observation_goats': portfolio['under_observation_goats'],
+        'sick_goats': portfolio['sick_goats'],
+        'pregnant_goats': portfolio['pregnant_goats'],
+        'user_offspring': portfolio['offspring'],
+        'total_expected_offspring': portfolio['total_expected_offspring'],
+        'total_pending_amount': portfolio['total_pending_amount'],
+        'earliest_completion': portfolio['earliest_completion'],
     }
     
     return render(request, 'mcs/goat-farm/dashboard.html', context)
@@ -602,46 +969,13 @@ def goat_farm_investment(request):
 @login_required
 @project_required('Goat Farming')
 def goat_farm_transactions(request):
-    from .models import GoatFarmingInvestment, GoatFarmingTransaction, GoatFarmingPackage
-    
-    # Get user's investments
-    user_investments = GoatFarmingInvestment.objects.filter(
-        user_profile__user=request.user,
-        status='active'
-    ).select_related('package')
-    
-    # Calculate total investment amount (same logic as dashboard)
-    total_investment_from_investments = sum(investment.investment_amount for investment in user_investments)
-    
-    # Get all completed and pending transactions for this user (same as dashboard)
-    user_transactions = GoatFarmingTransaction.objects.filter(
-        investment__user_profile__user=request.user,
-        status__in=['completed', 'pending']
-    ).select_related('investment', 'investment__package').order_by('-created_at')
-    
-    # Calculate total from transactions (same as dashboard)
-    total_from_transactions = sum(transaction.amount for transaction in user_transactions)
-    
-    # Total investment = initial investment + all transactions (completed and pending) - same as dashboard
-    total_investment = total_investment_from_investments + total_from_transactions
-    
-    # Calculate total package amounts (what user should pay) - same as dashboard
-    total_package_amounts = sum(
-        investment.package.total_package_amount 
-        for investment in user_investments 
-        if investment.package
-    )
-    
-    # Calculate pending payments (total package amount - what user has paid) - same as dashboard
-    total_pending_amount = total_package_amounts - total_investment
+    portfolio = goat_portfolio_summary(request.user.profile)
     
     # Calculate allocation of deposits: first to goats (600,000 per goat), then to management fees
     GOAT_COST = 600000  # Cost per goat in UGX
     
-    # Get all payment and management fee transactions (both completed and pending)
-    payment_transactions = user_transactions.filter(transaction_type__in=['payment', 'management_fee'])
-    
-    total_deposits = sum(transaction.amount for transaction in payment_transactions)
+    # Payment and management fee transactions (both completed and pending)
+    total_deposits = portfolio['total_deposits']
     
     # Calculate how many goats can be purchased with total deposits
     goats_purchasable = int(total_deposits // GOAT_COST)
@@ -653,146 +987,44 @@ def goat_farm_transactions(request):
     # Calculate amount remaining for management fees
     amount_for_management_fees = total_deposits - amount_for_goats
     
-    # Calculate totals by transaction type for display
-    total_investments = sum(
-        transaction.amount for transaction in user_transactions 
-        if transaction.transaction_type == 'investment'
-    )
-    
     # Use calculated management fees instead of actual transaction amounts
     total_management_fees = amount_for_management_fees
     
-    total_returns = sum(
-        transaction.amount for transaction in user_transactions 
-        if transaction.transaction_type == 'returns'
-    )
-    
-    total_pending_payments = sum(
-        transaction.amount for transaction in user_transactions 
-        if transaction.status == 'pending'
-    )
-    
-    # Get investment count
-    investment_count = user_investments.count()
-    
-    # Get management fee payment count (based on calculated allocation)
-    management_fee_count = payment_transactions.count()  # Count of payment and management fee transactions
-    
-    # Get returns count (in goats)
-    returns_count = user_transactions.filter(
-        transaction_type='returns',
-        status='completed'
-    ).count()
-    
-    # Get earliest pending payment due date
-    earliest_pending_due = user_transactions.filter(
-        status='pending'
-    ).order_by('due_date').values_list('due_date', flat=True).first()
-    
-    # Apply filters if provided
-    transaction_type_filter = request.GET.get('type')
-    status_filter = request.GET.get('status')
-    start_date_filter = request.GET.get('start_date')
-    end_date_filter = request.GET.get('end_date')
-    
-    filtered_transactions = user_transactions
-    
-    if transaction_type_filter:
-        if transaction_type_filter == 'investment':
-            filtered_transactions = filtered_transactions.filter(transaction_type='investment')
-        elif transaction_type_filter == 'fee':
-            filtered_transactions = filtered_transactions.filter(transaction_type='management_fee')
-        elif transaction_type_filter == 'return':
-            filtered_transactions = filtered_transactions.filter(transaction_type='returns')
-    
-    if status_filter:
-        filtered_transactions = filtered_transactions.filter(status=status_filter)
-    
-    if start_date_filter:
-        filtered_transactions = filtered_transactions.filter(created_at__date__gte=start_date_filter)
-    
-    if end_date_filter:
-        filtered_transactions = filtered_transactions.filter(created_at__date__lte=end_date_filter)
-    
-    # Prepare transaction data for template
-    transactions_data = []
-    for transaction in filtered_transactions:
-        # Determine badge color based on transaction type
-        type_badge_class = {
-            'investment': 'bg-primary',
-            'payment': 'bg-info',
-            'management_fee': 'bg-info',
-            'veterinary_cost': 'bg-warning',
-            'feed_cost': 'bg-warning',
-            'other_expense': 'bg-secondary',
-            'returns': 'bg-success'
-        }.get(transaction.transaction_type, 'bg-secondary')
-        
-        # Determine status badge color
-        status_badge_class = {
-            'completed': 'bg-success',
-            'pending': 'bg-warning',
-            'cancelled': 'bg-danger',
-            'failed': 'bg-danger'
-        }.get(transaction.status, 'bg-secondary')
-        
-        transactions_data.append({
-            'id': transaction.id,
-            'date': transaction.created_at.strftime('%Y-%m-%d'),
-            'receipt_no': transaction.reference_number or '-',
-            'type': transaction.get_transaction_type_display(),
-            'type_badge_class': type_badge_class,
-            'description': transaction.description,
-            'amount': transaction.amount,
-            'status': transaction.get_status_display(),
-            'status_badge_class': status_badge_class,
-            'investment': transaction.investment,
-            'due_date': transaction.due_date,
-            'processed_date': transaction.processed_date,
-            'processed_by': transaction.processed_by
-        })
-    
-    # Add initial investments as transactions
-    for investment in user_investments:
-        if investment.investment_amount > 0:
-            transactions_data.append({
-                'id': f'investment_{investment.id}',
-                'date': investment.start_date.strftime('%Y-%m-%d'),
-                'receipt_no': investment.receipt_number or '-',
-                'type': 'Initial Investment',
-                'type_badge_class': 'bg-primary',
-                'description': f'Initial investment for {investment.package.name}',
-                'amount': investment.investment_amount,
-                'status': 'Completed',
-                'status_badge_class': 'bg-success',
-                'investment': investment,
-                'due_date': None,
-                'processed_date': investment.created_at,
-                'processed_by': None
-            })
+    # One page of the ledger, filtered and ordered in the database
+    ledger_error = None
+    try:
+        page, next_cursor = goat_ledger_page(request.user.profile, request.GET, request.GET.get('cursor'))
+    except ValueError as exc:
+        ledger_error = f"Could not filter transactions: {exc}"
+        page, next_cursor = [], None
+    transactions_data = [goat_ledger_row(row) for row in page]
     
-    # Sort transactions by date (newest first)
-    transactions_data.sort(key=lambda x: x['date'], reverse=True)
+    active_filters = {name: request.GET[name] for name in GOAT_LEDGER_FILTERS if request.GET.get(name)}
+    next_page_query = urlencode({**active_filters, 'cursor': next_cursor}) if next_cursor else None
     
     context = {
-        'total_investments': total_investment,  # Use the same calculation as dashboard
-        'investment_count': investment_count,
+        'total_investments': portfolio['total_investment'],
+        'investment_count': portfolio['investment_count'],
         'total_management_fees': total_management_fees,
-        'management_fee_count': management_fee_count,
-        'total_returns': total_returns,
-        'returns_count': returns_count,
-        'total_pending_payments': total_pending_payments,
-        'earliest_pending_due': earliest_pending_due,
-        'total_pending_amount': total_pending_amount,  # Same as dashboard
-        'total_package_amounts': total_package_amounts,  # Same as dashboard
+        'management_fee_count': portfolio['deposit_count'],  # Payment and management fee transactions
+        'total_returns': portfolio['total_returns'],
+        'returns_count': portfolio['returns_count'],
+        'total_pending_payments': portfolio['total_pending_payments'],
+        'earliest_pending_due': portfolio['earliest_pending_due'],
+        'total_pending_amount': portfolio['total_pending_amount'],
+        'total_package_amounts': portfolio['total_package_amounts'],
         # Returns calculator variables
         'kids_per_goat_per_year': 3,
         'market_price_per_kid': 400000,
         'transactions': transactions_data,
-        'filter_type': transaction_type_filter,
-        'filter_status': status_filter,
-        'filter_start_date': start_date_filter,
-        'filter_end_date': end_date_filter,
+        'ledger_error': ledger_error,
+        'is_first_page': not request.GET.get('cursor'),
+        'next_page_query': next_page_query,
+        'filter_query': urlencode(active_filters),
+        'filter_type': request.GET.get('type'),
+        'filter_status': request.GET.get('status'),
+        'filter_start_date': request.GET.get('start_date'),
+        'filter_end_date': request.GET.get('end_date'),
         # Goat allocation information
         'goats_purchased': goats_purchased,
         'amount_for_goats': amount_for_goats,
@@ -1008,43 +1240,23 @@ def goat_farm_tracking(request):
 @project_required('Clubs Savings')
 @club_membership_required
 def clubs_dashboard(request, club_id=None):
-    from .models import Club, ClubTransaction, ClubMembership, ClubFixedSavings
+    from .models import Club, ClubTransaction, ClubFixedSavings, ClubMonthlyRollup
     # If no club_id is provided, use the first available club or default to 1
     if club_id is None:
         first_club = Club.objects.first()
         club_id = first_club.id if first_club else 1
     
-    # Get the club object
+    # Get the club object, with its totals annotated in the same query
     try:
-        club = Club.objects.get(id=club_id)
+        club = Club.objects.with_summary().get(id=club_id)
     except Club.DoesNotExist:
         club = None
     
     # Calculate club's total savings
     if club:
-        # Get all approved deposit transactions for this club
-        total_deposits = ClubTransaction.objects.filter(
-            club=club,
-            transaction_type='deposit'
-        ).aggregate(total=models.Sum('amount'))['total'] or 0
-        
-        # Get all approved withdrawal transactions for this club
-        total_withdrawals = ClubTransaction.objects.filter(
-            club=club,
-            transaction_type='withdrawal'
-        ).aggregate(total=models.Sum('amount'))['total'] or 0
-        
-        # Calculate total savings (deposits - withdrawals)
-        total_savings = total_deposits - total_withdrawals
-        
-        # Get active members count
-        active_members = ClubMembership.objects.filter(
-            club=club,
-            is_active=True
-        ).count()
-        
-        # Get total members count
-        total_members = ClubMembership.objects.filter(club=club).count()
+        total_savings = club.total_savings
+        active_members = club.active_members
+        total_members = club.total_members
         
         # Get monthly target and collection
         monthly_target = club.monthly_target
@@ -1055,22 +1267,8 @@ def clubs_dashboard(request, club_id=None):
         last_updated = club.last_updated
         
         # Get fixed savings data
-        total_fixed_amount = ClubFixedSavings.objects.filter(
-            club=club,
-            is_active=True
-        ).aggregate(total=models.Sum('amount_fixed'))['total'] or 0
-        
-        # Calculate total expected interest using the property
-        total_expected_interest = 0
-        active_fixed_savings = ClubFixedSavings.objects.filter(
-            club=club,
-            is_active=True
-        )
-        for fixed_saving in active_fixed_savings:
-            total_expected_interest += float(fixed_saving.expected_interest)
-        
-        # Calculate available savings (total savings - fixed savings)
-        available_savings = total_savings - total_fixed_amount
+        total_fixed_amount = club.total_fixed_amount
+        available_savings = club.available_savings
         
         # Calculate percentages
         if total_savings > 0:
@@ -1080,24 +1278,37 @@ def clubs_dashboard(request, club_id=None):
             fixed_percentage = 0
             available_percentage = 0
         
+        # Interest for every active fixed saving, computed together
+        active_fixed_savings = list(ClubFixedSavings.objects.filter(
+            club=club,
+            is_active=True
+        ))
+        interest = interest_for(active_fixed_savings)
+        total_expected_interest = 0
+        
         # Get fixed savings details for display
         fixed_savings_details = []
         for fixed in active_fixed_savings:
+            total_expected_interest += interest[fixed.pk][0]
             fixed_savings_details.append({
                 'receipt_number': fixed.receipt_number or 'N/A',
                 'date_fixed': fixed.date_fixed.strftime('%Y-%m-%d'),
                 'amount': fixed.amount_fixed,
                 'interest_rate': f"{fixed.interest_rate}% p.a.",
                 'maturity_date': fixed.maturity_date.strftime('%Y-%m-%d'),
-                'expected_interest': fixed.expected_interest,
-                'interest_gained_so_far': fixed.interest_gained_so_far,
+                'expected_interest': interest[fixed.pk][0],
+                'interest_gained_so_far': interest[fixed.pk][1],
                 'status': fixed.status.title()
             })
+        total_expected_interest = float(total_expected_interest)
+        
+        # Monthly deposits and withdrawals for the history chart, from the rollup table
+        contribution_history = ClubMonthlyRollup.history(club, months=24)
         
         # Get recent transactions for display
         recent_transactions = ClubTransaction.objects.filter(
             club=club
-        ).order_by('-created_at')[:5]  # Get last 5 transactions
+        ).select_related('user_profile__user').order_by('-created_at')[:5]  # Get last 5 transactions
         
         recent_transactions_data = []
         for txn in recent_transactions:
@@ -1163,6 +1374,7 @@ def clubs_dashboard(request, club_id=None):
         fixed_percentage = 0
         available_percentage = 0
         fixed_savings_details = []
+        contribution_history = []
         recent_transactions_data = []
         club_info = {}
         upcoming_events_data = []
@@ -1184,109 +1396,76 @@ def clubs_dashboard(request, club_id=None):
         'fixed_percentage': fixed_percentage,
         'available_percentage': available_percentage,
         'fixed_savings_details': fixed_savings_details,
+        'contribution_history': contribution_history,
         'recent_transactions_data': recent_transactions_data,
         'club_info': club_info,
         'upcoming_events_data': upcoming_events_data
     }
     return render(request, 'mcs/clubs/dashboard.html', context)
 
+def club_member_rows(club):
+    """Rows for the club members table; deposits, fixed savings and last contribution come annotated"""
+    from .models import ClubMembership
+
+    memberships = ClubMembership.objects.filter(club=club).select_related(
+        'user_profile__user'
+    ).with_contributions()
+
+    members_data = []
+    for membership in memberships:
+        profile = membership.user_profile
+        
+        # Get member name
+        if profile:
+            if profile.full_name and profile.full_name.strip():
+                member_name = profile.full_name
+            elif profile.user and profile.user.get_full_name().strip():
+                member_name = profile.user.get_full_name()
+            elif profile.user and profile.user.username:
+                member_name = profile.user.username
+            else:
+                member_name = 'Unknown Member'
+        else:
+            member_name = 'Unknown Member'
+        
+        last_contribution = membership.last_contribution_at
+        
+        members_data.append({
+            'member_id': profile.account_number if profile and profile.account_number else f"M{membership.id:03d}",
+            'name': member_name,
+            'join_date': membership.joined_on.strftime('%Y-%m-%d'),
+            'status': 'Active' if membership.is_active else 'Inactive',
+            'total_savings': membership.total_deposits,
+            'fixed_savings': membership.fixed_savings_total,
+            'last_contribution': last_contribution.strftime('%Y-%m-%d') if last_contribution else 'Never',
+            'role': membership.role.title()
+        })
+    return members_data
+
 @login_required
 @project_required('Clubs Savings')
 @club_membership_required
 def club_members(request, club_id):
-    from .models import Club, ClubMembership, ClubTransaction, ClubFixedSavings
-    from django.utils import timezone
-    from django.db import models
-    from datetime import datetime, timedelta
+    from .models import Club
     
-    # Get the club object
+    # Get the club object, with its totals annotated in the same query
     try:
-        club = Club.objects.get(id=club_id)
-        print(f"Debug - Club found: {club.name} (ID: {club.id})")
+        club = Club.objects.with_summary().get(id=club_id)
     except Club.DoesNotExist:
         club = None
-        print(f"Debug - Club not found for ID: {club_id}")
     
     if club:
-        # Get total members count
-        total_members = ClubMembership.objects.filter(club=club).count()
-        print(f"Debug - Total members for {club.name}: {total_members}")
+        total_members = club.total_members
+        active_members = club.active_members
         
-        # Get active members count
-        active_members = ClubMembership.objects.filter(club=club, is_active=True).count()
-        print(f"Debug - Active members for {club.name}: {active_members}")
+        # Members who made a deposit this month
+        active_contributors = club.monthly_contributors
         
-        # Get active contributors (members who made transactions this month)
-        current_month = timezone.now().month
-        current_year = timezone.now().year
-        
-        active_contributors = ClubTransaction.objects.filter(
-            club=club,
-            transaction_type='deposit',
-            created_at__year=current_year,
-            created_at__month=current_month
-        ).values('user_profile').distinct().count()
-        print(f"Debug - Active contributors for {club.name}: {active_contributors}")
-        
-        # Get total fixed savings amount (not count, but total amount)
-        total_fixed_amount = ClubFixedSavings.objects.filter(
-            club=club,
-            is_active=True
-        ).aggregate(total=models.Sum('amount_fixed'))['total'] or 0
-        print(f"Debug - Total fixed amount for {club.name}: {total_fixed_amount}")
+        # Total fixed savings amount (not count, but total amount)
+        total_fixed_amount = club.total_fixed_amount
         
         # Get all members with their details
-        members_data = []
-        memberships = ClubMembership.objects.filter(club=club).select_related('user_profile__user')
-        print(f"Debug - Found {memberships.count()} memberships for {club.name}")
-        
-        for membership in memberships:
-            # Get member's total savings
-            total_savings = ClubTransaction.objects.filter(
-                club=club,
-                user_profile=membership.user_profile,
-                transaction_type='deposit'
-            ).aggregate(total=models.Sum('amount'))['total'] or 0
-            
-            # Get member's fixed savings
-            member_fixed_savings = ClubFixedSavings.objects.filter(
-                club=club,
-                created_by=membership.user_profile.user,
-                is_active=True
-            ).aggregate(total=models.Sum('amount_fixed'))['total'] or 0
-            
-            # Get last contribution date
-            last_contribution = ClubTransaction.objects.filter(
-                club=club,
-                user_profile=membership.user_profile,
-                transaction_type='deposit'
-            ).order_by('-created_at').first()
-            
-            last_contribution_date = last_contribution.created_at.strftime('%Y-%m-%d') if last_contribution else 'Never'
-            
-            # Get member name
-            if membership.user_profile:
-                if membership.user_profile.full_name and membership.user_profile.full_name.strip():
-                    member_name = membership.user_profile.full_name
-                elif membership.user_profile.user and membership.user_profile.user.get_full_name().strip():
-                    member_name = membership.user_profile.user.get_full_name()
-                elif membership.user_profile.user and membership.user_profile.user.username:
-                    member_name = membership.user_profile.user.username
-                else:
-                    member_name = 'Unknown Member'
-            else:
-                member_name = 'Unknown Member'
-            
-            members_data.append({
-                'member_id': membership.user_profile.account_number if membership.user_profile and membership.user_profile.account_number else f"M{membership.id:03d}",
-                'name': member_name,
-                'join_date': membership.joined_on.strftime('%Y-%m-%d'),
-                'status': 'Active' if membership.is_active else 'Inactive',
-                'total_savings': total_savings,
-                'fixed_savings': member_fixed_savings,
-                'last_contribution': last_contribution_date,
-                'role': membership.role.title()
-            })
+        members_data = club_member_rows(club)
         
         # Get executive committee members (those with admin role)
         executive_committee = [
@@ -1323,113 +1502,129 @@ def club_members(request, club_id):
     }
     return render(request, 'mcs/clubs/members.html', context)
 
+CLUB_LEDGER_PAGE_SIZE = 25
+CLUB_LEDGER_FILTERS = ('member', 'type', 'date_from', 'date_to')
+
+def club_ledger(club, params):
+    """
+    A club's transactions filtered by the ledger form: member (user profile id), type
+    (deposit or withdrawal) and an inclusive date_from/date_to range in local dates.
+    Raises ValueError for a filter value that cannot be applied.
+    """
+    transactions = ClubTransaction.objects.filter(club=club)
+
+    member = params.get('member')
+    if member:
+        if not member.isdigit():
+            raise ValueError(f"unknown member {member!r}")
+        transactions = transactions.filter(user_profile_id=int(member))
+
+    transaction_type = params.get('type')
+    if transaction_type:
+        if transaction_type not in ('deposit', 'withdrawal'):
+            raise ValueError(f"unknown transaction type {transaction_type!r}")
+        transactions = transactions.filter(transaction_type=transaction_type)
+
+    # Day bounds as timestamps keep the filter a range scan on the ledger index
+    for name, lookup, offset in (('date_from', 'created_at__gte', 0), ('date_to', 'created_at__lt', 1)):
+        raw = params.get(name)
+        if raw:
+            day = parse_date(raw)
+            if day is None:
+                raise ValueError(f"invalid date {raw!r}")
+            try:
+                start_of_day = timezone.make_aware(datetime.combine(day + timedelta(days=offset), datetime.min.time()))
+            except OverflowError:
+                # The day after 9999-12-31, which would end the range, does not exist
+                raise ValueError(f"invalid date {raw!r}")
+            transactions = transactions.filter(**{lookup: start_of_day})
+    return transactions
+
+def member_display_name(profile, missing='N/A'):
+    """Full name, then the user's name, then username of a member's profile"""
+    if not profile:
+        return missing
+    if profile.full_name and profile.full_name.strip():
+        return profile.full_name
+    if profile.user and profile.user.get_full_name().strip():
+        return profile.user.get_full_name()
+    if profile.user and profile.user.username:
+        return profile.user.username
+    return 'Unknown Member'
+
+def club_transaction_row(txn):
+    """Row of the club ledger table"""
+    return {
+        'receipt_number': txn.receipt_number if txn.receipt_number else f"TRX-{txn.id:06d}",
+        'date': txn.created_at.strftime('%Y-%m-%d'),
+        'member': member_display_name(txn.user_profile),
+        'type': txn.transaction_type.title(),
+        'amount': txn.amount,
+        'payment_method': 'Cash',  # Default since we don't have this field
+        'status': 'Completed'  # Default since we don't have status field
+    }
+
 @login_required
 @project_required('Clubs Savings')
 @club_membership_required
 def club_transactions(request, club_id):
-    from .models import Club, ClubTransaction, ClubFixedSavings
+    from .models import Club, ClubFixedSavings
     from django.utils import timezone
     from django.db import models
     from datetime import datetime, timedelta
     
-    # Get the club object
+    # Get the club object, with its totals annotated in the same query
     try:
-        club = Club.objects.get(id=club_id)
+        club = Club.objects.with_summary().get(id=club_id)
     except Club.DoesNotExist:
         club = None
     
     if club:
-        # Get total transactions count (last 30 days)
-        thirty_days_ago = timezone.now() - timedelta(days=30)
-        total_transactions = ClubTransaction.objects.filter(
-            club=club,
-            created_at__gte=thirty_days_ago
-        ).count()
-        
-        # Get monthly contributions and withdrawals
-        current_month = timezone.now().month
-        current_year = timezone.now().year
-        
-        monthly_contributions = ClubTransaction.objects.filter(
-            club=club,
-            transaction_type='deposit',
-            created_at__year=current_year,
-            created_at__month=current_month
-        ).aggregate(total=models.Sum('amount'))['total'] or 0
-        
-        monthly_withdrawals = ClubTransaction.objects.filter(
-            club=club,
-            transaction_type='withdrawal',
-            created_at__year=current_year,
-            created_at__month=current_month
-        ).aggregate(total=models.Sum('amount'))['total'] or 0
+        # Transactions in the last 30 days, and this month's contributions and withdrawals
+        total_transactions = club.recent_transaction_count
+        monthly_contributions = club.monthly_deposits
+        monthly_withdrawals = club.monthly_withdrawals
         
         # Get fixed savings data
-        total_fixed_amount = ClubFixedSavings.objects.filter(
-            club=club,
-            is_active=True
-        ).aggregate(total=models.Sum('amount_fixed'))['total'] or 0
+        total_fixed_amount = club.total_fixed_amount
+        available_savings = club.available_savings
         
-        # Calculate total expected interest using the property
-        total_expected_interest = 0
-        active_fixed_savings = ClubFixedSavings.objects.filter(
+        # Active fixed savings, newest first, with their interest computed together
+        active_fixed_savings = list(ClubFixedSavings.objects.filter(
             club=club,
             is_active=True
-        )
-        for fixed_saving in active_fixed_savings:
-            total_expected_interest += float(fixed_saving.expected_interest)
+        ).select_related('created_by').order_by('-created_at'))
+        interest = interest_for(active_fixed_savings)
+        total_expected_interest = float(sum(expected for expected, _ in interest.values()))
         
-        # Calculate available savings (total deposits - total withdrawals - fixed savings)
-        total_deposits = ClubTransaction.objects.filter(
-            club=club,
-            transaction_type='deposit'
-        ).aggregate(total=models.Sum('amount'))['total'] or 0
-        
-        total_withdrawals = ClubTransaction.objects.filter(
-            club=club,
-            transaction_type='withdrawal'
-        ).aggregate(total=models.Sum('amount'))['total'] or 0
-        
-        available_savings = total_deposits - total_withdrawals - total_fixed_amount
-        
-        # Get recent transactions for the table
-        recent_transactions = ClubTransaction.objects.filter(
-            club=club
-        ).order_by('-created_at')[:10]  # Get last 10 transactions
+        # One page of the ledger, filtered by the form above the table
+        ledger_error = None
+        try:
+            ledger = club_ledger(club, request.GET)
+            page, next_cursor = keyset_page(
+                ledger.select_related('user_profile__user'), 'created_at',
+                request.GET.get('cursor'), CLUB_LEDGER_PAGE_SIZE,
+            )
+        except ValueError as exc:
+            ledger_error = f"Could not filter transactions: {exc}"
+            page, next_cursor = [], None
+        transactions_data = [club_transaction_row(txn) for txn in page]
         
-        transactions_data = []
-        for txn in recent_transactions:
-            # Get member name
-            if txn.user_profile:
-                if txn.user_profile.full_name and txn.user_profile.full_name.strip():
-                    member_name = txn.user_profile.full_name
-                elif txn.user_profile.user and txn.user_profile.user.get_full_name().strip():
-                    member_name = txn.user_profile.user.get_full_name()
-                elif txn.user_profile.user and txn.user_profile.user.username:
-                    member_name = txn.user_profile.user.username
-                else:
-                    member_name = 'Unknown Member'
-            else:
-                member_name = 'N/A'
-            
-            transactions_data.append({
-                'receipt_number': txn.receipt_number if txn.receipt_number else f"TRX-{txn.id:06d}",
-                'date': txn.created_at.strftime('%Y-%m-%d'),
-                'member': member_name,
-                'type': txn.transaction_type.title(),
-                'amount': txn.amount,
-                'payment_method': 'Cash',  # Default since we don't have this field
-                'status': 'Completed'  # Default since we don't have status field
-            })
+        ledger_filters = {name: request.GET.get(name, '') for name in CLUB_LEDGER_FILTERS}
+        active_filters = {name: value for name, value in ledger_filters.items() if value}
+        next_page_query = urlencode({**active_filters, 'cursor': next_cursor}) if next_cursor else None
+        export_query = urlencode(active_filters)
+        member_choices = ClubMembership.objects.filter(
+            club=club, user_profile__isnull=False
+        ).select_related('user_profile__user').order_by('user_profile__full_name')
+        member_choices = [
+            (str(membership.user_profile_id), member_display_name(membership.user_profile))
+            for membership in member_choices
+        ]
         
         # Get fixed savings records for the table
-        fixed_savings_records = ClubFixedSavings.objects.filter(
-            club=club,
-            is_active=True
-        ).order_by('-created_at')
-        
         fixed_savings_data = []
-        for fixed in fixed_savings_records:
+        for fixed in active_fixed_savings:
             # Get member name
             if fixed.created_by:
                 if fixed.created_by.first_name and fixed.created_by.last_name:
@@ -1448,7 +1643,7 @@ def club_transactions(request, club_id):
                 'amount': fixed.amount_fixed,
                 'interest_rate': f"{fixed.interest_rate}% p.a.",
                 'maturity_date': fixed.maturity_date.strftime('%Y-%m-%d'),
-                'expected_interest': fixed.expected_interest,
+                'expected_interest': interest[fixed.pk][0],
                 'status': fixed.status.title()
             })
         
@@ -1461,6 +1656,11 @@ def club_transactions(request, club_id):
         available_savings = 0
         transactions_data = []
         fixed_savings_data = []
+        ledger_filters = {}
+        ledger_error = None
+        next_page_query = None
+        export_query = ''
+        member_choices = []
     
     context = {
         'club_id': club_id,
@@ -1473,10 +1673,45 @@ def club_transactions(request, club_id):
         'total_expected_interest': total_expected_interest,
         'available_savings': available_savings,
         'transactions_data': transactions_data,
-        'fixed_savings_data': fixed_savings_data
+        'fixed_savings_data': fixed_savings_data,
+        'ledger_filters': ledger_filters,
+        'ledger_error': ledger_error,
+        'is_first_page': not request.GET.get('cursor'),
+        'next_page_query': next_page_query,
+        'export_query': export_query,
+        'member_choices': member_choices,
     }
     return render(request, 'mcs/clubs/transactions.html', context)
 
+@login_required
+@project_required('Clubs Savings')
+@club_membership_required
+def club_transactions_export(request, club_id):
+    """The filtered club ledger as a CSV download, streamed so memory stays flat for any club size"""
+    from .exports import stream_csv
+    from .models import Club
+
+    club = get_object_or_404(Club, id=club_id)
+    try:
+        ledger = club_ledger(club, request.GET)
+    except ValueError as exc:
+        return HttpResponseBadRequest(f"Could not filter transactions: {exc}")
+
+    rows = ledger.order_by('-created_at', '-id').values_list(
+        'id', 'receipt_number', 'created_at', 'user_profile__account_number', 'user_profile__full_name',
+        'user_profile__user__username', 'transaction_type', 'amount', 'notes',
+    )
+    csv_rows = (
+        [
+            receipt or f"TRX-{pk:06d}", timezone.localtime(created_at).strftime('%Y-%m-%d %H:%M'),
+            account or '', (full_name or '').strip() or username or '', transaction_type, amount, notes or '',
+        ]
+        for pk, receipt, created_at, account, full_name, username, transaction_type, amount, notes
+        in rows.iterator(chunk_size=2000)
+    )
+    header = ['receipt_number', 'date', 'account_number', 'member', 'type', 'amount', 'notes']
+    return stream_csv(header, csv_rows, f"{slugify(club.name)}-transactions.csv")
+
 # RSS Views
 @login_required
 @project_required('Retirement Savings Scheme')